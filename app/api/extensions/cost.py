@@ -0,0 +1,242 @@
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping, Optional
+
+from graphql import (
+    ExecutionResult,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLError,
+    GraphQLList,
+    GraphQLNonNull,
+    GraphQLObjectType,
+    InlineFragmentNode,
+    OperationDefinitionNode,
+    SelectionSetNode,
+)
+from graphql.utilities import value_from_ast_untyped
+from strawberry.extensions import SchemaExtension
+from strawberry.types import ExecutionContext
+
+# Poids propres des champs coûteux (requêtes SQL dédiées, agrégats, écritures) ;
+# les champs scalaires ne coûtent rien, les champs objet 1 par défaut
+FIELD_WEIGHTS: Dict[str, int] = {
+    "Query.clients": 2,
+    "Query.projects": 2,
+    "Query.quotes": 2,
+    "Query.clientDuplicates": 5,
+    "Query.quoteStats": 20,
+    "Mutation": 10,
+}
+
+# Multiplicateur des listes : argument donnant leur taille maximale
+LIST_SIZE_ARGUMENTS = ("limit",)
+
+# Clients suivis au plus par le budget de coût (les moins récents sont oubliés)
+MAX_TRACKED_CLIENTS = 10000
+
+
+@dataclass
+class _OperationCost:
+    """Contexte d'exécution et coût de l'opération en cours."""
+
+    execution_context: ExecutionContext
+    cost: Optional[int] = None
+
+
+# Opération en cours : l'instance d'extension est partagée entre opérations
+# concurrentes (requêtes, opérations d'un lot) et strawberry réaffecte son
+# ``execution_context`` à chaque opération ; il est capturé au début de
+# l'opération et seule cette copie est lue ensuite
+_operation_cost: ContextVar[Optional[_OperationCost]] = ContextVar("operation_cost", default=None)
+
+
+class CostLimitExceeded(GraphQLError):
+    pass
+
+
+class _TokenBucket:
+    """Budget de coût par client, rechargé en continu."""
+
+    def __init__(self, capacity: float, refill_per_second: float):
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+
+    def try_consume(self, amount: float) -> bool:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.refill_per_second)
+        self.updated_at = now
+        if amount > self.tokens:
+            return False
+        self.tokens -= amount
+        return True
+
+
+class QueryCostExtension(SchemaExtension):
+    """Coût statique d'un document, calculé avant l'exécution.
+
+    coût(champ) = multiplicateur × (poids + somme des coûts des sous-champs),
+    le multiplicateur d'une liste étant son argument ``limit`` (ou
+    ``default_list_size`` sans argument). Un document au-delà de
+    ``max_cost``, ou dépassant le budget par minute du client, est rejeté
+    sans qu'aucun résolveur ne s'exécute. Le coût est renvoyé dans
+    ``extensions.cost``.
+    """
+
+    def __init__(self, *, max_cost: int, default_list_size: int = 20, budget_per_minute: int = 0):
+        self.max_cost = max_cost
+        self.default_list_size = default_list_size
+        self.budget_per_minute = budget_per_minute
+        self._buckets: "OrderedDict[str, _TokenBucket]" = OrderedDict()
+
+    def on_operation(self):
+        # Pas de remise à zéro en sortie : get_results est appelé après l'opération
+        _operation_cost.set(_OperationCost(self.execution_context))
+        yield
+
+    def on_execute(self):
+        state = _operation_cost.get()
+        context = state.execution_context
+        operation = self._operation(context)
+        if operation is not None:
+            root_type = context.schema._schema.get_root_type(operation.operation)
+            fragments = {
+                definition.name.value: definition
+                for definition in context.graphql_document.definitions
+                if isinstance(definition, FragmentDefinitionNode)
+            }
+            cost = self._selection_cost(
+                operation.selection_set, root_type, context.variables or {}, fragments, root=True
+            )
+            state.cost = cost
+
+            error = self._check(cost, context)
+            if error is not None:
+                # Résultat posé avant l'exécution : aucun résolveur n'est appelé
+                context.result = ExecutionResult(data=None, errors=[error])
+        yield
+
+    def get_results(self) -> Dict[str, Any]:
+        state = _operation_cost.get()
+        if state is None or state.cost is None:
+            return {}
+        return {"cost": {"requested": state.cost, "maximum": self.max_cost}}
+
+    def _check(self, cost: int, context: ExecutionContext) -> Optional[GraphQLError]:
+        if cost > self.max_cost:
+            return CostLimitExceeded(
+                f"Query cost {cost} exceeds the maximum of {self.max_cost}",
+                extensions={"code": "QUERY_TOO_COSTLY", "cost": cost, "maximum": self.max_cost},
+            )
+        if self.budget_per_minute:
+            bucket = self._bucket(context)
+            if not bucket.try_consume(cost):
+                return CostLimitExceeded(
+                    "Query cost budget exhausted, retry later",
+                    extensions={"code": "THROTTLED", "cost": cost, "budget_per_minute": self.budget_per_minute},
+                )
+        return None
+
+    def _bucket(self, context: ExecutionContext) -> _TokenBucket:
+        request = (context.context or {}).get("request")
+        client = request.client.host if request is not None and request.client else "anonymous"
+        self._evict_idle_buckets()
+        bucket = self._buckets.get(client)
+        if bucket is None:
+            bucket = self._buckets[client] = _TokenBucket(self.budget_per_minute, self.budget_per_minute / 60)
+            if len(self._buckets) > MAX_TRACKED_CLIENTS:
+                self._buckets.popitem(last=False)
+        self._buckets.move_to_end(client)
+        return bucket
+
+    def _evict_idle_buckets(self):
+        """Oublie les clients inactifs depuis une minute : leur budget est plein, comme un nouveau seau."""
+        idle_before = time.monotonic() - 60
+        while self._buckets and next(iter(self._buckets.values())).updated_at < idle_before:
+            self._buckets.popitem(last=False)
+
+    def _operation(self, context: ExecutionContext) -> Optional[OperationDefinitionNode]:
+        document = context.graphql_document
+        if document is None:
+            return None
+        operations = [
+            definition for definition in document.definitions if isinstance(definition, OperationDefinitionNode)
+        ]
+        name = context.operation_name
+        for operation in operations:
+            if name is None or (operation.name is not None and operation.name.value == name):
+                return operation
+        return None
+
+    def _selection_cost(
+        self,
+        selection_set: Optional[SelectionSetNode],
+        parent_type: Any,
+        variables: Mapping[str, Any],
+        fragments: Mapping[str, FragmentDefinitionNode],
+        root: bool = False,
+    ) -> int:
+        if selection_set is None:
+            return 0
+        schema = _operation_cost.get().execution_context.schema._schema
+        total = 0
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                total += self._field_cost(selection, parent_type, variables, fragments, root)
+            elif isinstance(selection, InlineFragmentNode):
+                fragment_type = (
+                    schema.get_type(selection.type_condition.name.value) if selection.type_condition else parent_type
+                )
+                total += self._selection_cost(selection.selection_set, fragment_type, variables, fragments, root)
+            elif isinstance(selection, FragmentSpreadNode):
+                fragment = fragments.get(selection.name.value)
+                if fragment is not None:
+                    fragment_type = schema.get_type(fragment.type_condition.name.value)
+                    total += self._selection_cost(fragment.selection_set, fragment_type, variables, fragments, root)
+        return total
+
+    def _field_cost(
+        self,
+        field: FieldNode,
+        parent_type: Any,
+        variables: Mapping[str, Any],
+        fragments: Mapping[str, FragmentDefinitionNode],
+        root: bool,
+    ) -> int:
+        name = field.name.value
+        if name.startswith("__") or not isinstance(parent_type, GraphQLObjectType):
+            return 0
+        definition = parent_type.fields.get(name)
+        if definition is None:
+            return 0
+
+        field_type, is_list = definition.type, False
+        while isinstance(field_type, (GraphQLNonNull, GraphQLList)):
+            is_list = is_list or isinstance(field_type, GraphQLList)
+            field_type = field_type.of_type
+
+        if field.selection_set is None and not root:
+            return 0
+        children = self._selection_cost(field.selection_set, field_type, variables, fragments)
+
+        weight = FIELD_WEIGHTS.get(f"{parent_type.name}.{name}", FIELD_WEIGHTS.get(parent_type.name, 1))
+        multiplier = self._list_size(field, definition, variables) if is_list else 1
+        return multiplier * (weight + children)
+
+    def _list_size(self, field: FieldNode, definition: Any, variables: Mapping[str, Any]) -> int:
+        arguments = {argument.name.value: argument.value for argument in field.arguments}
+        for argument_name in LIST_SIZE_ARGUMENTS:
+            if argument_name in arguments:
+                value = value_from_ast_untyped(arguments[argument_name], variables)
+            elif argument_name in definition.args:
+                value = definition.args[argument_name].default_value
+            else:
+                continue
+            if isinstance(value, int) and value > 0:
+                return value
+        return self.default_list_size
@@ -0,0 +1,42 @@
+import time
+from inspect import isawaitable
+from strawberry.extensions import SchemaExtension
+
+from app.core.metrics import layer_duration_seconds, layer_errors_total
+
+
+class MetricsExtension(SchemaExtension):
+    """Mesure la durée et les erreurs des champs racine (Query, Mutation)."""
+
+    def resolve(self, _next, root, info, *args, **kwargs):
+        # Champs imbriqués : aucune mesure, coût minimal
+        if info.path.prev is not None:
+            return _next(root, info, *args, **kwargs)
+
+        operation = f"{info.parent_type.name}.{info.field_name}"
+        started = time.perf_counter()
+        try:
+            result = _next(root, info, *args, **kwargs)
+        except Exception:
+            self._observe(operation, started, failed=True)
+            raise
+
+        if isawaitable(result):
+            return self._await_and_observe(result, operation, started)
+
+        self._observe(operation, started)
+        return result
+
+    async def _await_and_observe(self, result, operation: str, started: float):
+        try:
+            value = await result
+        except Exception:
+            self._observe(operation, started, failed=True)
+            raise
+        self._observe(operation, started)
+        return value
+
+    def _observe(self, operation: str, started: float, failed: bool = False):
+        layer_duration_seconds.labels("graphql", operation).observe(time.perf_counter() - started)
+        if failed:
+            layer_errors_total.inc("graphql", operation)
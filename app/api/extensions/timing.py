@@ -0,0 +1,32 @@
+from strawberry.extensions import SchemaExtension
+
+from app.core.timing import current_timings, timed_phase
+
+
+class ServerTimingExtension(SchemaExtension):
+    """Chronomètre parse, validation et exécution pour l'en-tête ``Server-Timing``.
+
+    Avec ``debug=True``, la décomposition est aussi renvoyée dans
+    ``extensions.timings`` de la réponse GraphQL.
+    """
+
+    def __init__(self, *, debug: bool = False):
+        self.debug = debug
+
+    def on_parse(self):
+        with timed_phase("parse"):
+            yield
+
+    def on_validate(self):
+        with timed_phase("validate"):
+            yield
+
+    def on_execute(self):
+        with timed_phase("execute"):
+            yield
+
+    def get_results(self):
+        timings = current_timings()
+        if not self.debug or timings is None:
+            return {}
+        return {"timings": timings.breakdown()}
@@ -0,0 +1,49 @@
+from inspect import isawaitable
+from strawberry.extensions import SchemaExtension
+
+from infrastructure.tracing import SPAN_KIND_SERVER, tracer
+
+
+class TracingExtension(SchemaExtension):
+    """Span racine par opération GraphQL, avec parse, validation et champs racine en enfants."""
+
+    def on_operation(self):
+        request = (self.execution_context.context or {}).get("request")
+        traceparent = request.headers.get("traceparent") if request is not None else None
+
+        with tracer.span("graphql.request", kind=SPAN_KIND_SERVER, traceparent=traceparent) as span:
+            yield
+            if span is not None:
+                span.name = f"graphql {self.execution_context.operation_name or 'anonymous'}"
+                span.set_attribute("graphql.operation.name", self.execution_context.operation_name or "")
+                operation_type = getattr(self.execution_context, "operation_type", None)
+                if operation_type is not None:
+                    span.set_attribute("graphql.operation.type", operation_type.value)
+                result = self.execution_context.result
+                if result is not None and result.errors:
+                    span.set_attribute("graphql.error_count", len(result.errors))
+
+    def on_parse(self):
+        with tracer.span("graphql.parse"):
+            yield
+
+    def on_validate(self):
+        with tracer.span("graphql.validate"):
+            yield
+
+    def resolve(self, _next, root, info, *args, **kwargs):
+        # Champs imbriqués : pas de span (un par objet serait trop coûteux)
+        if info.path.prev is not None or not tracer.enabled:
+            return _next(root, info, *args, **kwargs)
+        return self._resolve_traced(_next, root, info, *args, **kwargs)
+
+    async def _resolve_traced(self, _next, root, info, *args, **kwargs):
+        # Le span est ouvert dans la coroutine : il reste courant pendant l'await
+        with tracer.span(
+            f"graphql.resolve {info.parent_type.name}.{info.field_name}",
+            {"graphql.field.name": info.field_name, "graphql.field.type": info.parent_type.name},
+        ):
+            result = _next(root, info, *args, **kwargs)
+            if isawaitable(result):
+                result = await result
+            return result
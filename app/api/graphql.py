@@ -1,8 +1,18 @@
 import strawberry
-from typing import List, Optional
-from app.schemas.client import Client, ClientInput, UpdateClientInput
-from app.schemas.project import Project, ProjectInput, UpdateProjectInput
-from app.schemas.quote import Quote, QuoteInput, AddQuoteItemInput, QuoteStatusEnum
+from strawberry.schema.config import StrawberryConfig
+from strawberry.streamable import Streamable
+from typing import AsyncGenerator, List, Optional
+from strawberry.extensions import ParserCache, QueryDepthLimiter, ValidationCache
+from strawberry.types import Info
+from app.core.config import settings
+from app.api.extensions.cost import QueryCostExtension
+from app.api.extensions.metrics import MetricsExtension
+from app.api.extensions.tracing import TracingExtension
+from app.api.extensions.timing import ServerTimingExtension
+from app.api.response_cache import invalidate
+from app.schemas.client import Client, ClientInput, UpdateClientInput, ClientImportInput, ClientDuplicateReport
+from app.schemas.project import Project, ProjectInput, UpdateProjectInput, ProjectUpdate
+from app.schemas.quote import Quote, QuoteInput, AddQuoteItemInput, UpdateQuoteItemInput, QuoteStatusEnum, QuoteFilterInput, QuoteSortInput, QuoteStats, QuoteStatsGroupByEnum, QuoteStatusChange, QuoteStatusChangeResult
 from app.services.client_service import ClientService
 from app.services.project_service import ProjectService
 from app.services.quote_service import QuoteService
@@ -11,6 +21,18 @@ client_service = ClientService()
 project_service = ProjectService()
 quote_service = QuoteService()
 
+
+def _selects(info: Info, field_name: str) -> bool:
+    """Indique si la sélection du champ courant demande le sous-champ ``field_name``."""
+    pending = list(info.selected_fields)
+    while pending:
+        selection = pending.pop()
+        if getattr(selection, "name", None) == field_name:
+            return True
+        pending.extend(getattr(selection, "selections", []))
+    return False
+
+
 @strawberry.type
 class Query:
     @strawberry.field
@@ -18,12 +40,23 @@ class Query:
         return "Hello from GraphQL!"
 
     @strawberry.field
-    async def clients(self, skip: int = 0, limit: int = 100) -> List[Client]:
-        return await client_service.get_all_clients(skip=skip, limit=limit)
+    async def clients(self, info: Info, skip: int = 0, limit: int = 100) -> List[Client]:
+        return await client_service.get_all_clients(
+            skip=skip, limit=limit, include_quote_summary=_selects(info, "quoteSummary")
+        )
 
     @strawberry.field
-    async def client(self, id: str) -> Optional[Client]:
-        return await client_service.get_client_by_id(id)
+    async def client(self, info: Info, id: str) -> Optional[Client]:
+        return await client_service.get_client_by_id(id, include_quote_summary=_selects(info, "quoteSummary"))
+
+    @strawberry.field
+    async def client_duplicates(
+        self,
+        candidates: List[ClientImportInput],
+        threshold: float = 0.4,
+        limit: int = 3,
+    ) -> List[ClientDuplicateReport]:
+        return await client_service.find_duplicate_clients(candidates, threshold=threshold, limit=limit)
 
     @strawberry.field
     async def projects(self, skip: int = 0, limit: int = 100) -> List[Project]:
@@ -34,53 +67,154 @@ class Query:
         return await project_service.get_project_by_id(id)
 
     @strawberry.field
-    async def quotes(self, skip: int = 0, limit: int = 100) -> List[Quote]:
-        return await quote_service.get_all_quotes(skip=skip, limit=limit)
+    async def quotes(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        filter: Optional[QuoteFilterInput] = None,
+        sort: Optional[QuoteSortInput] = None,
+    ) -> Streamable[Quote]:
+        # Liste GraphQL ordinaire, ou livrée ligne à ligne avec @stream
+        async for quote in quote_service.stream_quotes(skip=skip, limit=limit, quote_filter=filter, sort=sort):
+            yield quote
 
     @strawberry.field
     async def quote(self, id: str) -> Optional[Quote]:
         return await quote_service.get_quote_by_id(id)
 
+    @strawberry.field
+    async def quote_stats(
+        self,
+        group_by: List[QuoteStatsGroupByEnum],
+        filter: Optional[QuoteFilterInput] = None,
+    ) -> List[QuoteStats]:
+        return await quote_service.get_quote_stats(group_by, quote_filter=filter)
+
 @strawberry.type
 class Mutation:
+    """Chaque mutation périme les réponses en cache qui lisent l'entité modifiée."""
+
     @strawberry.mutation
     async def create_client(self, client_input: ClientInput) -> Client:
-        return await client_service.create_client(client_input)
+        client = await client_service.create_client(client_input)
+        await invalidate("Client")
+        return client
 
     @strawberry.mutation
     async def update_client(self, id: str, client_input: UpdateClientInput) -> Optional[Client]:
-        return await client_service.update_client(id, client_input)
+        client = await client_service.update_client(id, client_input)
+        await invalidate("Client", id)
+        return client
 
     @strawberry.mutation
     async def delete_client(self, id: str) -> bool:
-        return await client_service.delete_client(id)
+        deleted = await client_service.delete_client(id)
+        await invalidate("Client", id)
+        return deleted
 
     @strawberry.mutation
     async def create_project(self, project_input: ProjectInput) -> Project:
-        return await project_service.create_project(project_input)
+        project = await project_service.create_project(project_input)
+        await invalidate("Project")
+        return project
 
     @strawberry.mutation
     async def update_project(self, id: str, project_input: UpdateProjectInput) -> Optional[Project]:
-        return await project_service.update_project(id, project_input)
+        project = await project_service.update_project(id, project_input)
+        await invalidate("Project", id)
+        return project
 
     @strawberry.mutation
     async def delete_project(self, id: str) -> bool:
-        return await project_service.delete_project(id)
+        deleted = await project_service.delete_project(id)
+        await invalidate("Project", id)
+        return deleted
 
     @strawberry.mutation
     async def create_quote(self, quote_input: QuoteInput) -> Quote:
-        return await quote_service.create_quote(quote_input)
+        quote = await quote_service.create_quote(quote_input)
+        await invalidate("Quote")
+        return quote
 
     @strawberry.mutation
     async def add_quote_item(self, quote_id: str, item_input: AddQuoteItemInput) -> Optional[Quote]:
-        return await quote_service.add_item_to_quote(quote_id, item_input)
+        quote = await quote_service.add_item_to_quote(quote_id, item_input)
+        await invalidate("Quote", quote_id)
+        return quote
+
+    @strawberry.mutation
+    async def edit_quote_items(
+        self,
+        quote_id: str,
+        add: Optional[List[AddQuoteItemInput]] = None,
+        update: Optional[List[UpdateQuoteItemInput]] = None,
+        remove: Optional[List[str]] = None,
+    ) -> Optional[Quote]:
+        quote = await quote_service.edit_quote_items(quote_id, add or [], update or [], remove or [])
+        await invalidate("Quote", quote_id)
+        return quote
 
     @strawberry.mutation
     async def change_quote_status(self, quote_id: str, new_status: QuoteStatusEnum) -> Optional[Quote]:
-        return await quote_service.change_quote_status(quote_id, new_status)
+        quote = await quote_service.change_quote_status(quote_id, new_status)
+        await invalidate("Quote", quote_id)
+        return quote
+
+    @strawberry.mutation
+    async def change_quote_statuses(
+        self, quote_ids: List[str], new_status: QuoteStatusEnum
+    ) -> List[QuoteStatusChangeResult]:
+        results = await quote_service.change_quote_statuses(quote_ids, new_status)
+        await invalidate("Quote", *[result.quote_id for result in results if result.success])
+        return results
 
     @strawberry.mutation
     async def delete_quote(self, id: str) -> bool:
-        return await quote_service.delete_quote(id)
+        deleted = await quote_service.delete_quote(id)
+        await invalidate("Quote", id)
+        return deleted
 
-schema = strawberry.Schema(query=Query, mutation=Mutation)
+@strawberry.type
+class Subscription:
+    """Notifications (WebSocket) alimentées par les événements de domaine après commit."""
+
+    @strawberry.subscription
+    async def quote_status_changed(self, client_id: str) -> AsyncGenerator[QuoteStatusChange, None]:
+        async for change in quote_service.watch_status_changes(client_id):
+            yield change
+
+    @strawberry.subscription
+    async def project_updated(self, id: str) -> AsyncGenerator[ProjectUpdate, None]:
+        async for update in project_service.watch_project(id):
+            yield update
+
+schema = strawberry.Schema(
+    query=Query,
+    mutation=Mutation,
+    subscription=Subscription,
+    # Transport par lot : un corps JSON en tableau, opérations exécutées en parallèle
+    config=StrawberryConfig(
+        batching_config={"max_operations": settings.GRAPHQL_BATCH_MAX_OPERATIONS}
+        if settings.GRAPHQL_BATCH_MAX_OPERATIONS > 0
+        else None,
+        # Livraison incrémentale : @defer / @stream (réponses multipart/mixed)
+        enable_experimental_incremental_execution=settings.GRAPHQL_INCREMENTAL_DELIVERY,
+    ),
+    extensions=[
+        # Documents fréquents : ni ré-analyse ni re-validation
+        ParserCache(maxsize=settings.GRAPHQL_DOCUMENT_CACHE_SIZE),
+        # Avant ValidationCache : la règle de profondeur doit figurer dans la validation mise en cache
+        QueryDepthLimiter(max_depth=settings.GRAPHQL_MAX_DEPTH),
+        ValidationCache(maxsize=settings.GRAPHQL_DOCUMENT_CACHE_SIZE),
+        # Coût statique vérifié avant tout résolveur (limit des listes inclus)
+        QueryCostExtension(
+            max_cost=settings.GRAPHQL_MAX_COST,
+            default_list_size=settings.GRAPHQL_DEFAULT_LIST_SIZE,
+            budget_per_minute=settings.GRAPHQL_COST_BUDGET_PER_MINUTE,
+        ),
+        TracingExtension,
+        # Histogrammes par résolveur : extension absente si les métriques sont désactivées
+        *([MetricsExtension] if settings.METRICS_ENABLED else []),
+        ServerTimingExtension(debug=settings.GRAPHQL_DEBUG_TIMINGS),
+    ],
+)
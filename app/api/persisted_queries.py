@@ -0,0 +1,74 @@
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any, Mapping, Optional
+
+from fastapi import Request
+
+from app.core.json import AppJSONResponse
+
+# Protocole « Automatic Persisted Queries » (Apollo), version 1
+APQ_VERSION = 1
+PERSISTED_QUERY_NOT_FOUND = "PersistedQueryNotFound"
+
+
+class PersistedQueryNotFound(Exception):
+    """Empreinte inconnue : le client doit renvoyer le document complet."""
+
+
+class PersistedQueryStore:
+    """Documents GraphQL indexés par empreinte SHA-256, éviction LRU."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._documents: "OrderedDict[str, str]" = OrderedDict()
+
+    def get(self, sha256_hash: str) -> Optional[str]:
+        query = self._documents.get(sha256_hash)
+        if query is not None:
+            self._documents.move_to_end(sha256_hash)
+        return query
+
+    def put(self, sha256_hash: str, query: str):
+        self._documents[sha256_hash] = query
+        self._documents.move_to_end(sha256_hash)
+        if len(self._documents) > self.maxsize:
+            self._documents.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+
+def persisted_query_hash(data: Mapping[str, Any]) -> Optional[str]:
+    """Empreinte demandée par ``extensions.persistedQuery`` (chaîne JSON en GET), ou None."""
+    extensions = data.get("extensions")
+    if isinstance(extensions, str):
+        try:
+            extensions = json.loads(extensions)
+        except ValueError:
+            return None
+    if not isinstance(extensions, dict):
+        return None
+    persisted_query = extensions.get("persistedQuery")
+    if not isinstance(persisted_query, dict) or persisted_query.get("version") != APQ_VERSION:
+        return None
+    sha256_hash = persisted_query.get("sha256Hash")
+    return sha256_hash if isinstance(sha256_hash, str) else None
+
+
+def document_hash(query: str) -> str:
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+async def persisted_query_not_found_handler(request: Request, exc: PersistedQueryNotFound) -> AppJSONResponse:
+    """Réponse attendue par les clients APQ pour déclencher le renvoi du document."""
+    return AppJSONResponse(
+        {
+            "errors": [
+                {
+                    "message": PERSISTED_QUERY_NOT_FOUND,
+                    "extensions": {"code": "PERSISTED_QUERY_NOT_FOUND"},
+                }
+            ]
+        }
+    )
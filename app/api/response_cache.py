@@ -0,0 +1,220 @@
+import hashlib
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from graphql import FieldNode, GraphQLError, OperationDefinitionNode, OperationType, parse, print_ast
+from graphql.utilities import value_from_ast_untyped
+
+# Champ racine -> (entité lue, argument identifiant) ; un champ absent rend la requête non cachable
+ROOT_FIELD_ENTITIES: Dict[str, Tuple[Optional[str], Optional[str]]] = {
+    "hello": (None, None),
+    "client": ("Client", "id"),
+    "clients": ("Client", None),
+    "clientDuplicates": ("Client", None),
+    "project": ("Project", "id"),
+    "projects": ("Project", None),
+    "quote": ("Quote", "id"),
+    "quotes": ("Quote", None),
+    "quoteStats": ("Quote", None),
+}
+
+# Sous-champs dont la valeur dépend d'une autre entité (projection des devis par client)
+RELATED_FIELD_ENTITIES: Dict[str, str] = {
+    "quoteSummary": "Quote",
+}
+
+# Directives de livraison incrémentale
+INCREMENTAL_DIRECTIVES = ("defer", "stream")
+
+
+@dataclass(frozen=True)
+class CacheableQuery:
+    """Requête analysée : document normalisé et étiquettes (avant variables)."""
+
+    normalized: str
+    root_fields: Tuple[Tuple[str, Optional[str], Any], ...]
+    related_entities: Tuple[str, ...]
+
+    def tags(self, variables: Mapping[str, Any]) -> Tuple[str, ...]:
+        """Étiquettes invalidées par les mutations : ``Entité`` (collection) ou ``Entité:id``."""
+        tags = set(self.related_entities)
+        for entity, id_argument, id_node in self.root_fields:
+            if entity is None:
+                continue
+            if id_argument is None or id_node is None:
+                tags.add(entity)
+            else:
+                tags.add(f"{entity}:{value_from_ast_untyped(id_node, variables)}")
+        return tuple(sorted(tags))
+
+
+@lru_cache(maxsize=1000)
+def analyze_query(query: str, operation_name: Optional[str]) -> Optional[CacheableQuery]:
+    """Analyse un document ; None s'il ne s'agit pas d'une requête cachable."""
+    try:
+        document = parse(query)
+    except GraphQLError:
+        return None
+
+    operations = [definition for definition in document.definitions if isinstance(definition, OperationDefinitionNode)]
+    operation = next(
+        (
+            candidate
+            for candidate in operations
+            if operation_name is None or (candidate.name is not None and candidate.name.value == operation_name)
+        ),
+        None,
+    )
+    # Fragments nommés non suivis : seules les sélections directes sont étiquetées
+    if operation is None or operation.operation != OperationType.QUERY or len(document.definitions) != len(operations):
+        return None
+
+    root_fields = []
+    for selection in operation.selection_set.selections:
+        if not isinstance(selection, FieldNode):
+            return None
+        name = selection.name.value
+        if name.startswith("__"):
+            continue
+        if name not in ROOT_FIELD_ENTITIES:
+            return None
+        entity, id_argument = ROOT_FIELD_ENTITIES[name]
+        id_node = next(
+            (argument.value for argument in selection.arguments if argument.name.value == id_argument), None
+        )
+        root_fields.append((entity, id_argument, id_node))
+
+    related = set()
+    pending = [operation.selection_set]
+    while pending:
+        selection_set = pending.pop()
+        for selection in selection_set.selections:
+            # Réponse incrémentale (multipart) : transmise en flux, jamais mise en cache
+            if any(directive.name.value in INCREMENTAL_DIRECTIVES for directive in selection.directives):
+                return None
+            if isinstance(selection, FieldNode) and selection.name.value in RELATED_FIELD_ENTITIES:
+                related.add(RELATED_FIELD_ENTITIES[selection.name.value])
+            if getattr(selection, "selection_set", None) is not None:
+                pending.append(selection.selection_set)
+
+    return CacheableQuery(print_ast(operation), tuple(root_fields), tuple(sorted(related)))
+
+
+def cache_key(query: CacheableQuery, variables: Mapping[str, Any]) -> str:
+    payload = json.dumps(variables, sort_keys=True, default=str)
+    return hashlib.sha256(f"{query.normalized}\n{payload}".encode("utf-8")).hexdigest()
+
+
+def etag_for(body: bytes) -> str:
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+@dataclass
+class CachedResponse:
+    body: bytes
+    etag: str
+    versions: Tuple[Tuple[str, int], ...]
+    stored_at: float
+
+
+class TagVersionStore(ABC):
+    """Versions des étiquettes, partagées par tous les processus servant l'API."""
+
+    @abstractmethod
+    async def current(self, tags: Tuple[str, ...]) -> Tuple[Tuple[str, int], ...]:
+        """Version courante de chaque étiquette (0 si jamais invalidée)."""
+
+    @abstractmethod
+    async def bump(self, tags: Tuple[str, ...]):
+        """Incrémente la version des étiquettes."""
+
+
+class ResponseCache:
+    """Réponses GraphQL de lecture, validées par version d'étiquette.
+
+    Chaque mutation incrémente la version des étiquettes touchées
+    (``Quote:<id>`` et la collection ``Quote``) dans un stockage partagé ;
+    chaque lecture relit les versions courantes de ses étiquettes et une
+    entrée enregistrée avec d'autres versions n'est pas servie. Un worker
+    ne sert donc jamais une réponse antérieure à une mutation traitée par
+    un autre ; le TTL ne borne que la durée de vie des entrées en mémoire.
+    """
+
+    def __init__(self, maxsize: int, ttl_seconds: float, versions: TagVersionStore):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self.versions = versions
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    async def snapshot(self, tags: Tuple[str, ...]) -> Tuple[Tuple[str, int], ...]:
+        """Versions courantes des étiquettes, relevées avant l'exécution de la requête."""
+        if not tags:
+            return ()
+        return await self.versions.current(tags)
+
+    def get(self, key: str, versions: Tuple[Tuple[str, int], ...]) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._is_fresh(entry, versions):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: str, body: bytes, versions: Tuple[Tuple[str, int], ...]) -> CachedResponse:
+        # Mutation survenue pendant l'exécution : l'entrée ne correspondra à aucune lecture suivante
+        entry = CachedResponse(body, etag_for(body), versions, time.monotonic())
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return entry
+
+    async def invalidate(self, entity: str, *entity_ids: str):
+        """Périme les réponses lisant ces entités (et toutes les listes de ce type)."""
+        await self.versions.bump((entity, *(f"{entity}:{entity_id}" for entity_id in entity_ids)))
+
+    def _is_fresh(self, entry: CachedResponse, versions: Tuple[Tuple[str, int], ...]) -> bool:
+        if time.monotonic() - entry.stored_at > self.ttl_seconds:
+            return False
+        return entry.versions == versions
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _build_response_cache() -> Optional[ResponseCache]:
+    """Cache configuré d'après les settings (None si RESPONSE_CACHE_ENABLED est faux)."""
+    from app.core.config import settings
+
+    if not settings.RESPONSE_CACHE_ENABLED:
+        return None
+
+    from infrastructure.database.cache_versions import DatabaseTagVersions
+    from infrastructure.database.session import engine
+
+    return ResponseCache(
+        settings.RESPONSE_CACHE_SIZE, settings.RESPONSE_CACHE_TTL_SECONDS, DatabaseTagVersions(engine)
+    )
+
+
+response_cache = _build_response_cache()
+
+
+async def invalidate(entity: str, *entity_ids: str):
+    """Invalidation appelée par les mutations après commit (sans effet si le cache est désactivé)."""
+    if response_cache is not None:
+        await response_cache.invalidate(entity, *entity_ids)
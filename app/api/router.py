@@ -0,0 +1,68 @@
+from dataclasses import replace
+from typing import Any, List, Optional, Union
+from fastapi import HTTPException
+from strawberry.fastapi import GraphQLRouter
+from strawberry.http import GraphQLRequestData
+
+from app.api.persisted_queries import (
+    PersistedQueryNotFound,
+    PersistedQueryStore,
+    document_hash,
+    persisted_query_hash,
+)
+from app.core.json import dumps
+from app.core.timing import timed_phase
+
+
+class AppGraphQLRouter(GraphQLRouter):
+    """Routeur GraphQL de l'application : requêtes persistées (APQ), sérialisation rapide et chronométrée."""
+
+    def __init__(self, *args, persisted_queries: Optional[PersistedQueryStore] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.persisted_queries = persisted_queries
+
+    async def parse_http_body(self, request) -> Union[GraphQLRequestData, List[GraphQLRequestData]]:
+        request_data = await super().parse_http_body(request)
+        if self.persisted_queries is None:
+            return request_data
+        if isinstance(request_data, list):
+            return [self._resolve_persisted_query(data) for data in request_data]
+        return self._resolve_persisted_query(request_data)
+
+    def _resolve_persisted_query(self, request_data: GraphQLRequestData) -> GraphQLRequestData:
+        """Enregistre ou retrouve le document désigné par ``extensions.persistedQuery``."""
+        sha256_hash = persisted_query_hash({"extensions": request_data.extensions})
+        if sha256_hash is None:
+            return request_data
+        if request_data.query:
+            # Enregistrement : le document doit correspondre à l'empreinte annoncée
+            if document_hash(request_data.query) != sha256_hash:
+                raise HTTPException(400, "provided sha does not match query")
+            self.persisted_queries.put(sha256_hash, request_data.query)
+            return request_data
+        query = self.persisted_queries.get(sha256_hash)
+        if query is None:
+            raise PersistedQueryNotFound()
+        return replace(request_data, query=query)
+
+    def encode_json(self, data: Any) -> bytes:
+        with timed_phase("serialize"):
+            return dumps(data)
+
+    def encode_multipart_data(self, data: Any, separator: str) -> str:
+        """Partie d'une réponse multipart/mixed (@defer, @stream, souscriptions HTTP).
+
+        Le flux de strawberry est textuel : le JSON encodé en octets est décodé, et
+        Content-Length compte les octets UTF-8 et non les caractères.
+        """
+        encoded_data = self.encode_json(data)
+        return "".join(
+            [
+                "\r\n",
+                "Content-Type: application/json; charset=utf-8\r\n",
+                f"Content-Length: {len(encoded_data)}\r\n",
+                "\r\n",
+                encoded_data.decode("utf-8"),
+                f"\r\n--{separator}",
+            ]
+        )
@@ -0,0 +1,82 @@
+import functools
+import importlib
+import inspect
+import pkgutil
+import time
+from typing import Callable, Type
+
+from app.core.metrics import layer_duration_seconds, layer_errors_total
+from infrastructure.tracing import tracer
+
+# Contextes métier dont les cas d'utilisation sont instrumentés
+BOUNDED_CONTEXTS = ("clients", "projects", "quotes")
+
+
+def _timed(method: Callable, layer: str, operation: str) -> Callable:
+    """Enveloppe une méthode async : durée, erreurs et span de trace."""
+    histogram = layer_duration_seconds.labels(layer, operation)
+    span_name = f"{layer} {operation}"
+
+    @functools.wraps(method)
+    async def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        span, token = tracer.start_span(span_name, {"app.layer": layer})
+        try:
+            return await method(*args, **kwargs)
+        except Exception as error:
+            layer_errors_total.inc(layer, operation)
+            if span is not None:
+                span.record_exception(error)
+            raise
+        finally:
+            tracer.end_span(span, token)
+            histogram.observe(time.perf_counter() - started)
+
+    wrapper.__instrumented__ = True
+    return wrapper
+
+
+def instrument_class(cls: Type, layer: str):
+    """Instrumente les méthodes async publiques définies par la classe."""
+    for name, attribute in list(vars(cls).items()):
+        if name.startswith("_") or not inspect.iscoroutinefunction(attribute):
+            continue
+        if getattr(attribute, "__instrumented__", False):
+            continue
+        setattr(cls, name, _timed(attribute, layer, f"{cls.__name__}.{name}"))
+
+
+def _use_case_classes():
+    """Cas d'utilisation déclarés dans domain/<contexte>/use_cases."""
+    for context in BOUNDED_CONTEXTS:
+        package = importlib.import_module(f"domain.{context}.use_cases")
+        for module_info in pkgutil.iter_modules(package.__path__):
+            module = importlib.import_module(f"{package.__name__}.{module_info.name}")
+            for _, cls in inspect.getmembers(module, inspect.isclass):
+                if cls.__module__ == module.__name__ and cls.__name__.endswith("UseCase"):
+                    yield cls
+
+
+def instrument_application():
+    """Instrumente les services, les cas d'utilisation, les repositories SQLAlchemy et la base de données."""
+    from app.core.metrics import registry
+    from app.core.startup import startup_timer
+    from app.services.client_service import ClientService
+    from app.services.project_service import ProjectService
+    from app.services.quote_service import QuoteService
+    from infrastructure.database.metrics import register_database_metrics
+    from infrastructure.persistence.sqlalchemy_client_repository import SQLAlchemyClientRepository
+    from infrastructure.persistence.sqlalchemy_project_repository import SQLAlchemyProjectRepository
+    from infrastructure.persistence.sqlalchemy_quote_repository import SQLAlchemyQuoteRepository
+
+    for service in (ClientService, ProjectService, QuoteService):
+        instrument_class(service, "service")
+
+    for use_case in _use_case_classes():
+        instrument_class(use_case, "use_case")
+
+    for repository in (SQLAlchemyClientRepository, SQLAlchemyProjectRepository, SQLAlchemyQuoteRepository):
+        instrument_class(repository, "repository")
+
+    register_database_metrics(registry)
+    registry.register_collector(startup_timer.metric_lines)
@@ -0,0 +1,51 @@
+"""Encodeur JSON des réponses (GraphQL et routes FastAPI).
+
+orjson est utilisé s'il est installé : UUID, date et datetime sont
+sérialisés nativement, Decimal via ``_default`` (chaîne, sans perte de
+précision). Sinon, repli sur le module ``json`` de la bibliothèque standard.
+"""
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - dépendance optionnelle
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    """Types non gérés nativement (Decimal pour orjson, tous les autres pour json)."""
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def stdlib_dumps(data: Any) -> bytes:
+    """Encodage par le module json (repli, et référence des benchmarks)."""
+    return json.dumps(data, default=_default, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode(
+        "utf-8"
+    )
+
+
+def orjson_dumps(data: Any) -> bytes:
+    return orjson.dumps(data, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+ENCODER = "orjson" if orjson is not None else "json"
+dumps = orjson_dumps if orjson is not None else stdlib_dumps
+
+
+class AppJSONResponse(JSONResponse):
+    """Réponse JSON par défaut des routes FastAPI, encodée par ``dumps``."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
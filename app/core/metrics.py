@@ -0,0 +1,180 @@
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+
+# Bornes par défaut des histogrammes de latence (en secondes)
+DEFAULT_LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """Histogramme à bornes fixes (compteurs cumulables, coût d'observation O(log n))."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        self.buckets: List[float] = sorted(buckets)
+        # Dernière case = au-delà de la plus grande borne (+Inf)
+        self.counts: List[int] = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        """Enregistre une observation."""
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative_counts(self) -> List[int]:
+        """Compteurs cumulés par borne (format Prometheus), +Inf inclus."""
+        cumulative, total = [], 0
+        for count in self.counts:
+            total += count
+            cumulative.append(total)
+        return cumulative
+
+    def snapshot(self) -> Dict:
+        """Représentation sérialisable de l'histogramme."""
+        labels = [str(bound) for bound in self.buckets] + ["+Inf"]
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "buckets": dict(zip(labels, self.cumulative_counts())),
+        }
+
+
+def _escape(value: str) -> str:
+    """Échappe une valeur de label (format texte Prometheus)."""
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def format_labels(labels: Dict[str, str]) -> str:
+    """Formate un jeu de labels : {a="1",b="2"}."""
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+def histogram_lines(name: str, histogram: Histogram, labels: Dict[str, str]) -> List[str]:
+    """Lignes Prometheus (_bucket, _sum, _count) d'un histogramme."""
+    lines = []
+    bounds = [str(bound) for bound in histogram.buckets] + ["+Inf"]
+    for bound, count in zip(bounds, histogram.cumulative_counts()):
+        lines.append(f"{name}_bucket{format_labels({**labels, 'le': bound})} {count}")
+    lines.append(f"{name}_sum{format_labels(labels)} {histogram.sum}")
+    lines.append(f"{name}_count{format_labels(labels)} {histogram.count}")
+    return lines
+
+
+class _MetricFamily:
+    """Famille de métriques partageant un nom et des noms de labels."""
+
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+
+    def _labels(self, values: Tuple[str, ...]) -> Dict[str, str]:
+        return dict(zip(self.labelnames, values))
+
+
+class Counter(_MetricFamily):
+    """Compteur monotone, une série par combinaison de labels."""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self.values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *labelvalues: str, amount: float = 1.0):
+        self.values[labelvalues] = self.values.get(labelvalues, 0.0) + amount
+
+    def render(self) -> List[str]:
+        lines = self.header()
+        for labelvalues, value in self.values.items():
+            lines.append(f"{self.name}{format_labels(self._labels(labelvalues))} {value}")
+        return lines
+
+
+class HistogramFamily(_MetricFamily):
+    """Histogrammes à bornes fixes, un par combinaison de labels."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = buckets
+        self.histograms: Dict[Tuple[str, ...], Histogram] = {}
+
+    def labels(self, *labelvalues: str) -> Histogram:
+        """Histogramme de la série (créé au premier usage)."""
+        histogram = self.histograms.get(labelvalues)
+        if histogram is None:
+            histogram = self.histograms[labelvalues] = Histogram(self.buckets)
+        return histogram
+
+    def render(self) -> List[str]:
+        lines = self.header()
+        for labelvalues, histogram in self.histograms.items():
+            lines.extend(histogram_lines(self.name, histogram, self._labels(labelvalues)))
+        return lines
+
+
+class MetricsRegistry:
+    """Registre des métriques exportées au format texte Prometheus."""
+
+    def __init__(self):
+        self.families: List[_MetricFamily] = []
+        self.collectors: List[Callable[[], Iterable[str]]] = []
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        family = Counter(name, documentation, labelnames)
+        self.families.append(family)
+        return family
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> HistogramFamily:
+        family = HistogramFamily(name, documentation, labelnames, buckets)
+        self.families.append(family)
+        return family
+
+    def register_collector(self, collector: Callable[[], Iterable[str]]):
+        """Ajoute une source de lignes calculées à l'export (ex. état des pools)."""
+        self.collectors.append(collector)
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for family in self.families:
+            lines.extend(family.render())
+        for collector in self.collectors:
+            lines.extend(collector())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+# Latence et erreurs par couche (graphql, use_case, repository)
+layer_duration_seconds = registry.histogram(
+    "app_layer_duration_seconds",
+    "Duration of GraphQL resolvers, use cases and repository methods.",
+    ("layer", "operation"),
+)
+layer_errors_total = registry.counter(
+    "app_layer_errors_total",
+    "Exceptions raised by GraphQL resolvers, use cases and repository methods.",
+    ("layer", "operation"),
+)
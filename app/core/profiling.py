@@ -0,0 +1,146 @@
+import os
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+# Identifiant de profil : horodatage + suffixe aléatoire (sert aussi de nom de fichier)
+PROFILE_ID_PATTERN = re.compile(r"^\d{8}T\d{6}-[0-9a-f]{8}$")
+
+
+def _collapse(frame) -> str:
+    """Pile d'appels au format « collapsed » (racine en premier, séparée par ';')."""
+    names: List[str] = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+class StackSampler:
+    """Échantillonne la pile d'un thread à intervalle fixe depuis un thread dédié.
+
+    Appliqué au thread de la boucle asyncio, il capture les coroutines en
+    cours d'exécution (résolveurs, use cases, pilote SQL) ; les temps
+    d'attente d'E/S apparaissent sous le sélecteur de la boucle.
+    """
+
+    def __init__(self, thread_id: int, interval_seconds: float):
+        self.thread_id = thread_id
+        self.interval_seconds = interval_seconds
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self) -> Counter:
+        self._stop.set()
+        self._thread.join()
+        return self.stacks
+
+    def _run(self):
+        while not self._stop.wait(self.interval_seconds):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.stacks[_collapse(frame)] += 1
+                self.samples += 1
+
+
+class ProfileStore:
+    """Profils au format collapsed (flamegraph.pl, speedscope), conservés sur disque."""
+
+    def __init__(self, directory: str, max_profiles: int):
+        self.directory = directory
+        self.max_profiles = max_profiles
+
+    @staticmethod
+    def new_id() -> str:
+        return f"{datetime.now(timezone.utc):%Y%m%dT%H%M%S}-{uuid.uuid4().hex[:8]}"
+
+    def save(self, profile_id: str, stacks: Counter, metadata: Dict[str, str]):
+        """Enregistre un profil sous l'identifiant donné."""
+        os.makedirs(self.directory, exist_ok=True)
+        header = "".join(f"# {key}: {value}\n" for key, value in metadata.items())
+        body = "".join(f"{stack} {count}\n" for stack, count in stacks.most_common())
+        with open(self._path(profile_id), "w", encoding="utf-8") as output:
+            output.write(header + body)
+        self._prune()
+
+    def list(self) -> List[Dict]:
+        """Profils disponibles, du plus récent au plus ancien."""
+        if not os.path.isdir(self.directory):
+            return []
+        profiles = []
+        for name in os.listdir(self.directory):
+            profile_id = name.removesuffix(".collapsed")
+            if PROFILE_ID_PATTERN.match(profile_id):
+                stat = os.stat(self._path(profile_id))
+                profiles.append({"id": profile_id, "size_bytes": stat.st_size, "modified_at": stat.st_mtime})
+        return sorted(profiles, key=lambda profile: profile["modified_at"], reverse=True)
+
+    def read(self, profile_id: str) -> Optional[str]:
+        if not PROFILE_ID_PATTERN.match(profile_id) or not os.path.exists(self._path(profile_id)):
+            return None
+        with open(self._path(profile_id), encoding="utf-8") as profile:
+            return profile.read()
+
+    def _path(self, profile_id: str) -> str:
+        return os.path.join(self.directory, f"{profile_id}.collapsed")
+
+    def _prune(self):
+        for profile in self.list()[self.max_profiles:]:
+            os.remove(self._path(profile["id"]))
+
+
+class RequestProfiler:
+    """Profile une requête à la fois (les autres passent sans surcoût)."""
+
+    def __init__(self, store: ProfileStore, interval_seconds: float):
+        self.store = store
+        self.interval_seconds = interval_seconds
+        self._lock = threading.Lock()
+
+    def start(self) -> Optional[StackSampler]:
+        """Démarre l'échantillonnage du thread courant, ou None si un profil est déjà en cours."""
+        if not self._lock.acquire(blocking=False):
+            return None
+        sampler = StackSampler(threading.get_ident(), self.interval_seconds)
+        sampler.start()
+        return sampler
+
+    def finish(self, profile_id: str, sampler: StackSampler, started: float, metadata: Dict[str, str]):
+        """Arrête l'échantillonnage et enregistre le profil."""
+        try:
+            stacks = sampler.stop()
+        finally:
+            self._lock.release()
+        metadata = {
+            **metadata,
+            "duration_ms": f"{(time.perf_counter() - started) * 1000:.1f}",
+            "samples": str(sampler.samples),
+            "interval_ms": f"{self.interval_seconds * 1000:g}",
+        }
+        self.store.save(profile_id, stacks, metadata)
+
+
+def _build_profiler() -> Optional[RequestProfiler]:
+    """Profileur configuré d'après les settings (None si PROFILING_ENABLED est faux)."""
+    from app.core.config import settings
+
+    if not settings.PROFILING_ENABLED:
+        return None
+    return RequestProfiler(
+        ProfileStore(settings.PROFILING_OUTPUT_DIR, settings.PROFILING_MAX_PROFILES),
+        interval_seconds=settings.PROFILING_INTERVAL_MS / 1000,
+    )
+
+
+request_profiler = _build_profiler()
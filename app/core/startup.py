@@ -0,0 +1,94 @@
+"""Chronométrage du démarrage à froid : interpréteur, imports, préparation de la base.
+
+Avec ``WEB_PRELOAD``, les imports sont mesurés une fois dans le processus
+maître ; dans les workers, la durée totale est comptée à partir du fork.
+"""
+import logging
+import os
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from app.core.metrics import format_labels
+
+logger = logging.getLogger(__name__)
+
+
+def _process_age_seconds() -> Optional[float]:
+    """Temps écoulé depuis le lancement du processus (Linux, via /proc), sinon None."""
+    try:
+        with open("/proc/self/stat", encoding="ascii") as stat, open("/proc/uptime", encoding="ascii") as uptime:
+            # Champ 22 : date de lancement en ticks depuis le boot (après le nom entre parenthèses)
+            started_ticks = int(stat.read().rsplit(")", 1)[1].split()[19])
+            return float(uptime.read().split()[0]) - started_ticks / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class StartupTimer:
+    """Durées des phases de démarrage du processus (millisecondes)."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases: Dict[str, float] = {}
+        self.ready_ms: Optional[float] = None
+        age = _process_age_seconds()
+        if age is not None:
+            self.phases["interpreter"] = max(age, 0.0) * 1000
+
+    def record(self, phase: str, milliseconds: float):
+        self.phases[phase] = self.phases.get(phase, 0.0) + milliseconds
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.started) * 1000
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Chronomètre une phase du démarrage."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, (time.perf_counter() - started) * 1000)
+
+    def after_fork(self):
+        """Worker forké : les phases du maître restent affichées, la durée totale repart du fork."""
+        self.started = time.perf_counter()
+        self.phases.pop("interpreter", None)
+        self.ready_ms = None
+
+    def ready(self):
+        """Le processus accepte des requêtes : fige la durée totale du démarrage."""
+        self.ready_ms = self.phases.get("interpreter", 0.0) + self.elapsed_ms()
+        logger.info(
+            "Started in %.1f ms (%s)",
+            self.ready_ms,
+            ", ".join(f"{phase} {milliseconds:.1f} ms" for phase, milliseconds in self.phases.items()),
+        )
+
+    def snapshot(self) -> Dict:
+        return {
+            "pid": os.getpid(),
+            **{f"{phase}_ms": round(milliseconds, 3) for phase, milliseconds in self.phases.items()},
+            "ready_ms": round(self.ready_ms, 3) if self.ready_ms is not None else None,
+        }
+
+    def metric_lines(self) -> Iterable[str]:
+        """Durées des phases au format Prometheus (jauges, en secondes)."""
+        lines: List[str] = [
+            "# HELP app_startup_phase_seconds Duration of each process startup phase.",
+            "# TYPE app_startup_phase_seconds gauge",
+        ]
+        for phase, milliseconds in self.phases.items():
+            lines.append(f"app_startup_phase_seconds{format_labels({'phase': phase})} {milliseconds / 1000}")
+        if self.ready_ms is not None:
+            lines += [
+                "# HELP app_startup_seconds Time from process launch until the application accepted requests.",
+                "# TYPE app_startup_seconds gauge",
+                f"app_startup_seconds {self.ready_ms / 1000}",
+            ]
+        return lines
+
+
+# Créé au premier import (en tête de main.py) : le chronomètre démarre avec les imports
+startup_timer = StartupTimer()
@@ -0,0 +1,72 @@
+import time
+from contextvars import ContextVar
+from typing import Dict, List, Optional
+
+# Décomposition de la requête HTTP en cours (None hors requête chronométrée)
+_request_timings: ContextVar[Optional["RequestTimings"]] = ContextVar("request_timings", default=None)
+
+
+class RequestTimings:
+    """Durées cumulées par phase d'une requête (millisecondes)."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases: Dict[str, float] = {}
+        self.db_statements = 0
+        self.db_ms = 0.0
+
+    def add(self, phase: str, milliseconds: float):
+        self.phases[phase] = self.phases.get(phase, 0.0) + milliseconds
+
+    def add_statement(self, seconds: float):
+        self.db_statements += 1
+        self.db_ms += seconds * 1000
+
+    def total_ms(self) -> float:
+        return (time.perf_counter() - self.started) * 1000
+
+    def breakdown(self) -> Dict:
+        """Décomposition sérialisable (extensions GraphQL)."""
+        return {
+            **{f"{phase}_ms": round(milliseconds, 3) for phase, milliseconds in self.phases.items()},
+            "db_ms": round(self.db_ms, 3),
+            "db_statements": self.db_statements,
+            "total_ms": round(self.total_ms(), 3),
+        }
+
+    def server_timing(self) -> str:
+        """Valeur de l'en-tête ``Server-Timing``."""
+        metrics: List[str] = [f"{phase};dur={milliseconds:.2f}" for phase, milliseconds in self.phases.items()]
+        metrics.append(f'db;dur={self.db_ms:.2f};desc="{self.db_statements} statements"')
+        metrics.append(f"total;dur={self.total_ms():.2f}")
+        return ", ".join(metrics)
+
+
+def start_request_timings() -> RequestTimings:
+    """Démarre la décomposition pour la requête (tâche) courante."""
+    timings = RequestTimings()
+    _request_timings.set(timings)
+    return timings
+
+
+def current_timings() -> Optional[RequestTimings]:
+    return _request_timings.get()
+
+
+class timed_phase:
+    """Ajoute la durée du bloc à une phase de la requête courante (sans effet hors requête)."""
+
+    __slots__ = ("phase", "timings", "started")
+
+    def __init__(self, phase: str):
+        self.phase = phase
+
+    def __enter__(self):
+        self.timings = _request_timings.get()
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        if self.timings is not None:
+            self.timings.add(self.phase, (time.perf_counter() - self.started) * 1000)
+        return False
@@ -0,0 +1,79 @@
+import asyncio
+import hmac
+import random
+import time
+from typing import Optional
+from urllib.parse import parse_qs
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.profiling import RequestProfiler
+
+PROFILE_TOKEN_HEADER = b"x-profile-token"
+PROFILE_TOKEN_PARAM = "profile_token"
+
+
+def token_matches(candidate: Optional[str], token: Optional[str]) -> bool:
+    """Comparaison à temps constant ; aucun jeton configuré n'autorise rien."""
+    return bool(token) and candidate is not None and hmac.compare_digest(candidate, token)
+
+
+class ProfilingMiddleware:
+    """Profile les requêtes demandées (jeton en en-tête ou paramètre) ou tirées au sort.
+
+    L'identifiant du profil est renvoyé dans l'en-tête ``X-Profile-Id`` ;
+    le profil se télécharge ensuite via /diagnostics/profiles.
+    """
+
+    # Routes d'administration jamais profilées (téléchargement des profils, métriques)
+    EXCLUDED_PREFIXES = ("/diagnostics", "/metrics")
+
+    def __init__(self, app: ASGIApp, profiler: RequestProfiler, token: Optional[str] = None, sample_rate: float = 0.0):
+        self.app = app
+        self.profiler = profiler
+        self.token = token
+        self.sample_rate = sample_rate
+
+    def _requested(self, scope: Scope) -> bool:
+        for name, value in scope["headers"]:
+            if name == PROFILE_TOKEN_HEADER:
+                return token_matches(value.decode("latin-1"), self.token)
+        query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+        if PROFILE_TOKEN_PARAM in query:
+            return token_matches(query[PROFILE_TOKEN_PARAM][0], self.token)
+        return False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["path"].startswith(self.EXCLUDED_PREFIXES) or not (
+            self._requested(scope) or (self.sample_rate > 0 and random.random() < self.sample_rate)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        sampler = self.profiler.start()
+        if sampler is None:
+            # Un profil est déjà en cours : requête servie normalement
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = self.profiler.store.new_id()
+        started = time.perf_counter()
+
+        async def send_with_profile_id(message: Message):
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers.append("X-Profile-Id", profile_id)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            # Écriture sur disque hors de la boucle asyncio
+            await asyncio.to_thread(
+                self.profiler.finish,
+                profile_id,
+                sampler,
+                started,
+                {"method": scope["method"], "path": scope["path"]},
+            )
@@ -0,0 +1,243 @@
+import json
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.api.persisted_queries import PersistedQueryStore, persisted_query_hash
+from app.api.response_cache import ResponseCache, analyze_query, cache_key
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+def _replay(body: bytes, receive: Receive) -> Receive:
+    """Rejoue le corps déjà lu (ou réécrit) comme un unique message ``http.request``."""
+    replayed = False
+
+    async def replay_receive() -> Message:
+        nonlocal replayed
+        if not replayed:
+            replayed = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        return await receive()
+
+    return replay_receive
+
+
+class ResponseCacheMiddleware:
+    """Sert les requêtes GraphQL de lecture depuis le cache, avec ``ETag`` et 304.
+
+    Seules les opérations ``query`` (GET ou POST JSON) sont concernées ; les
+    réponses en erreur ne sont pas conservées. Les documents APQ envoyés par
+    empreinte sont retrouvés dans le ``PersistedQueryStore``.
+
+    Dans un lot (tableau JSON d'au plus ``max_batch_operations`` opérations),
+    chaque opération est servie ou mise en cache séparément : seules les
+    opérations absentes du cache sont transmises au schéma, en un lot réduit.
+    Les réponses de lot ne portent pas d'``ETag``.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        cache: ResponseCache,
+        persisted_queries: Optional[PersistedQueryStore] = None,
+        path: str = "/graphql",
+        max_batch_operations: int = 0,
+    ):
+        self.app = app
+        self.cache = cache
+        self.persisted_queries = persisted_queries
+        self.max_batch_operations = max_batch_operations
+        self.path = path.rstrip("/")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if (
+            scope["type"] != "http"
+            or scope["path"].rstrip("/") != self.path
+            or scope["method"] not in ("GET", "POST")
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        body = b""
+        if scope["method"] == "POST":
+            more_body = True
+            while more_body:
+                message = await receive()
+                body += message.get("body", b"")
+                more_body = message.get("more_body", False)
+
+        data = self._request_data(scope, body)
+        if isinstance(data, list) and 0 < len(data) <= self.max_batch_operations:
+            await self._serve_batch(scope, receive, send, data)
+            return
+
+        lookup = self._lookup(data) if isinstance(data, dict) else None
+        if lookup is None:
+            await self.app(scope, _replay(body, receive), send)
+            return
+
+        key, tags = lookup
+        versions = await self.cache.snapshot(tags)
+        if_none_match = Headers(scope=scope).get("if-none-match")
+        entry = self.cache.get(key, versions)
+        if entry is not None:
+            await self._send_cached(send, entry.body, entry.etag, _etag_matches(if_none_match, entry.etag), "HIT")
+            return
+
+        start, response_body = await self._execute(scope, receive, body)
+        if start is None or start["status"] != 200 or b'"errors"' in response_body:
+            # Réponse transmise telle quelle, sans mise en cache
+            if start is not None:
+                await send(start)
+            await send({"type": "http.response.body", "body": response_body})
+            return
+
+        entry = self.cache.put(key, response_body, versions)
+        headers = MutableHeaders(scope=start)
+        headers["ETag"] = entry.etag
+        headers["Cache-Control"] = "private, no-cache"
+        headers["X-Cache"] = "MISS"
+        if _etag_matches(if_none_match, entry.etag):
+            await self._send_not_modified(send, start)
+            return
+        await send(start)
+        await send({"type": "http.response.body", "body": response_body})
+
+    async def _serve_batch(self, scope: Scope, receive: Receive, send: Send, operations: List[Any]):
+        results: List[bytes] = [b"null"] * len(operations)
+        pending: List[Tuple[int, Optional[Tuple[str, Any]]]] = []
+        for index, operation in enumerate(operations):
+            lookup = self._lookup(operation) if isinstance(operation, dict) else None
+            if lookup is None:
+                pending.append((index, None))
+                continue
+            key, tags = lookup
+            versions = await self.cache.snapshot(tags)
+            entry = self.cache.get(key, versions)
+            if entry is not None:
+                results[index] = entry.body
+            else:
+                pending.append((index, (key, versions)))
+
+        start: Optional[Message] = None
+        if pending:
+            forwarded = json.dumps([operations[index] for index, _ in pending]).encode()
+            start, response_body = await self._execute(scope, receive, forwarded)
+            responses: Any = None
+            if start is not None and start["status"] == 200:
+                try:
+                    responses = json.loads(response_body)
+                except ValueError:
+                    responses = None
+            if not isinstance(responses, list) or len(responses) != len(pending):
+                # Lot rejeté dans son ensemble : réponse transmise telle quelle
+                if start is not None:
+                    await send(start)
+                await send({"type": "http.response.body", "body": response_body})
+                return
+
+            for (index, lookup), response in zip(pending, responses):
+                encoded = json.dumps(response, separators=(",", ":")).encode()
+                if lookup is not None and isinstance(response, dict) and "errors" not in response:
+                    self.cache.put(lookup[0], encoded, lookup[1])
+                results[index] = encoded
+
+        body = b"[" + b",".join(results) + b"]"
+        headers = MutableHeaders(scope=start) if start is not None else MutableHeaders()
+        headers["Content-Type"] = "application/json"
+        headers["Content-Length"] = str(len(body))
+        headers["Cache-Control"] = "private, no-cache"
+        headers["X-Cache"] = "MISS" if pending else "HIT"
+        await send({"type": "http.response.start", "status": 200, "headers": headers.raw})
+        await send({"type": "http.response.body", "body": body})
+
+    async def _execute(self, scope: Scope, receive: Receive, body: bytes) -> Tuple[Optional[Message], bytes]:
+        """Exécute la requête avec ce corps et retient la réponse au lieu de l'envoyer."""
+        start: Optional[Message] = None
+        chunks: List[bytes] = []
+
+        async def capture(message: Message):
+            nonlocal start
+            if message["type"] == "http.response.start":
+                start = message
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        await self.app(scope, _replay(body, receive), capture)
+        return start, b"".join(chunks)
+
+    def _lookup(self, data: Dict[str, Any]) -> Optional[Tuple[str, Any]]:
+        """Clé de cache et étiquettes lues, ou None si l'opération n'est pas cachable."""
+        query = data.get("query")
+        sha256_hash = persisted_query_hash(data)
+        if query and sha256_hash is not None:
+            # Enregistrement APQ : doit atteindre le routeur pour stocker le document
+            return None
+        if not query:
+            if sha256_hash is None or self.persisted_queries is None:
+                return None
+            query = self.persisted_queries.get(sha256_hash)
+        operation_name = data.get("operationName")
+        if not isinstance(query, str) or not (operation_name is None or isinstance(operation_name, str)):
+            return None
+
+        variables = data.get("variables") or {}
+        if isinstance(variables, str):
+            try:
+                variables = json.loads(variables)
+            except ValueError:
+                return None
+        if not isinstance(variables, dict):
+            return None
+
+        analyzed = analyze_query(query, operation_name)
+        if analyzed is None:
+            return None
+        return cache_key(analyzed, variables), analyzed.tags(variables)
+
+    @staticmethod
+    def _request_data(scope: Scope, body: bytes) -> Any:
+        if scope["method"] == "GET":
+            params = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+            return {name: values[-1] for name, values in params.items()}
+        if "application/json" not in Headers(scope=scope).get("content-type", ""):
+            return None
+        try:
+            data = json.loads(body)
+        except ValueError:
+            return None
+        # Objet pour une opération, liste pour un lot
+        return data if isinstance(data, (dict, list)) else None
+
+    async def _send_cached(self, send: Send, body: bytes, etag: str, not_modified: bool, status: str):
+        headers = [
+            (b"etag", etag.encode("latin-1")),
+            (b"cache-control", b"private, no-cache"),
+            (b"x-cache", status.encode("latin-1")),
+        ]
+        if not_modified:
+            await send({"type": "http.response.start", "status": 304, "headers": headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+        headers += [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode("latin-1")),
+        ]
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+    async def _send_not_modified(self, send: Send, start: Message):
+        headers = MutableHeaders(scope=start)
+        for name in ("content-length", "content-type"):
+            if name in headers:
+                del headers[name]
+        await send({**start, "status": 304})
+        await send({"type": "http.response.body", "body": b""})
@@ -1,6 +1,7 @@
 import strawberry
-from typing import Optional
+from typing import Optional, List
 from datetime import datetime
+from decimal import Decimal
 from uuid import UUID
 
 @strawberry.type
@@ -17,6 +18,14 @@ class AddressInput:
     zip_code: str
     country: str
 
+@strawberry.type
+class ClientQuoteSummary:
+    currency: str
+    quote_count: int
+    quoted_amount: Decimal
+    accepted_amount: Decimal
+    pending_amount: Decimal
+
 @strawberry.type
 class Client:
     id: strawberry.ID
@@ -27,6 +36,7 @@ class Client:
     address: Address
     created_at: datetime
     updated_at: datetime
+    quote_summary: Optional[List[ClientQuoteSummary]] = None
 
 @strawberry.input
 class ClientInput:
@@ -43,3 +53,18 @@ class UpdateClientInput:
     email: Optional[str] = None
     phone: Optional[str] = None
     address: Optional[AddressInput] = None
+
+@strawberry.input
+class ClientImportInput:
+    name: str
+    address: Optional[AddressInput] = None
+
+@strawberry.type
+class ClientMatch:
+    client: Client
+    score: float
+
+@strawberry.type
+class ClientDuplicateReport:
+    index: int
+    matches: List[ClientMatch]
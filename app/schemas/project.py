@@ -26,6 +26,14 @@ class Project:
     updated_at: datetime
 
 
+@strawberry.type
+class ProjectUpdate:
+    project_id: strawberry.ID
+    name: str
+    status: ProjectStatusEnum
+    occurred_at: datetime
+
+
 @strawberry.input
 class ProjectInput:
     client_id: str
@@ -14,6 +14,28 @@ class QuoteStatusEnum(Enum):
     EXPIRED = "expired"
 
 
+@strawberry.enum
+class QuoteSortFieldEnum(Enum):
+    CREATED_AT = "created_at"
+    VALID_UNTIL = "valid_until"
+    TOTAL_HT = "total_ht"
+    TOTAL_TTC = "total_ttc"
+    TITLE = "title"
+
+
+@strawberry.enum
+class SortDirectionEnum(Enum):
+    ASC = "asc"
+    DESC = "desc"
+
+
+@strawberry.enum
+class QuoteStatsGroupByEnum(Enum):
+    STATUS = "status"
+    CLIENT = "client"
+    MONTH = "month"
+
+
 @strawberry.type
 class QuoteItem:
     id: strawberry.ID
@@ -66,3 +88,57 @@ class AddQuoteItemInput:
     description: str
     unit_price: Decimal
     quantity: Decimal
+
+
+@strawberry.input
+class UpdateQuoteItemInput:
+    id: str
+    description: Optional[str] = None
+    unit_price: Optional[Decimal] = None
+    quantity: Optional[Decimal] = None
+
+
+@strawberry.input
+class QuoteFilterInput:
+    status: Optional[List[QuoteStatusEnum]] = None
+    client_id: Optional[str] = None
+    project_id: Optional[str] = None
+    valid_until_from: Optional[date] = None
+    valid_until_to: Optional[date] = None
+    created_from: Optional[datetime] = None
+    created_to: Optional[datetime] = None
+    min_total_ttc: Optional[Decimal] = None
+    max_total_ttc: Optional[Decimal] = None
+
+
+@strawberry.input
+class QuoteSortInput:
+    field: QuoteSortFieldEnum = QuoteSortFieldEnum.CREATED_AT
+    direction: SortDirectionEnum = SortDirectionEnum.DESC
+
+
+@strawberry.type
+class QuoteStats:
+    status: Optional[QuoteStatusEnum]
+    client_id: Optional[strawberry.ID]
+    month: Optional[date]
+    currency: str
+    count: int
+    total_ht: Decimal
+    total_ttc: Decimal
+
+
+@strawberry.type
+class QuoteStatusChange:
+    quote_id: strawberry.ID
+    client_id: strawberry.ID
+    status: QuoteStatusEnum
+    occurred_at: datetime
+
+
+@strawberry.type
+class QuoteStatusChangeResult:
+    quote_id: strawberry.ID
+    success: bool
+    status: Optional[QuoteStatusEnum] = None
+    error: Optional[str] = None
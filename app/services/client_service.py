@@ -1,45 +1,67 @@
 from typing import List, Optional
 from uuid import UUID
-from infrastructure.database.session import async_session_maker
+from infrastructure.database.session import read_session, write_session
+from infrastructure.events.publisher import BufferedEventPublisher
 from infrastructure.persistence.sqlalchemy_client_repository import SQLAlchemyClientRepository
 from domain.clients.use_cases.create_client import CreateClientUseCase
 from domain.clients.use_cases.get_client import GetClientUseCase
 from domain.clients.use_cases.list_clients import ListClientsUseCase
 from domain.clients.use_cases.update_client import UpdateClientUseCase
 from domain.clients.use_cases.delete_client import DeleteClientUseCase
-from domain.clients.dto.client_dto import CreateClientDTO, UpdateClientDTO, ClientResponseDTO, AddressDTO
-from app.schemas.client import Client, ClientInput, UpdateClientInput, Address
+from domain.clients.use_cases.find_duplicate_clients import FindDuplicateClientsUseCase
+from domain.clients.dto.client_dto import (
+    CreateClientDTO,
+    UpdateClientDTO,
+    ClientResponseDTO,
+    AddressDTO,
+    ClientImportCandidateDTO,
+)
+from app.schemas.client import (
+    Client,
+    ClientInput,
+    UpdateClientInput,
+    Address,
+    ClientQuoteSummary,
+    ClientImportInput,
+    ClientMatch,
+    ClientDuplicateReport,
+)
 
 
 class ClientService:
     """Service pour gérer les opérations GraphQL sur les clients."""
 
-    async def get_all_clients(self, skip: int = 0, limit: int = 100) -> List[Client]:
-        """Récupère tous les clients."""
-        async with async_session_maker() as session:
+    async def get_all_clients(
+        self, skip: int = 0, limit: int = 100, include_quote_summary: bool = False
+    ) -> List[Client]:
+        """Récupère tous les clients, avec leurs indicateurs financiers si demandé."""
+        async with read_session() as session:
             repository = SQLAlchemyClientRepository(session)
             use_case = ListClientsUseCase(repository)
-            clients_dto = await use_case.execute(skip=skip, limit=limit)
+            clients_dto = await use_case.execute(
+                skip=skip, limit=limit, include_quote_summary=include_quote_summary
+            )
 
             return [self._dto_to_graphql(dto) for dto in clients_dto]
 
-    async def get_client_by_id(self, client_id: str) -> Optional[Client]:
-        """Récupère un client par son ID."""
-        async with async_session_maker() as session:
+    async def get_client_by_id(self, client_id: str, include_quote_summary: bool = False) -> Optional[Client]:
+        """Récupère un client par son ID, avec ses indicateurs financiers si demandé."""
+        async with read_session() as session:
             repository = SQLAlchemyClientRepository(session)
             use_case = GetClientUseCase(repository)
 
             try:
-                client_dto = await use_case.execute(UUID(client_id))
+                client_dto = await use_case.execute(UUID(client_id), include_quote_summary=include_quote_summary)
                 return self._dto_to_graphql(client_dto)
             except ValueError:
                 return None
 
     async def create_client(self, client_input: ClientInput) -> Client:
         """Crée un nouveau client."""
-        async with async_session_maker() as session:
+        async with write_session() as session:
             repository = SQLAlchemyClientRepository(session)
-            use_case = CreateClientUseCase(repository)
+            events = BufferedEventPublisher()
+            use_case = CreateClientUseCase(repository, events)
 
             # Convertir l'input GraphQL en DTO
             create_dto = CreateClientDTO(
@@ -57,14 +79,16 @@ class ClientService:
 
             client_dto = await use_case.execute(create_dto)
             await session.commit()
+            events.flush()
 
             return self._dto_to_graphql(client_dto)
 
     async def update_client(self, client_id: str, client_input: UpdateClientInput) -> Optional[Client]:
         """Met à jour un client."""
-        async with async_session_maker() as session:
+        async with write_session() as session:
             repository = SQLAlchemyClientRepository(session)
-            use_case = UpdateClientUseCase(repository)
+            events = BufferedEventPublisher()
+            use_case = UpdateClientUseCase(repository, events)
 
             # Convertir l'input GraphQL en DTO
             address_dto = None
@@ -87,23 +111,67 @@ class ClientService:
             try:
                 client_dto = await use_case.execute(UUID(client_id), update_dto)
                 await session.commit()
+                events.flush()
                 return self._dto_to_graphql(client_dto)
             except ValueError:
                 return None
 
     async def delete_client(self, client_id: str) -> bool:
         """Supprime un client."""
-        async with async_session_maker() as session:
+        async with write_session() as session:
             repository = SQLAlchemyClientRepository(session)
-            use_case = DeleteClientUseCase(repository)
+            events = BufferedEventPublisher()
+            use_case = DeleteClientUseCase(repository, events)
 
             try:
                 await use_case.execute(UUID(client_id))
                 await session.commit()
+                events.flush()
                 return True
             except ValueError:
                 return False
 
+    async def find_duplicate_clients(
+        self,
+        candidates: List[ClientImportInput],
+        threshold: float = 0.4,
+        limit: int = 3,
+    ) -> List[ClientDuplicateReport]:
+        """Recherche les doublons potentiels d'un lot de clients à importer."""
+        async with read_session() as session:
+            repository = SQLAlchemyClientRepository(session)
+            use_case = FindDuplicateClientsUseCase(repository)
+
+            try:
+                # Convertir les inputs GraphQL en DTOs
+                candidates_dto = [
+                    ClientImportCandidateDTO(
+                        name=candidate.name,
+                        address=AddressDTO(
+                            street=candidate.address.street,
+                            city=candidate.address.city,
+                            zip_code=candidate.address.zip_code,
+                            country=candidate.address.country,
+                        ) if candidate.address else None,
+                    )
+                    for candidate in candidates
+                ]
+
+                reports_dto = await use_case.execute(candidates_dto, threshold=threshold, limit=limit)
+
+                return [
+                    ClientDuplicateReport(
+                        index=report.index,
+                        matches=[
+                            ClientMatch(client=self._dto_to_graphql(match.client), score=match.score)
+                            for match in report.matches
+                        ],
+                    )
+                    for report in reports_dto
+                ]
+            except ValueError:
+                return []
+
     def _dto_to_graphql(self, dto: ClientResponseDTO) -> Client:
         """Convertit un DTO en type GraphQL."""
         return Client(
@@ -120,4 +188,14 @@ class ClientService:
             ),
             created_at=dto.created_at,
             updated_at=dto.updated_at,
+            quote_summary=[
+                ClientQuoteSummary(
+                    currency=summary.currency,
+                    quote_count=summary.quote_count,
+                    quoted_amount=summary.quoted_amount,
+                    accepted_amount=summary.accepted_amount,
+                    pending_amount=summary.pending_amount,
+                )
+                for summary in dto.quote_summary
+            ] if dto.quote_summary is not None else None,
         )
@@ -1,6 +1,8 @@
-from typing import List, Optional
+from typing import AsyncGenerator, List, Optional
 from uuid import UUID
-from infrastructure.database.session import async_session_maker
+from infrastructure.database.session import read_session, write_session
+from infrastructure.events.broadcaster import broadcaster
+from infrastructure.events.publisher import BufferedEventPublisher, project_channel
 from infrastructure.persistence.sqlalchemy_project_repository import SQLAlchemyProjectRepository
 from domain.projects.use_cases.create_project import CreateProjectUseCase
 from domain.projects.use_cases.get_project import GetProjectUseCase
@@ -9,7 +11,7 @@ from domain.projects.use_cases.update_project import UpdateProjectUseCase
 from domain.projects.use_cases.delete_project import DeleteProjectUseCase
 from domain.projects.dto.project_dto import CreateProjectDTO, UpdateProjectDTO, ProjectResponseDTO
 from domain.projects.value_objects.project_status import ProjectStatus
-from app.schemas.project import Project, ProjectInput, UpdateProjectInput, ProjectStatusEnum
+from app.schemas.project import Project, ProjectInput, UpdateProjectInput, ProjectStatusEnum, ProjectUpdate
 
 
 class ProjectService:
@@ -17,7 +19,7 @@ class ProjectService:
 
     async def get_all_projects(self, skip: int = 0, limit: int = 100) -> List[Project]:
         """Récupère tous les projets."""
-        async with async_session_maker() as session:
+        async with read_session() as session:
             repository = SQLAlchemyProjectRepository(session)
             use_case = ListProjectsUseCase(repository)
             projects_dto = await use_case.execute(skip=skip, limit=limit)
@@ -26,7 +28,7 @@ class ProjectService:
 
     async def get_project_by_id(self, project_id: str) -> Optional[Project]:
         """Récupère un projet par son ID."""
-        async with async_session_maker() as session:
+        async with read_session() as session:
             repository = SQLAlchemyProjectRepository(session)
             use_case = GetProjectUseCase(repository)
 
@@ -38,9 +40,10 @@ class ProjectService:
 
     async def create_project(self, project_input: ProjectInput) -> Project:
         """Crée un nouveau projet."""
-        async with async_session_maker() as session:
+        async with write_session() as session:
             repository = SQLAlchemyProjectRepository(session)
-            use_case = CreateProjectUseCase(repository)
+            events = BufferedEventPublisher()
+            use_case = CreateProjectUseCase(repository, events)
 
             # Convertir l'input GraphQL en DTO
             create_dto = CreateProjectDTO(
@@ -54,14 +57,16 @@ class ProjectService:
 
             project_dto = await use_case.execute(create_dto)
             await session.commit()
+            events.flush()
 
             return self._dto_to_graphql(project_dto)
 
     async def update_project(self, project_id: str, project_input: UpdateProjectInput) -> Optional[Project]:
         """Met à jour un projet."""
-        async with async_session_maker() as session:
+        async with write_session() as session:
             repository = SQLAlchemyProjectRepository(session)
-            use_case = UpdateProjectUseCase(repository)
+            events = BufferedEventPublisher()
+            use_case = UpdateProjectUseCase(repository, events)
 
             # Convertir l'input GraphQL en DTO
             update_dto = UpdateProjectDTO(
@@ -75,23 +80,37 @@ class ProjectService:
             try:
                 project_dto = await use_case.execute(UUID(project_id), update_dto)
                 await session.commit()
+                events.flush()
                 return self._dto_to_graphql(project_dto)
             except ValueError:
                 return None
 
     async def delete_project(self, project_id: str) -> bool:
         """Supprime un projet."""
-        async with async_session_maker() as session:
+        async with write_session() as session:
             repository = SQLAlchemyProjectRepository(session)
-            use_case = DeleteProjectUseCase(repository)
+            events = BufferedEventPublisher()
+            use_case = DeleteProjectUseCase(repository, events)
 
             try:
                 await use_case.execute(UUID(project_id))
                 await session.commit()
+                events.flush()
                 return True
             except ValueError:
                 return False
 
+    async def watch_project(self, project_id: str) -> AsyncGenerator[ProjectUpdate, None]:
+        """Mises à jour d'un projet, diffusées après chaque commit."""
+        async with broadcaster.subscribe(project_channel(UUID(project_id))) as subscription:
+            async for event in subscription:
+                yield ProjectUpdate(
+                    project_id=str(event.project_id),
+                    name=event.name,
+                    status=ProjectStatusEnum(event.status.value),
+                    occurred_at=event.occurred_at,
+                )
+
     def _dto_to_graphql(self, dto: ProjectResponseDTO) -> Project:
         """Convertit un DTO en type GraphQL."""
         return Project(
@@ -1,34 +1,98 @@
-from typing import List, Optional
+from typing import AsyncGenerator, List, Optional
 from uuid import UUID
 from decimal import Decimal
-from infrastructure.database.session import async_session_maker
+from infrastructure.tracing import set_attribute, tracer
+from infrastructure.database.session import read_session, write_session
+from infrastructure.events.broadcaster import broadcaster
+from infrastructure.events.publisher import BufferedEventPublisher, quote_status_channel
 from infrastructure.persistence.sqlalchemy_quote_repository import SQLAlchemyQuoteRepository
 from domain.quotes.use_cases.create_quote import CreateQuoteUseCase
 from domain.quotes.use_cases.get_quote import GetQuoteUseCase
 from domain.quotes.use_cases.list_quotes import ListQuotesUseCase
 from domain.quotes.use_cases.add_quote_item import AddQuoteItemUseCase
+from domain.quotes.use_cases.edit_quote_items import EditQuoteItemsUseCase
 from domain.quotes.use_cases.change_quote_status import ChangeQuoteStatusUseCase
+from domain.quotes.use_cases.bulk_change_quote_status import BulkChangeQuoteStatusUseCase
 from domain.quotes.use_cases.delete_quote import DeleteQuoteUseCase
-from domain.quotes.dto.quote_dto import CreateQuoteDTO, QuoteResponseDTO, AddQuoteItemDTO, CreateQuoteItemDTO
+from domain.quotes.use_cases.get_quote_stats import GetQuoteStatsUseCase
+from domain.quotes.dto.quote_dto import (
+    CreateQuoteDTO,
+    QuoteResponseDTO,
+    AddQuoteItemDTO,
+    UpdateQuoteItemDTO,
+    EditQuoteItemsDTO,
+    CreateQuoteItemDTO,
+    QuoteFilterDTO,
+    QuoteSortDTO,
+    QuoteStatsRequestDTO,
+    QuoteStatusChangeResultDTO,
+)
+from domain.quotes.events.quote_events import QuoteAccepted, QuoteExpired, QuoteRejected, QuoteSent
 from domain.quotes.value_objects.quote_status import QuoteStatus
-from app.schemas.quote import Quote, QuoteInput, AddQuoteItemInput, QuoteItem, QuoteStatusEnum
+from domain.quotes.value_objects.quote_sort import QuoteSortField
+from domain.quotes.value_objects.quote_stats import QuoteStatsDimension
+from app.schemas.quote import (
+    Quote,
+    QuoteInput,
+    AddQuoteItemInput,
+    UpdateQuoteItemInput,
+    QuoteItem,
+    QuoteStatusEnum,
+    QuoteFilterInput,
+    QuoteSortInput,
+    SortDirectionEnum,
+    QuoteStats,
+    QuoteStatsGroupByEnum,
+    QuoteStatusChange,
+    QuoteStatusChangeResult,
+)
+
+# Statut atteint selon l'événement de domaine diffusé
+STATUS_BY_EVENT = {
+    QuoteSent: QuoteStatusEnum.SENT,
+    QuoteAccepted: QuoteStatusEnum.ACCEPTED,
+    QuoteRejected: QuoteStatusEnum.REJECTED,
+    QuoteExpired: QuoteStatusEnum.EXPIRED,
+}
 
 
 class QuoteService:
     """Service pour gérer les opérations GraphQL sur les devis."""
 
-    async def get_all_quotes(self, skip: int = 0, limit: int = 100) -> List[Quote]:
-        """Récupère tous les devis."""
-        async with async_session_maker() as session:
+    async def stream_quotes(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        quote_filter: Optional[QuoteFilterInput] = None,
+        sort: Optional[QuoteSortInput] = None,
+    ) -> AsyncGenerator[Quote, None]:
+        """Produit les devis, éventuellement filtrés et triés, au fil de leur lecture en base.
+
+        La session reste ouverte jusqu'à la fin de l'itération (ou la déconnexion
+        du client) : avec ``@stream``, chaque devis part dès qu'il est lu.
+        """
+        async with read_session() as session:
             repository = SQLAlchemyQuoteRepository(session)
             use_case = ListQuotesUseCase(repository)
-            quotes_dto = await use_case.execute(skip=skip, limit=limit)
 
-            return [self._dto_to_graphql(dto) for dto in quotes_dto]
+            # Filtre invalide (ID mal formé, bornes inversées) : aucun devis
+            try:
+                async for dto in use_case.stream(
+                    skip=skip,
+                    limit=limit,
+                    filter_dto=self._filter_input_to_dto(quote_filter) if quote_filter else None,
+                    sort_dto=QuoteSortDTO(
+                        field=QuoteSortField(sort.field.value),
+                        descending=sort.direction == SortDirectionEnum.DESC,
+                    ) if sort else None,
+                ):
+                    yield self._dto_to_graphql(dto)
+            except ValueError:
+                return
 
     async def get_quote_by_id(self, quote_id: str) -> Optional[Quote]:
         """Récupère un devis par son ID."""
-        async with async_session_maker() as session:
+        async with read_session() as session:
             repository = SQLAlchemyQuoteRepository(session)
             use_case = GetQuoteUseCase(repository)
 
@@ -38,41 +102,82 @@ class QuoteService:
             except ValueError:
                 return None
 
+    async def get_quote_stats(
+        self,
+        group_by: List[QuoteStatsGroupByEnum],
+        quote_filter: Optional[QuoteFilterInput] = None,
+    ) -> List[QuoteStats]:
+        """Calcule les statistiques agrégées des devis."""
+        async with read_session() as session:
+            repository = SQLAlchemyQuoteRepository(session)
+            use_case = GetQuoteStatsUseCase(repository)
+
+            try:
+                stats_dto = await use_case.execute(
+                    QuoteStatsRequestDTO(
+                        group_by=[QuoteStatsDimension(dimension.value) for dimension in group_by],
+                        filter=self._filter_input_to_dto(quote_filter) if quote_filter else None,
+                    )
+                )
+            except ValueError:
+                return []
+
+            return [
+                QuoteStats(
+                    status=QuoteStatusEnum(dto.status.value) if dto.status else None,
+                    client_id=str(dto.client_id) if dto.client_id else None,
+                    month=dto.month,
+                    currency=dto.currency,
+                    count=dto.count,
+                    total_ht=dto.total_ht,
+                    total_ttc=dto.total_ttc,
+                )
+                for dto in stats_dto
+            ]
+
     async def create_quote(self, quote_input: QuoteInput) -> Quote:
         """Crée un nouveau devis."""
-        async with async_session_maker() as session:
+        async with write_session() as session:
             repository = SQLAlchemyQuoteRepository(session)
-            use_case = CreateQuoteUseCase(repository)
+            events = BufferedEventPublisher()
+            use_case = CreateQuoteUseCase(repository, events)
+
+            set_attribute("quote.item_count", len(quote_input.items))
 
             # Convertir l'input GraphQL en DTO
-            items_dto = [
-                CreateQuoteItemDTO(
-                    description=item.description,
-                    unit_price=item.unit_price,
-                    quantity=item.quantity,
-                    currency=item.currency,
-                )
-                for item in quote_input.items
-            ]
+            with tracer.span("dto.build CreateQuoteDTO"):
+                items_dto = [
+                    CreateQuoteItemDTO(
+                        description=item.description,
+                        unit_price=item.unit_price,
+                        quantity=item.quantity,
+                        currency=item.currency,
+                    )
+                    for item in quote_input.items
+                ]
 
-            create_dto = CreateQuoteDTO(
-                client_id=UUID(quote_input.client_id),
-                project_id=UUID(quote_input.project_id) if quote_input.project_id else None,
-                title=quote_input.title,
-                currency=quote_input.currency,
-                tax_rate=quote_input.tax_rate,
-                valid_until=quote_input.valid_until,
-                items=items_dto,
-            )
+                create_dto = CreateQuoteDTO(
+                    client_id=UUID(quote_input.client_id),
+                    project_id=UUID(quote_input.project_id) if quote_input.project_id else None,
+                    title=quote_input.title,
+                    currency=quote_input.currency,
+                    tax_rate=quote_input.tax_rate,
+                    valid_until=quote_input.valid_until,
+                    items=items_dto,
+                )
 
             quote_dto = await use_case.execute(create_dto)
-            await session.commit()
+            set_attribute("quote.id", str(quote_dto.id))
+            with tracer.span("db.commit"):
+                await session.commit()
+            events.flush()
 
             return self._dto_to_graphql(quote_dto)
 
     async def add_item_to_quote(self, quote_id: str, item_input: AddQuoteItemInput) -> Optional[Quote]:
         """Ajoute un item à un devis."""
-        async with async_session_maker() as session:
+        set_attribute("quote.id", quote_id)
+        async with write_session() as session:
             repository = SQLAlchemyQuoteRepository(session)
             use_case = AddQuoteItemUseCase(repository)
 
@@ -89,32 +194,152 @@ class QuoteService:
             except ValueError:
                 return None
 
+    async def edit_quote_items(
+        self,
+        quote_id: str,
+        add: List[AddQuoteItemInput],
+        update: List[UpdateQuoteItemInput],
+        remove: List[str],
+    ) -> Optional[Quote]:
+        """Ajoute, modifie et supprime des items d'un devis dans une seule transaction."""
+        set_attribute("quote.id", quote_id)
+        set_attribute("quote.item_changes", len(add) + len(update) + len(remove))
+        async with write_session() as session:
+            repository = SQLAlchemyQuoteRepository(session)
+            use_case = EditQuoteItemsUseCase(repository)
+
+            try:
+                edit_dto = EditQuoteItemsDTO(
+                    add=[
+                        AddQuoteItemDTO(
+                            description=item.description,
+                            unit_price=item.unit_price,
+                            quantity=item.quantity,
+                        )
+                        for item in add
+                    ],
+                    update=[
+                        UpdateQuoteItemDTO(
+                            id=UUID(item.id),
+                            description=item.description,
+                            unit_price=item.unit_price,
+                            quantity=item.quantity,
+                        )
+                        for item in update
+                    ],
+                    remove=[UUID(item_id) for item_id in remove],
+                )
+                quote_dto = await use_case.execute(UUID(quote_id), edit_dto)
+                await session.commit()
+                return self._dto_to_graphql(quote_dto)
+            except ValueError:
+                return None
+
     async def change_quote_status(self, quote_id: str, new_status: QuoteStatusEnum) -> Optional[Quote]:
         """Change le statut d'un devis."""
-        async with async_session_maker() as session:
+        set_attribute("quote.id", quote_id)
+        set_attribute("quote.status", new_status.value)
+        async with write_session() as session:
             repository = SQLAlchemyQuoteRepository(session)
-            use_case = ChangeQuoteStatusUseCase(repository)
+            events = BufferedEventPublisher()
+            use_case = ChangeQuoteStatusUseCase(repository, events)
 
             try:
                 quote_dto = await use_case.execute(UUID(quote_id), QuoteStatus(new_status.value))
                 await session.commit()
+                events.flush()
                 return self._dto_to_graphql(quote_dto)
             except ValueError:
                 return None
 
+    async def change_quote_statuses(
+        self, quote_ids: List[str], new_status: QuoteStatusEnum
+    ) -> List[QuoteStatusChangeResult]:
+        """Change le statut de plusieurs devis dans une seule transaction."""
+        set_attribute("quote.count", len(quote_ids))
+        set_attribute("quote.status", new_status.value)
+
+        # Les IDs mal formés échouent sans atteindre la base
+        parsed = {}
+        for quote_id in quote_ids:
+            try:
+                parsed[quote_id] = UUID(quote_id)
+            except ValueError:
+                pass
+
+        async with write_session() as session:
+            repository = SQLAlchemyQuoteRepository(session)
+            events = BufferedEventPublisher()
+            use_case = BulkChangeQuoteStatusUseCase(repository, events)
+
+            try:
+                results_dto = await use_case.execute(list(parsed.values()), QuoteStatus(new_status.value))
+            except ValueError as error:
+                return [
+                    QuoteStatusChangeResult(quote_id=quote_id, success=False, error=str(error))
+                    for quote_id in quote_ids
+                ]
+            await session.commit()
+            events.flush()
+
+        results = {dto.quote_id: dto for dto in results_dto}
+        return [
+            self._status_result_to_graphql(results[parsed[quote_id]])
+            if quote_id in parsed
+            else QuoteStatusChangeResult(quote_id=quote_id, success=False, error=f"Invalid quote ID: {quote_id}")
+            for quote_id in quote_ids
+        ]
+
     async def delete_quote(self, quote_id: str) -> bool:
         """Supprime un devis."""
-        async with async_session_maker() as session:
+        set_attribute("quote.id", quote_id)
+        async with write_session() as session:
             repository = SQLAlchemyQuoteRepository(session)
-            use_case = DeleteQuoteUseCase(repository)
+            events = BufferedEventPublisher()
+            use_case = DeleteQuoteUseCase(repository, events)
 
             try:
                 await use_case.execute(UUID(quote_id))
                 await session.commit()
+                events.flush()
                 return True
             except ValueError:
                 return False
 
+    async def watch_status_changes(self, client_id: str) -> AsyncGenerator[QuoteStatusChange, None]:
+        """Changements de statut des devis d'un client, diffusés après chaque commit."""
+        async with broadcaster.subscribe(quote_status_channel(UUID(client_id))) as subscription:
+            async for event in subscription:
+                yield QuoteStatusChange(
+                    quote_id=str(event.quote_id),
+                    client_id=str(event.client_id),
+                    status=STATUS_BY_EVENT[type(event)],
+                    occurred_at=event.occurred_at,
+                )
+
+    def _filter_input_to_dto(self, quote_filter: QuoteFilterInput) -> QuoteFilterDTO:
+        """Convertit l'input GraphQL de filtre en DTO."""
+        return QuoteFilterDTO(
+            statuses=[QuoteStatus(status.value) for status in quote_filter.status or []],
+            client_id=UUID(quote_filter.client_id) if quote_filter.client_id else None,
+            project_id=UUID(quote_filter.project_id) if quote_filter.project_id else None,
+            valid_until_from=quote_filter.valid_until_from,
+            valid_until_to=quote_filter.valid_until_to,
+            created_from=quote_filter.created_from,
+            created_to=quote_filter.created_to,
+            min_total_ttc=quote_filter.min_total_ttc,
+            max_total_ttc=quote_filter.max_total_ttc,
+        )
+
+    def _status_result_to_graphql(self, dto: QuoteStatusChangeResultDTO) -> QuoteStatusChangeResult:
+        """Convertit le résultat d'un changement de statut en type GraphQL."""
+        return QuoteStatusChangeResult(
+            quote_id=str(dto.quote_id),
+            success=dto.success,
+            status=QuoteStatusEnum(dto.status.value) if dto.status else None,
+            error=dto.error,
+        )
+
     def _dto_to_graphql(self, dto: QuoteResponseDTO) -> Quote:
         """Convertit un DTO en type GraphQL."""
         items = [
@@ -0,0 +1,94 @@
+from datetime import date, timedelta
+from decimal import Decimal
+from uuid import uuid4
+
+from benchmarks.harness import benchmark
+from domain.projects.entities.feature import Feature
+from domain.projects.entities.module import Module
+from domain.projects.entities.project import Project
+from domain.projects.value_objects.complexity import Complexity
+from domain.projects.value_objects.estimation_rule import EstimationRule
+from domain.projects.value_objects.overhead_percentage import OverheadPercentage
+from domain.projects.value_objects.profile import Profile
+from domain.quotes.entities.quote import Quote
+from domain.quotes.entities.quote_item import QuoteItem
+from domain.quotes.value_objects.money import Money
+from domain.quotes.value_objects.tax_rate import TaxRate
+
+ITEM_SIZES = (1, 10, 100, 1000)
+FEATURE_SIZES = (10, 100, 1000)
+
+ESTIMATION_RULES = [
+    EstimationRule(Complexity.SIMPLE, 4.0),
+    EstimationRule(Complexity.MEDIUM, 12.0),
+    EstimationRule(Complexity.COMPLEX, 32.0),
+]
+PROFILES = [
+    Profile("developer", Decimal("600"), Decimal("75")),
+    Profile("designer", Decimal("550"), Decimal("68.75")),
+    Profile("project_manager", Decimal("700"), Decimal("87.5")),
+]
+OVERHEADS = [OverheadPercentage("management", Decimal("0.10")), OverheadPercentage("risk", Decimal("0.05"))]
+
+
+def build_quote(item_count: int) -> Quote:
+    """Devis brouillon de ``item_count`` lignes (validation des entités comprise)."""
+    quote = Quote.create(
+        client_id=uuid4(),
+        title="Benchmark quote",
+        tax_rate=TaxRate(Decimal("0.20")),
+        valid_until=date.today() + timedelta(days=30),
+    )
+    for index in range(item_count):
+        quote.add_item(
+            QuoteItem.create(
+                quote_id=quote.id,
+                description=f"Line {index}",
+                unit_price=Money(Decimal("125.50")),
+                quantity=Decimal(index % 7 + 1),
+            )
+        )
+    return quote
+
+
+@benchmark("domain", ITEM_SIZES)
+async def quote_build(size: int):
+    """Création d'un devis et de ses lignes."""
+    return lambda: build_quote(size)
+
+
+@benchmark("domain", ITEM_SIZES)
+async def quote_totals(size: int):
+    """Calcul des totaux HT/TTC d'un devis."""
+    quote = build_quote(size)
+    return quote.calculate_total_ttc
+
+
+@benchmark("domain", FEATURE_SIZES)
+async def project_estimation(size: int):
+    """Estimation d'un projet de ``size`` features réparties sur 10 modules."""
+    project = Project.create(
+        client_id=uuid4(),
+        name="Benchmark project",
+        description="Benchmark",
+        start_date=date.today(),
+    )
+    modules = [Module.create(project_id=project.id, name=f"Module {index}") for index in range(10)]
+    complexities = list(Complexity)
+    allocation = {"developer": 0.7, "designer": 0.2, "project_manager": 0.1}
+    for index in range(size):
+        module = modules[index % len(modules)]
+        module.add_feature(
+            Feature.create(
+                module_id=module.id,
+                name=f"Feature {index}",
+                description="Benchmark feature",
+                complexity=complexities[index % len(complexities)],
+                profile_allocation=allocation,
+                extra_hours=index % 3,
+            )
+        )
+    for module in modules:
+        project.add_module(module)
+
+    return lambda: project.calculate_estimation(ESTIMATION_RULES, PROFILES, OVERHEADS)
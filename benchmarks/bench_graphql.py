@@ -0,0 +1,98 @@
+from datetime import date, timedelta
+
+from httpx import ASGITransport, AsyncClient
+
+from benchmarks.environment import reset_schema, seed_clients, seed_quotes
+from benchmarks.harness import benchmark
+from main import app
+
+ITEM_SIZES = (1, 10, 100)
+TABLE_SIZES = (100, 1000, 10000)
+
+QUOTES_QUERY = """
+query FilteredQuotes($filter: QuoteFilterInput) {
+    quotes(limit: 50, filter: $filter, sort: {field: VALID_UNTIL, direction: ASC}) {
+        id title status totalTtc validUntil
+        items { id description total }
+    }
+}
+"""
+
+CLIENTS_QUERY = """
+query ClientsWithSummary {
+    clients(limit: 100) {
+        id name
+        quoteSummary { currency quoteCount quotedAmount }
+    }
+}
+"""
+
+CREATE_QUOTE_MUTATION = """
+mutation CreateQuote($input: QuoteInput!) {
+    createQuote(quoteInput: $input) { id totalHt totalTtc items { id } }
+}
+"""
+
+
+def graphql_operation(query: str, variables: dict = None):
+    """Requête POST /graphql complète (ASGI, sans réseau) ; échoue sur toute erreur GraphQL."""
+    client = AsyncClient(transport=ASGITransport(app=app), base_url="http://bench")
+    payload = {"query": query, "variables": variables or {}}
+
+    async def operation():
+        response = await client.post("/graphql", json=payload)
+        body = response.json()
+        if response.status_code != 200 or body.get("errors"):
+            raise RuntimeError(f"GraphQL benchmark request failed: {body}")
+
+    # Client fermé par run_case à la fin des tours
+    operation.aclose = client.aclose
+    return operation
+
+
+@benchmark("graphql", TABLE_SIZES)
+async def quotes_filtered(size: int):
+    """Query quotes filtrée (statut, échéance) avec lignes, parmi ``size`` devis."""
+    await reset_schema()
+    client_ids = await seed_clients(max(size // 10, 1))
+    await seed_quotes(client_ids, size)
+    return graphql_operation(
+        QUOTES_QUERY,
+        {
+            "filter": {
+                "status": ["DRAFT", "SENT"],
+                "validUntilFrom": date.today().isoformat(),
+                "validUntilTo": (date.today() + timedelta(days=45)).isoformat(),
+            }
+        },
+    )
+
+
+@benchmark("graphql", TABLE_SIZES)
+async def clients_with_summary(size: int):
+    """Query clients avec quoteSummary, parmi ``size`` clients."""
+    await reset_schema()
+    client_ids = await seed_clients(size)
+    await seed_quotes(client_ids, size)
+    return graphql_operation(CLIENTS_QUERY)
+
+
+@benchmark("graphql", ITEM_SIZES)
+async def create_quote(size: int):
+    """Mutation createQuote de ``size`` lignes."""
+    await reset_schema()
+    (client_id,) = await seed_clients(1)
+    return graphql_operation(
+        CREATE_QUOTE_MUTATION,
+        {
+            "input": {
+                "clientId": str(client_id),
+                "title": "Benchmark quote",
+                "validUntil": (date.today() + timedelta(days=30)).isoformat(),
+                "items": [
+                    {"description": f"Line {index}", "unitPrice": "125.50", "quantity": "2"}
+                    for index in range(size)
+                ],
+            }
+        },
+    )
@@ -0,0 +1,97 @@
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from uuid import UUID
+
+from app.core.json import orjson, orjson_dumps, stdlib_dumps
+from benchmarks.harness import benchmark
+
+QUOTE_SIZES = (100, 1000)
+ITEMS_PER_QUOTE = 5
+
+
+def graphql_quotes_payload(quote_count: int) -> dict:
+    """Réponse de ``quotes { ... items { ... } }`` telle que produite par l'exécution GraphQL."""
+    created_at = datetime(2024, 1, 15, 10, 0, tzinfo=timezone.utc)
+    quotes = []
+    for index in range(quote_count):
+        quote_id = str(UUID(int=index + 1))
+        quotes.append(
+            {
+                "id": quote_id,
+                "clientId": str(UUID(int=10**6 + index % 100)),
+                "projectId": None,
+                "title": f"Quote {index}",
+                "status": "SENT",
+                "currency": "EUR",
+                "totalHt": "3765.00",
+                "totalTtc": "4518.00",
+                "taxRate": "0.20",
+                "createdAt": (created_at + timedelta(minutes=index)).isoformat(),
+                "updatedAt": (created_at + timedelta(minutes=index)).isoformat(),
+                "validUntil": (date(2024, 3, 31) + timedelta(days=index % 60)).isoformat(),
+                "items": [
+                    {
+                        "id": str(UUID(int=10**9 + index * ITEMS_PER_QUOTE + line)),
+                        "quoteId": quote_id,
+                        "description": f"Line {line}",
+                        "unitPrice": "125.50",
+                        "quantity": str(line + 1),
+                        "total": str(Decimal("125.50") * (line + 1)),
+                        "currency": "EUR",
+                    }
+                    for line in range(ITEMS_PER_QUOTE)
+                ],
+            }
+        )
+    return {"data": {"quotes": quotes}}
+
+
+def native_quotes_payload(quote_count: int) -> list:
+    """Mêmes devis avec les types Python (Decimal, UUID, date, datetime) à convertir par l'encodeur."""
+    created_at = datetime(2024, 1, 15, 10, 0, tzinfo=timezone.utc)
+    return [
+        {
+            "id": UUID(int=index + 1),
+            "client_id": UUID(int=10**6 + index % 100),
+            "title": f"Quote {index}",
+            "total_ht": Decimal("3765.00"),
+            "total_ttc": Decimal("4518.00"),
+            "created_at": created_at + timedelta(minutes=index),
+            "valid_until": date(2024, 3, 31) + timedelta(days=index % 60),
+            "items": [
+                {"id": UUID(int=10**9 + index * ITEMS_PER_QUOTE + line), "total": Decimal("125.50") * (line + 1)}
+                for line in range(ITEMS_PER_QUOTE)
+            ],
+        }
+        for index in range(quote_count)
+    ]
+
+
+@benchmark("serialization", QUOTE_SIZES)
+async def graphql_quotes_stdlib(size: int):
+    """Réponse GraphQL de ``size`` devis encodée par le module json."""
+    payload = graphql_quotes_payload(size)
+    return lambda: stdlib_dumps(payload)
+
+
+@benchmark("serialization", QUOTE_SIZES)
+async def native_quotes_stdlib(size: int):
+    """``size`` devis aux types Python natifs encodés par le module json."""
+    payload = native_quotes_payload(size)
+    return lambda: stdlib_dumps(payload)
+
+
+# Variante orjson mesurée seulement si la dépendance est installée
+if orjson is not None:
+
+    @benchmark("serialization", QUOTE_SIZES)
+    async def graphql_quotes_orjson(size: int):
+        """Réponse GraphQL de ``size`` devis encodée par orjson."""
+        payload = graphql_quotes_payload(size)
+        return lambda: orjson_dumps(payload)
+
+    @benchmark("serialization", QUOTE_SIZES)
+    async def native_quotes_orjson(size: int):
+        """``size`` devis aux types Python natifs encodés par orjson."""
+        payload = native_quotes_payload(size)
+        return lambda: orjson_dumps(payload)
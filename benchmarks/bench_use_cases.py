@@ -0,0 +1,95 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+from benchmarks.environment import reset_schema, seed_clients, seed_quotes
+from benchmarks.harness import benchmark
+from domain.clients.use_cases.list_clients import ListClientsUseCase
+from domain.quotes.dto.quote_dto import CreateQuoteDTO, CreateQuoteItemDTO, QuoteFilterDTO
+from domain.quotes.use_cases.create_quote import CreateQuoteUseCase
+from domain.quotes.use_cases.get_quote import GetQuoteUseCase
+from domain.quotes.use_cases.list_quotes import ListQuotesUseCase
+from domain.quotes.value_objects.quote_status import QuoteStatus
+from infrastructure.database.session import async_session_maker
+from infrastructure.persistence.sqlalchemy_client_repository import SQLAlchemyClientRepository
+from infrastructure.persistence.sqlalchemy_quote_repository import SQLAlchemyQuoteRepository
+
+ITEM_SIZES = (1, 10, 100)
+TABLE_SIZES = (100, 1000, 10000)
+
+
+def create_quote_dto(client_id, item_count: int) -> CreateQuoteDTO:
+    return CreateQuoteDTO(
+        client_id=client_id,
+        title="Benchmark quote",
+        valid_until=date.today() + timedelta(days=30),
+        items=[
+            CreateQuoteItemDTO(description=f"Line {index}", unit_price=Decimal("125.50"), quantity=Decimal("2"))
+            for index in range(item_count)
+        ],
+    )
+
+
+@benchmark("use_cases", ITEM_SIZES)
+async def create_quote(size: int):
+    """CreateQuoteUseCase + commit (flush, refresh, read model)."""
+    await reset_schema()
+    (client_id,) = await seed_clients(1)
+    dto = create_quote_dto(client_id, size)
+
+    async def operation():
+        async with async_session_maker() as session:
+            await CreateQuoteUseCase(SQLAlchemyQuoteRepository(session)).execute(dto)
+            await session.commit()
+
+    return operation
+
+
+@benchmark("use_cases", ITEM_SIZES)
+async def get_quote(size: int):
+    """GetQuoteUseCase sur un devis de ``size`` lignes."""
+    await reset_schema()
+    client_ids = await seed_clients(1)
+    (quote_id,) = await seed_quotes(client_ids, 1, items_per_quote=size)
+
+    async def operation():
+        async with async_session_maker() as session:
+            await GetQuoteUseCase(SQLAlchemyQuoteRepository(session)).execute(quote_id)
+
+    return operation
+
+
+@benchmark("use_cases", TABLE_SIZES)
+async def list_quotes_filtered(size: int):
+    """Page de 50 devis filtrés par statut et échéance parmi ``size`` devis."""
+    await reset_schema()
+    client_ids = await seed_clients(max(size // 10, 1))
+    await seed_quotes(client_ids, size)
+    filter_dto = QuoteFilterDTO(
+        statuses=[QuoteStatus.DRAFT, QuoteStatus.SENT],
+        valid_until_from=date.today(),
+        valid_until_to=date.today() + timedelta(days=45),
+    )
+
+    async def operation():
+        async with async_session_maker() as session:
+            await ListQuotesUseCase(SQLAlchemyQuoteRepository(session)).execute(
+                skip=0, limit=50, filter_dto=filter_dto
+            )
+
+    return operation
+
+
+@benchmark("use_cases", TABLE_SIZES)
+async def list_clients_with_summary(size: int):
+    """Page de 100 clients avec leur résumé de devis parmi ``size`` clients."""
+    await reset_schema()
+    client_ids = await seed_clients(size)
+    await seed_quotes(client_ids, size)
+
+    async def operation():
+        async with async_session_maker() as session:
+            await ListClientsUseCase(SQLAlchemyClientRepository(session)).execute(
+                skip=0, limit=100, include_quote_summary=True
+            )
+
+    return operation
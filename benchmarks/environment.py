@@ -0,0 +1,120 @@
+"""Base de données des benchmarks.
+
+Doit être importé avant tout module applicatif : ``DATABASE_URL`` est
+remplacé par ``BENCH_DATABASE_URL`` (SQLite par défaut, PostgreSQL local
+pour des mesures représentatives de la production) et le cache des
+réponses GraphQL est désactivé.
+"""
+import os
+import random
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from typing import List
+from uuid import UUID
+
+DEFAULT_BENCH_DATABASE_URL = "sqlite+aiosqlite:///./bench.db"
+BENCH_DATABASE_URL = os.environ.get("BENCH_DATABASE_URL", DEFAULT_BENCH_DATABASE_URL)
+os.environ["DATABASE_URL"] = BENCH_DATABASE_URL
+# Mesurer l'exécution des requêtes, pas les réponses servies depuis le cache
+os.environ.setdefault("RESPONSE_CACHE_ENABLED", "false")
+
+from sqlalchemy import insert  # noqa: E402
+
+from domain.quotes.value_objects.quote_status import QuoteStatus  # noqa: E402
+from infrastructure.database.session import Base, engine, init_db, async_session_maker  # noqa: E402
+from infrastructure.persistence.sqlalchemy_models import ClientModel, QuoteModel, QuoteItemModel  # noqa: E402
+from infrastructure.persistence.client_quote_summary_projector import ClientQuoteSummaryProjector  # noqa: E402
+
+
+async def reset_schema():
+    """Repart d'un schéma vide (chaque benchmark prépare ses propres données)."""
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    if engine.dialect.name == "postgresql":
+        await init_db()
+    else:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+
+async def seed_clients(count: int, seed: int = 0) -> List[UUID]:
+    """Insère ``count`` clients et retourne leurs identifiants."""
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    rows = [
+        {
+            "id": uuid.UUID(int=rng.getrandbits(128), version=4),
+            "name": f"Client {index:06d}",
+            "contact_name": f"Contact {index:06d}",
+            "email": f"client{index:06d}@bench.example",
+            "phone": "+33 1 00 00 00 00",
+            "address_street": f"{index} rue du Benchmark",
+            "address_city": rng.choice(("Paris", "Lyon", "Nantes", "Lille")),
+            "address_zip_code": "75001",
+            "address_country": "France",
+            "created_at": now,
+            "updated_at": now,
+        }
+        for index in range(count)
+    ]
+    async with engine.begin() as conn:
+        if rows:
+            await conn.execute(insert(ClientModel), rows)
+    return [row["id"] for row in rows]
+
+
+async def seed_quotes(client_ids: List[UUID], count: int, items_per_quote: int = 3, seed: int = 0) -> List[UUID]:
+    """Insère ``count`` devis (totaux cohérents avec leurs lignes) et le read model associé."""
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    statuses = list(QuoteStatus)
+    quotes, items = [], []
+    for index in range(count):
+        quote_id = uuid.UUID(int=rng.getrandbits(128), version=4)
+        total_ht = Decimal("0")
+        for line in range(items_per_quote):
+            unit_price = Decimal(rng.randint(100, 200000)) / 100
+            quantity = Decimal(rng.randint(1, 20))
+            total = unit_price * quantity
+            total_ht += total
+            items.append(
+                {
+                    "id": uuid.UUID(int=rng.getrandbits(128), version=4),
+                    "quote_id": quote_id,
+                    "description": f"Line {line}",
+                    "unit_price": unit_price,
+                    "quantity": quantity,
+                    "total": total,
+                    "currency": "EUR",
+                }
+            )
+        tax_rate = Decimal("0.20")
+        quotes.append(
+            {
+                "id": quote_id,
+                "client_id": client_ids[index % len(client_ids)],
+                "project_id": None,
+                "title": f"Quote {index:06d}",
+                "status": rng.choice(statuses),
+                "currency": "EUR",
+                "total_ht": total_ht,
+                "total_ttc": (total_ht * (1 + tax_rate)).quantize(Decimal("0.01")),
+                "tax_rate": tax_rate,
+                "created_at": now,
+                "updated_at": now,
+                "valid_until": date.today() + timedelta(days=rng.randint(0, 90)),
+            }
+        )
+
+    async with engine.begin() as conn:
+        if quotes:
+            await conn.execute(insert(QuoteModel), quotes)
+        if items:
+            await conn.execute(insert(QuoteItemModel), items)
+
+    async with async_session_maker() as session:
+        await ClientQuoteSummaryProjector(session).rebuild()
+        await session.commit()
+
+    return [quote["id"] for quote in quotes]
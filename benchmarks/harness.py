@@ -0,0 +1,200 @@
+import gc
+import json
+import platform
+import statistics
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from inspect import isawaitable
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+# Un benchmark prépare ses données pour une taille donnée et retourne l'opération à chronométrer ;
+# un attribut ``aclose`` (coroutine) sur l'opération est appelé après les tours
+Setup = Callable[[int], Awaitable[Callable[[], Any]]]
+
+
+@dataclass
+class BenchmarkCase:
+    """Benchmark enregistré : opération paramétrée par une taille de données."""
+
+    suite: str
+    name: str
+    setup: Setup
+    sizes: Sequence[int]
+    description: str = ""
+
+    def key(self, size: int) -> str:
+        return f"{self.suite}.{self.name}[{size}]"
+
+
+@dataclass
+class BenchmarkResult:
+    """Statistiques d'un benchmark pour une taille (durées en millisecondes)."""
+
+    key: str
+    rounds: int
+    min_ms: float
+    median_ms: float
+    mean_ms: float
+    p95_ms: float
+    stdev_ms: float
+    ops_per_second: float
+
+    @staticmethod
+    def from_samples(key: str, samples: List[float]) -> "BenchmarkResult":
+        ordered = sorted(samples)
+        median = statistics.median(ordered)
+        return BenchmarkResult(
+            key=key,
+            rounds=len(ordered),
+            min_ms=round(ordered[0] * 1000, 4),
+            median_ms=round(median * 1000, 4),
+            mean_ms=round(statistics.fmean(ordered) * 1000, 4),
+            p95_ms=round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000, 4),
+            stdev_ms=round(statistics.stdev(ordered) * 1000, 4) if len(ordered) > 1 else 0.0,
+            ops_per_second=round(1 / median, 2) if median > 0 else 0.0,
+        )
+
+
+REGISTRY: List[BenchmarkCase] = []
+
+
+def benchmark(suite: str, sizes: Sequence[int], name: Optional[str] = None):
+    """Enregistre une fonction de préparation comme benchmark."""
+
+    def register(setup: Setup) -> Setup:
+        REGISTRY.append(
+            BenchmarkCase(
+                suite=suite,
+                name=name or setup.__name__,
+                setup=setup,
+                sizes=tuple(sizes),
+                description=(setup.__doc__ or "").strip(),
+            )
+        )
+        return setup
+
+    return register
+
+
+async def run_case(case: BenchmarkCase, size: int, rounds: int, warmup: int) -> BenchmarkResult:
+    """Exécute ``warmup`` tours non mesurés puis ``rounds`` tours chronométrés."""
+    operation = await case.setup(size)
+
+    async def call():
+        result = operation()
+        if isawaitable(result):
+            await result
+
+    samples = []
+    try:
+        for _ in range(warmup):
+            await call()
+
+        # Le ramasse-miettes est déclenché entre les tours, pas pendant la mesure
+        gc.collect()
+        gc.disable()
+        try:
+            for _ in range(rounds):
+                started = time.perf_counter()
+                await call()
+                samples.append(time.perf_counter() - started)
+        finally:
+            gc.enable()
+    finally:
+        # Ressources de l'opération (client HTTP...) libérées même en cas d'échec
+        aclose = getattr(operation, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+    return BenchmarkResult.from_samples(case.key(size), samples)
+
+
+def environment_info(database_url: str) -> Dict[str, str]:
+    """Contexte d'exécution enregistré avec les résultats (comparaisons à machine égale)."""
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "database": database_url.split("://", 1)[0],
+        "recorded_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+
+
+def save_results(path: str, results: List[BenchmarkResult], environment: Dict[str, str]):
+    with open(path, "w", encoding="utf-8") as output:
+        json.dump(
+            {"environment": environment, "results": {result.key: asdict(result) for result in results}},
+            output,
+            indent=2,
+            sort_keys=True,
+        )
+        output.write("\n")
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    with open(path, encoding="utf-8") as baseline:
+        return json.load(baseline)
+
+
+@dataclass
+class Comparison:
+    """Écart de médiane entre un résultat et sa référence."""
+
+    key: str
+    baseline_ms: Optional[float]
+    current_ms: float
+    delta: Optional[float] = None
+    status: str = "new"
+    notes: List[str] = field(default_factory=list)
+
+
+def compare(results: List[BenchmarkResult], baseline: Dict[str, Any], threshold: float) -> List[Comparison]:
+    """Compare les médianes ; au-delà de ``threshold`` (ratio), le résultat est une régression."""
+    reference = baseline.get("results", {})
+    comparisons = []
+    for result in results:
+        previous = reference.get(result.key)
+        if previous is None:
+            comparisons.append(Comparison(result.key, None, result.median_ms))
+            continue
+        delta = (result.median_ms - previous["median_ms"]) / previous["median_ms"] if previous["median_ms"] else 0.0
+        if delta > threshold:
+            status = "regression"
+        elif delta < -threshold:
+            status = "improvement"
+        else:
+            status = "unchanged"
+        comparison = Comparison(result.key, previous["median_ms"], result.median_ms, delta, status)
+        # Écart à interpréter avec prudence si la dispersion dépasse le seuil
+        if result.median_ms and result.stdev_ms / result.median_ms > threshold:
+            comparison.notes.append("noisy")
+        comparisons.append(comparison)
+    return comparisons
+
+
+def format_results(results: List[BenchmarkResult]) -> str:
+    header = f"{'benchmark':<52} {'rounds':>6} {'min ms':>10} {'median ms':>10} {'p95 ms':>10} {'stdev ms':>10} {'ops/s':>10}"
+    lines = [header, "-" * len(header)]
+    for result in results:
+        lines.append(
+            f"{result.key:<52} {result.rounds:>6} {result.min_ms:>10.3f} {result.median_ms:>10.3f} "
+            f"{result.p95_ms:>10.3f} {result.stdev_ms:>10.3f} {result.ops_per_second:>10.1f}"
+        )
+    return "\n".join(lines)
+
+
+def format_comparison(comparisons: List[Comparison], baseline_environment: Dict[str, str]) -> str:
+    lines = [
+        f"Baseline: {baseline_environment.get('recorded_at', '?')} "
+        f"(python {baseline_environment.get('python', '?')}, {baseline_environment.get('database', '?')})",
+    ]
+    header = f"{'benchmark':<52} {'baseline ms':>12} {'current ms':>12} {'delta':>9}  status"
+    lines += [header, "-" * len(header)]
+    for comparison in comparisons:
+        baseline_ms = f"{comparison.baseline_ms:.3f}" if comparison.baseline_ms is not None else "-"
+        delta = f"{comparison.delta:+.1%}" if comparison.delta is not None else "-"
+        status = comparison.status + (f" ({', '.join(comparison.notes)})" if comparison.notes else "")
+        lines.append(f"{comparison.key:<52} {baseline_ms:>12} {comparison.current_ms:>12.3f} {delta:>9}  {status}")
+    return "\n".join(lines)
@@ -1,7 +1,8 @@
 from datetime import datetime
 from uuid import UUID
+from decimal import Decimal
 from pydantic import BaseModel, EmailStr, Field
-from typing import Optional
+from typing import Optional, List
 
 
 class AddressDTO(BaseModel):
@@ -72,6 +73,18 @@ class UpdateClientDTO(BaseModel):
         }
 
 
+class ClientQuoteSummaryDTO(BaseModel):
+    """DTO pour les indicateurs financiers d'un client dans une devise."""
+    currency: str
+    quote_count: int
+    quoted_amount: Decimal
+    accepted_amount: Decimal
+    pending_amount: Decimal
+
+    class Config:
+        from_attributes = True
+
+
 class ClientResponseDTO(BaseModel):
     """DTO pour la réponse client."""
     id: UUID
@@ -82,6 +95,7 @@ class ClientResponseDTO(BaseModel):
     address: AddressDTO
     created_at: datetime
     updated_at: datetime
+    quote_summary: Optional[List[ClientQuoteSummaryDTO]] = None
 
     class Config:
         from_attributes = True
@@ -102,3 +116,34 @@ class ClientResponseDTO(BaseModel):
                 "updated_at": "2024-01-01T12:00:00Z"
             }
         }
+
+
+class ClientImportCandidateDTO(BaseModel):
+    """DTO pour un client issu d'un fichier d'import, à comparer aux clients existants."""
+    name: str = Field(..., min_length=1, description="Client name")
+    address: Optional[AddressDTO] = Field(None, description="Client address")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "name": "ACME Corporation",
+                "address": {
+                    "street": "123 Main Street",
+                    "city": "Paris",
+                    "zip_code": "75001",
+                    "country": "France"
+                }
+            }
+        }
+
+
+class ClientMatchDTO(BaseModel):
+    """DTO pour un client existant proche d'un client importé."""
+    client: ClientResponseDTO
+    score: float = Field(..., ge=0, le=1, description="Similarity score (0-1)")
+
+
+class ClientDuplicateReportDTO(BaseModel):
+    """DTO pour les doublons potentiels d'un client importé."""
+    index: int = Field(..., ge=0, description="Position of the candidate in the import file")
+    matches: List[ClientMatchDTO] = Field(default_factory=list, description="Matching clients, best first")
@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 from domain.clients.entities.client import Client
+from domain.clients.value_objects.client_match import ClientMatch, ClientMatchCandidate
+from domain.clients.value_objects.quote_summary import ClientQuoteSummary
 
 
 class ClientRepository(ABC):
@@ -22,11 +24,33 @@ class ClientRepository(ABC):
         """Récupère tous les clients avec pagination."""
         pass
 
+    @abstractmethod
+    async def find_all_with_quote_summary(
+        self, skip: int = 0, limit: int = 100
+    ) -> List[Tuple[Client, List[ClientQuoteSummary]]]:
+        """Récupère les clients avec leurs indicateurs financiers (un résumé par devise)."""
+        pass
+
+    @abstractmethod
+    async def find_quote_summary(self, client_id: UUID) -> List[ClientQuoteSummary]:
+        """Récupère les indicateurs financiers d'un client (un résumé par devise)."""
+        pass
+
     @abstractmethod
     async def find_by_email(self, email: str) -> Optional[Client]:
         """Trouve un client par son email."""
         pass
 
+    @abstractmethod
+    async def find_similar(
+        self,
+        candidates: List[ClientMatchCandidate],
+        threshold: float = 0.4,
+        limit: int = 3,
+    ) -> List[ClientMatch]:
+        """Trouve, pour chaque candidat, les clients existants au nom ou à l'adresse similaire."""
+        pass
+
     @abstractmethod
     async def delete(self, client_id: UUID) -> bool:
         """Supprime un client."""
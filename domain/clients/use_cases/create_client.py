@@ -1,14 +1,17 @@
+from typing import Optional
 from domain.clients.entities.client import Client
 from domain.clients.repositories.client_repository import ClientRepository
 from domain.clients.value_objects.address import Address
 from domain.clients.dto.client_dto import CreateClientDTO, ClientResponseDTO
+from domain.shared.event_publisher import EventPublisher
 
 
 class CreateClientUseCase:
     """Cas d'utilisation pour créer un client."""
 
-    def __init__(self, client_repository: ClientRepository):
+    def __init__(self, client_repository: ClientRepository, event_publisher: Optional[EventPublisher] = None):
         self.client_repository = client_repository
+        self.event_publisher = event_publisher
 
     async def execute(self, dto: CreateClientDTO) -> ClientResponseDTO:
         """Exécute le cas d'utilisation."""
@@ -38,9 +41,11 @@ class CreateClientUseCase:
         # Sauvegarder via le repository
         saved_client = await self.client_repository.save(client)
 
-        # TODO: Publier les événements de domaine
-        # event_publisher.publish(saved_client.domain_events)
-        saved_client.clear_domain_events()
+        # Publier les événements de domaine (diffusés après le commit) ; l'entité
+        # relue par save() n'en porte pas, ils sont sur celle qui a été modifiée
+        if self.event_publisher is not None:
+            self.event_publisher.publish(client.domain_events)
+        client.clear_domain_events()
 
         # Mapper vers le DTO de réponse
         return self._to_response_dto(saved_client)
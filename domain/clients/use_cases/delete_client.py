@@ -1,12 +1,15 @@
+from typing import Optional
 from uuid import UUID
 from domain.clients.repositories.client_repository import ClientRepository
+from domain.shared.event_publisher import EventPublisher
 
 
 class DeleteClientUseCase:
     """Cas d'utilisation pour supprimer un client."""
 
-    def __init__(self, client_repository: ClientRepository):
+    def __init__(self, client_repository: ClientRepository, event_publisher: Optional[EventPublisher] = None):
         self.client_repository = client_repository
+        self.event_publisher = event_publisher
 
     async def execute(self, client_id: UUID) -> bool:
         """Exécute le cas d'utilisation."""
@@ -19,8 +22,9 @@ class DeleteClientUseCase:
         # Marquer comme supprimé (événement de domaine)
         client.mark_as_deleted()
 
-        # TODO: Publier les événements de domaine
-        # event_publisher.publish(client.domain_events)
+        # Publier les événements de domaine (diffusés après le commit)
+        if self.event_publisher is not None:
+            self.event_publisher.publish(client.domain_events)
         client.clear_domain_events()
 
         # Supprimer via le repository
@@ -0,0 +1,75 @@
+from typing import List
+from domain.clients.entities.client import Client
+from domain.clients.repositories.client_repository import ClientRepository
+from domain.clients.value_objects.address import Address
+from domain.clients.value_objects.client_match import ClientMatchCandidate
+from domain.clients.dto.client_dto import (
+    ClientImportCandidateDTO,
+    ClientDuplicateReportDTO,
+    ClientMatchDTO,
+    ClientResponseDTO,
+    AddressDTO,
+)
+
+
+class FindDuplicateClientsUseCase:
+    """Cas d'utilisation pour détecter les doublons potentiels d'un fichier d'import."""
+
+    def __init__(self, client_repository: ClientRepository):
+        self.client_repository = client_repository
+
+    async def execute(
+        self,
+        candidates: List[ClientImportCandidateDTO],
+        threshold: float = 0.4,
+        limit: int = 3,
+    ) -> List[ClientDuplicateReportDTO]:
+        """Exécute le cas d'utilisation."""
+        if threshold < 0 or threshold > 1:
+            raise ValueError("Threshold must be between 0 and 1")
+        if limit < 1:
+            raise ValueError("Limit must be greater than 0")
+
+        match_candidates = [
+            ClientMatchCandidate(
+                name=dto.name,
+                address=Address(
+                    street=dto.address.street,
+                    city=dto.address.city,
+                    zip_code=dto.address.zip_code,
+                    country=dto.address.country,
+                ) if dto.address else None,
+            )
+            for dto in candidates
+        ]
+
+        # Le scoring est délégué au repository (index trigram côté base)
+        matches = await self.client_repository.find_similar(
+            match_candidates, threshold=threshold, limit=limit
+        )
+
+        reports = [ClientDuplicateReportDTO(index=index) for index in range(len(candidates))]
+        for match in matches:
+            reports[match.candidate_index].matches.append(
+                ClientMatchDTO(client=self._to_response_dto(match.client), score=match.score)
+            )
+
+        return reports
+
+    def _to_response_dto(self, client: Client) -> ClientResponseDTO:
+        """Convertit l'entité en DTO de réponse."""
+        return ClientResponseDTO(
+            id=client.id,
+            name=client.name,
+            contact_name=client.contact_name,
+            email=client.email,
+            phone=client.phone,
+            address=AddressDTO(
+                street=client.address.street,
+                city=client.address.city,
+                zip_code=client.address.zip_code,
+                country=client.address.country,
+            ),
+            created_at=client.created_at,
+            updated_at=client.updated_at,
+        )
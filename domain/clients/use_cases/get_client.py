@@ -1,7 +1,9 @@
+from typing import List, Optional
 from uuid import UUID
 from domain.clients.entities.client import Client
 from domain.clients.repositories.client_repository import ClientRepository
-from domain.clients.dto.client_dto import ClientResponseDTO, AddressDTO
+from domain.clients.value_objects.quote_summary import ClientQuoteSummary
+from domain.clients.dto.client_dto import ClientResponseDTO, AddressDTO, ClientQuoteSummaryDTO
 
 
 class GetClientUseCase:
@@ -10,7 +12,7 @@ class GetClientUseCase:
     def __init__(self, client_repository: ClientRepository):
         self.client_repository = client_repository
 
-    async def execute(self, client_id: UUID) -> ClientResponseDTO:
+    async def execute(self, client_id: UUID, include_quote_summary: bool = False) -> ClientResponseDTO:
         """Exécute le cas d'utilisation."""
 
         client = await self.client_repository.find_by_id(client_id)
@@ -18,9 +20,12 @@ class GetClientUseCase:
         if not client:
             raise ValueError(f"Client with id {client_id} not found")
 
-        return self._to_response_dto(client)
+        summaries = await self.client_repository.find_quote_summary(client_id) if include_quote_summary else None
+        return self._to_response_dto(client, summaries)
 
-    def _to_response_dto(self, client: Client) -> ClientResponseDTO:
+    def _to_response_dto(
+        self, client: Client, summaries: Optional[List[ClientQuoteSummary]] = None
+    ) -> ClientResponseDTO:
         """Convertit l'entité en DTO de réponse."""
         return ClientResponseDTO(
             id=client.id,
@@ -36,4 +41,14 @@ class GetClientUseCase:
             ),
             created_at=client.created_at,
             updated_at=client.updated_at,
+            quote_summary=[
+                ClientQuoteSummaryDTO(
+                    currency=summary.currency,
+                    quote_count=summary.quote_count,
+                    quoted_amount=summary.quoted_amount,
+                    accepted_amount=summary.accepted_amount,
+                    pending_amount=summary.pending_amount,
+                )
+                for summary in summaries
+            ] if summaries is not None else None,
         )
@@ -1,7 +1,8 @@
-from typing import List
+from typing import List, Optional
 from domain.clients.entities.client import Client
 from domain.clients.repositories.client_repository import ClientRepository
-from domain.clients.dto.client_dto import ClientResponseDTO, AddressDTO
+from domain.clients.value_objects.quote_summary import ClientQuoteSummary
+from domain.clients.dto.client_dto import ClientResponseDTO, AddressDTO, ClientQuoteSummaryDTO
 
 
 class ListClientsUseCase:
@@ -10,14 +11,27 @@ class ListClientsUseCase:
     def __init__(self, client_repository: ClientRepository):
         self.client_repository = client_repository
 
-    async def execute(self, skip: int = 0, limit: int = 100) -> List[ClientResponseDTO]:
+    async def execute(
+        self, skip: int = 0, limit: int = 100, include_quote_summary: bool = False
+    ) -> List[ClientResponseDTO]:
         """Exécute le cas d'utilisation."""
 
+        if include_quote_summary:
+            clients_with_summary = await self.client_repository.find_all_with_quote_summary(
+                skip=skip, limit=limit
+            )
+            return [
+                self._to_response_dto(client, summaries)
+                for client, summaries in clients_with_summary
+            ]
+
         clients = await self.client_repository.find_all(skip=skip, limit=limit)
 
         return [self._to_response_dto(client) for client in clients]
 
-    def _to_response_dto(self, client: Client) -> ClientResponseDTO:
+    def _to_response_dto(
+        self, client: Client, summaries: Optional[List[ClientQuoteSummary]] = None
+    ) -> ClientResponseDTO:
         """Convertit l'entité en DTO de réponse."""
         return ClientResponseDTO(
             id=client.id,
@@ -33,4 +47,14 @@ class ListClientsUseCase:
             ),
             created_at=client.created_at,
             updated_at=client.updated_at,
+            quote_summary=[
+                ClientQuoteSummaryDTO(
+                    currency=summary.currency,
+                    quote_count=summary.quote_count,
+                    quoted_amount=summary.quoted_amount,
+                    accepted_amount=summary.accepted_amount,
+                    pending_amount=summary.pending_amount,
+                )
+                for summary in summaries
+            ] if summaries is not None else None,
         )
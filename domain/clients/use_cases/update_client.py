@@ -1,15 +1,18 @@
+from typing import Optional
 from uuid import UUID
 from domain.clients.entities.client import Client
 from domain.clients.repositories.client_repository import ClientRepository
 from domain.clients.value_objects.address import Address
 from domain.clients.dto.client_dto import UpdateClientDTO, ClientResponseDTO, AddressDTO
+from domain.shared.event_publisher import EventPublisher
 
 
 class UpdateClientUseCase:
     """Cas d'utilisation pour mettre à jour un client."""
 
-    def __init__(self, client_repository: ClientRepository):
+    def __init__(self, client_repository: ClientRepository, event_publisher: Optional[EventPublisher] = None):
         self.client_repository = client_repository
+        self.event_publisher = event_publisher
 
     async def execute(self, client_id: UUID, dto: UpdateClientDTO) -> ClientResponseDTO:
         """Exécute le cas d'utilisation."""
@@ -47,9 +50,11 @@ class UpdateClientUseCase:
         # Sauvegarder via le repository
         updated_client = await self.client_repository.save(client)
 
-        # TODO: Publier les événements de domaine
-        # event_publisher.publish(updated_client.domain_events)
-        updated_client.clear_domain_events()
+        # Publier les événements de domaine (diffusés après le commit) ; l'entité
+        # relue par save() n'en porte pas, ils sont sur celle qui a été modifiée
+        if self.event_publisher is not None:
+            self.event_publisher.publish(client.domain_events)
+        client.clear_domain_events()
 
         # Mapper vers le DTO de réponse
         return self._to_response_dto(updated_client)
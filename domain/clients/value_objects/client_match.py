@@ -0,0 +1,35 @@
+from dataclasses import dataclass
+from typing import Optional, TYPE_CHECKING
+from domain.clients.value_objects.address import Address
+
+if TYPE_CHECKING:
+    from domain.clients.entities.client import Client
+
+
+@dataclass(frozen=True)
+class ClientMatchCandidate:
+    """Value Object représentant un client à rapprocher des clients existants."""
+
+    name: str
+    address: Optional[Address] = None
+
+    def __post_init__(self):
+        """Validation du Value Object."""
+        if not self.name or not self.name.strip():
+            raise ValueError("Candidate name cannot be empty")
+
+
+@dataclass(frozen=True)
+class ClientMatch:
+    """Value Object représentant un client existant similaire à un candidat."""
+
+    candidate_index: int
+    client: "Client"
+    score: float
+
+    def __post_init__(self):
+        """Validation du Value Object."""
+        if self.candidate_index < 0:
+            raise ValueError("Candidate index cannot be negative")
+        if self.score < 0 or self.score > 1:
+            raise ValueError("Score must be between 0 and 1")
@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+from decimal import Decimal
+
+
+@dataclass(frozen=True)
+class ClientQuoteSummary:
+    """Value Object représentant les indicateurs financiers d'un client pour une devise."""
+
+    currency: str
+    quote_count: int
+    quoted_amount: Decimal
+    accepted_amount: Decimal
+    pending_amount: Decimal
+
+    def __post_init__(self):
+        """Validation du Value Object."""
+        for field_name in ("quoted_amount", "accepted_amount", "pending_amount"):
+            value = getattr(self, field_name)
+            if not isinstance(value, Decimal):
+                object.__setattr__(self, field_name, Decimal(str(value)))
+
+        if not self.currency or len(self.currency) != 3:
+            raise ValueError("Currency must be a 3-letter code (e.g., EUR, USD)")
+        if self.quote_count < 0:
+            raise ValueError("Quote count cannot be negative")
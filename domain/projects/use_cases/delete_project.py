@@ -1,12 +1,15 @@
+from typing import Optional
 from uuid import UUID
 from domain.projects.repositories.project_repository import ProjectRepository
+from domain.shared.event_publisher import EventPublisher
 
 
 class DeleteProjectUseCase:
     """Cas d'utilisation pour supprimer un projet."""
 
-    def __init__(self, project_repository: ProjectRepository):
+    def __init__(self, project_repository: ProjectRepository, event_publisher: Optional[EventPublisher] = None):
         self.project_repository = project_repository
+        self.event_publisher = event_publisher
 
     async def execute(self, project_id: UUID) -> None:
         """Exécute le cas d'utilisation."""
@@ -18,8 +21,9 @@ class DeleteProjectUseCase:
         # Marquer comme supprimé (événement de domaine)
         project.mark_as_deleted()
 
-        # TODO: Publier les événements de domaine
-        # event_publisher.publish(project.domain_events)
+        # Publier les événements de domaine (diffusés après le commit)
+        if self.event_publisher is not None:
+            self.event_publisher.publish(project.domain_events)
 
         # Supprimer du repository
         await self.project_repository.delete(project_id)
@@ -1,13 +1,16 @@
+from typing import Optional
 from uuid import UUID
 from domain.projects.repositories.project_repository import ProjectRepository
 from domain.projects.dto.project_dto import UpdateProjectDTO, ProjectResponseDTO
+from domain.shared.event_publisher import EventPublisher
 
 
 class UpdateProjectUseCase:
     """Cas d'utilisation pour mettre à jour un projet."""
 
-    def __init__(self, project_repository: ProjectRepository):
+    def __init__(self, project_repository: ProjectRepository, event_publisher: Optional[EventPublisher] = None):
         self.project_repository = project_repository
+        self.event_publisher = event_publisher
 
     async def execute(self, project_id: UUID, dto: UpdateProjectDTO) -> ProjectResponseDTO:
         """Exécute le cas d'utilisation."""
@@ -28,9 +31,11 @@ class UpdateProjectUseCase:
         # Sauvegarder
         saved_project = await self.project_repository.save(project)
 
-        # TODO: Publier les événements de domaine
-        # event_publisher.publish(saved_project.domain_events)
-        saved_project.clear_domain_events()
+        # Publier les événements de domaine (diffusés après le commit) ; l'entité
+        # relue par save() n'en porte pas, ils sont sur celle qui a été modifiée
+        if self.event_publisher is not None:
+            self.event_publisher.publish(project.domain_events)
+        project.clear_domain_events()
 
         return ProjectResponseDTO(
             id=saved_project.id,
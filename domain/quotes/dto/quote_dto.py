@@ -4,6 +4,9 @@ from pydantic import BaseModel, Field
 from typing import Optional, List
 from decimal import Decimal
 from domain.quotes.value_objects.quote_status import QuoteStatus
+from domain.quotes.value_objects.quote_filter import QuoteFilter
+from domain.quotes.value_objects.quote_sort import QuoteSortField
+from domain.quotes.value_objects.quote_stats import QuoteStatsDimension
 
 
 class QuoteItemDTO(BaseModel):
@@ -99,6 +102,84 @@ class AddQuoteItemDTO(BaseModel):
         }
 
 
+class UpdateQuoteItemDTO(BaseModel):
+    """DTO pour modifier un item de devis."""
+    id: UUID = Field(..., description="Item ID")
+    description: Optional[str] = Field(None, min_length=1, description="Item description")
+    unit_price: Optional[Decimal] = Field(None, gt=0, description="Unit price")
+    quantity: Optional[Decimal] = Field(None, gt=0, description="Quantity")
+
+
+class EditQuoteItemsDTO(BaseModel):
+    """DTO pour ajouter, modifier et supprimer des items en une seule opération."""
+    add: List[AddQuoteItemDTO] = Field(default_factory=list, description="Items to add")
+    update: List[UpdateQuoteItemDTO] = Field(default_factory=list, description="Items to modify")
+    remove: List[UUID] = Field(default_factory=list, description="IDs of items to remove")
+
+
+class QuoteFilterDTO(BaseModel):
+    """DTO pour filtrer les devis."""
+    statuses: List[QuoteStatus] = Field(default_factory=list, description="Allowed statuses")
+    client_id: Optional[UUID] = Field(None, description="Client ID")
+    project_id: Optional[UUID] = Field(None, description="Project ID")
+    valid_until_from: Optional[date] = Field(None, description="Valid until lower bound (inclusive)")
+    valid_until_to: Optional[date] = Field(None, description="Valid until upper bound (inclusive)")
+    created_from: Optional[datetime] = Field(None, description="Creation lower bound (inclusive)")
+    created_to: Optional[datetime] = Field(None, description="Creation upper bound (inclusive)")
+    min_total_ttc: Optional[Decimal] = Field(None, ge=0, description="Minimum total TTC")
+    max_total_ttc: Optional[Decimal] = Field(None, ge=0, description="Maximum total TTC")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "statuses": ["sent"],
+                "valid_until_from": "2024-03-25",
+                "valid_until_to": "2024-03-31",
+                "min_total_ttc": 1000.00
+            }
+        }
+
+    def to_value_object(self) -> QuoteFilter:
+        """Convertit le DTO en value object de filtre."""
+        return QuoteFilter(
+            statuses=tuple(self.statuses),
+            client_id=self.client_id,
+            project_id=self.project_id,
+            valid_until_from=self.valid_until_from,
+            valid_until_to=self.valid_until_to,
+            created_from=self.created_from,
+            created_to=self.created_to,
+            min_total_ttc=self.min_total_ttc,
+            max_total_ttc=self.max_total_ttc,
+        )
+
+
+class QuoteSortDTO(BaseModel):
+    """DTO pour trier les devis."""
+    field: QuoteSortField = Field(default=QuoteSortField.CREATED_AT, description="Sort field")
+    descending: bool = Field(default=True, description="Descending order")
+
+
+class QuoteStatsRequestDTO(BaseModel):
+    """DTO pour demander des statistiques agrégées sur les devis."""
+    group_by: List[QuoteStatsDimension] = Field(default_factory=list, description="Grouping dimensions")
+    filter: Optional[QuoteFilterDTO] = Field(None, description="Quote filter")
+
+
+class QuoteStatsDTO(BaseModel):
+    """DTO pour un agrégat de devis."""
+    status: Optional[QuoteStatus] = None
+    client_id: Optional[UUID] = None
+    month: Optional[date] = None
+    currency: str
+    count: int
+    total_ht: Decimal
+    total_ttc: Decimal
+
+    class Config:
+        from_attributes = True
+
+
 class QuoteResponseDTO(BaseModel):
     """DTO pour la réponse devis."""
     id: UUID
@@ -134,3 +215,11 @@ class QuoteResponseDTO(BaseModel):
                 "items": []
             }
         }
+
+
+class QuoteStatusChangeResultDTO(BaseModel):
+    """DTO du résultat d'un changement de statut dans un traitement groupé."""
+    quote_id: UUID
+    success: bool
+    status: Optional[QuoteStatus] = None
+    error: Optional[str] = None
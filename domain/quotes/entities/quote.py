@@ -103,6 +103,20 @@ class Quote:
         self._items = [item for item in self._items if item.id != item_id]
         self._updated_at = datetime.utcnow()
 
+    def update_item(
+        self,
+        item_id: UUID,
+        description: Optional[str] = None,
+        unit_price: Optional[Money] = None,
+        quantity: Optional[Decimal] = None,
+    ):
+        """Met à jour un item du devis."""
+        item = next((item for item in self._items if item.id == item_id), None)
+        if item is None:
+            raise ValueError(f"Item with ID {item_id} not found in quote")
+        item.update(description=description, unit_price=unit_price, quantity=quantity)
+        self._updated_at = datetime.utcnow()
+
     def update(
         self,
         title: Optional[str] = None,
@@ -144,6 +158,7 @@ class Quote:
         self.add_domain_event(
             QuoteSent(
                 quote_id=self.id,
+                client_id=self.client_id,
                 occurred_at=self._updated_at,
             )
         )
@@ -161,6 +176,7 @@ class Quote:
         self.add_domain_event(
             QuoteAccepted(
                 quote_id=self.id,
+                client_id=self.client_id,
                 occurred_at=self._updated_at,
             )
         )
@@ -178,6 +194,7 @@ class Quote:
         self.add_domain_event(
             QuoteRejected(
                 quote_id=self.id,
+                client_id=self.client_id,
                 occurred_at=self._updated_at,
             )
         )
@@ -192,6 +209,7 @@ class Quote:
         self.add_domain_event(
             QuoteExpired(
                 quote_id=self.id,
+                client_id=self.client_id,
                 occurred_at=self._updated_at,
             )
         )
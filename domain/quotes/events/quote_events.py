@@ -30,24 +30,28 @@ class QuoteUpdated(DomainEvent):
 class QuoteSent(DomainEvent):
     """Événement émis lorsqu'un devis est envoyé."""
     quote_id: UUID
+    client_id: UUID
 
 
 @dataclass(frozen=True)
 class QuoteAccepted(DomainEvent):
     """Événement émis lorsqu'un devis est accepté."""
     quote_id: UUID
+    client_id: UUID
 
 
 @dataclass(frozen=True)
 class QuoteRejected(DomainEvent):
     """Événement émis lorsqu'un devis est rejeté."""
     quote_id: UUID
+    client_id: UUID
 
 
 @dataclass(frozen=True)
 class QuoteExpired(DomainEvent):
     """Événement émis lorsqu'un devis est expiré."""
     quote_id: UUID
+    client_id: UUID
 
 
 @dataclass(frozen=True)
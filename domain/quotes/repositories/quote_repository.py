@@ -1,7 +1,12 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import AsyncIterator, List, Optional
 from uuid import UUID
 from domain.quotes.entities.quote import Quote
+from domain.quotes.value_objects.quote_status import QuoteStatus
+from domain.quotes.value_objects.quote_filter import QuoteFilter
+from domain.quotes.value_objects.quote_sort import QuoteSort
+from domain.quotes.value_objects.quote_stats import QuoteStatsDimension, QuoteStatsRow
 
 
 class QuoteRepository(ABC):
@@ -17,11 +22,52 @@ class QuoteRepository(ABC):
         """Trouve un devis par son ID."""
         pass
 
+    @abstractmethod
+    async def find_by_ids(self, quote_ids: List[UUID], for_update: bool = False) -> List[Quote]:
+        """Trouve plusieurs devis en une requête (verrouillés si ``for_update``)."""
+        pass
+
+    @abstractmethod
+    async def update_status(self, quote_ids: List[UUID], status: QuoteStatus, updated_at: datetime) -> int:
+        """Passe les devis au statut donné en une mise à jour ensembliste."""
+        pass
+
     @abstractmethod
     async def find_all(self, skip: int = 0, limit: int = 100) -> List[Quote]:
         """Récupère tous les devis avec pagination."""
         pass
 
+    @abstractmethod
+    async def find_by_filter(
+        self,
+        quote_filter: QuoteFilter,
+        sort: Optional[QuoteSort] = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> List[Quote]:
+        """Récupère les devis correspondant aux critères, triés et paginés."""
+        pass
+
+    @abstractmethod
+    def stream_by_filter(
+        self,
+        quote_filter: QuoteFilter,
+        sort: Optional[QuoteSort] = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> AsyncIterator[Quote]:
+        """Produit les devis correspondant aux critères au fur et à mesure de leur lecture."""
+        pass
+
+    @abstractmethod
+    async def aggregate(
+        self,
+        group_by: List[QuoteStatsDimension],
+        quote_filter: QuoteFilter,
+    ) -> List[QuoteStatsRow]:
+        """Calcule le nombre et les totaux des devis regroupés selon les axes demandés."""
+        pass
+
     @abstractmethod
     async def find_by_client_id(self, client_id: UUID) -> List[Quote]:
         """Trouve tous les devis d'un client."""
@@ -0,0 +1,60 @@
+from typing import List, Optional
+from uuid import UUID
+from domain.quotes.repositories.quote_repository import QuoteRepository
+from domain.quotes.dto.quote_dto import QuoteStatusChangeResultDTO
+from domain.quotes.value_objects.quote_status import QuoteStatus
+from domain.quotes.use_cases.change_quote_status import apply_status_change
+from domain.shared.event_publisher import EventPublisher
+
+
+class BulkChangeQuoteStatusUseCase:
+    """Cas d'utilisation pour changer le statut de plusieurs devis en une opération."""
+
+    def __init__(self, quote_repository: QuoteRepository, event_publisher: Optional[EventPublisher] = None):
+        self.quote_repository = quote_repository
+        self.event_publisher = event_publisher
+
+    async def execute(self, quote_ids: List[UUID], new_status: QuoteStatus) -> List[QuoteStatusChangeResultDTO]:
+        """Exécute le cas d'utilisation ; un résultat par ID, dans l'ordre demandé."""
+        if new_status == QuoteStatus.DRAFT:
+            raise ValueError("Quotes cannot be moved back to draft")
+
+        # Une seule requête, lignes verrouillées jusqu'au commit
+        unique_ids = list(dict.fromkeys(quote_ids))
+        quotes = {quote.id: quote for quote in await self.quote_repository.find_by_ids(unique_ids, for_update=True)}
+
+        results = {}
+        changed = []
+        for quote_id in unique_ids:
+            quote = quotes.get(quote_id)
+            if quote is None:
+                results[quote_id] = QuoteStatusChangeResultDTO(
+                    quote_id=quote_id, success=False, error=f"Quote with ID {quote_id} not found"
+                )
+                continue
+            # Règles de transition de l'entité, appliquées en mémoire
+            try:
+                apply_status_change(quote, new_status)
+            except ValueError as error:
+                results[quote_id] = QuoteStatusChangeResultDTO(
+                    quote_id=quote_id, success=False, status=quote.status, error=str(error)
+                )
+                continue
+            changed.append(quote)
+            results[quote_id] = QuoteStatusChangeResultDTO(quote_id=quote_id, success=True, status=quote.status)
+
+        if changed:
+            # Mise à jour ensembliste des devis validés
+            await self.quote_repository.update_status(
+                [quote.id for quote in changed],
+                new_status,
+                updated_at=max(quote.updated_at for quote in changed),
+            )
+
+            # Publier les événements de domaine (diffusés après le commit)
+            for quote in changed:
+                if self.event_publisher is not None:
+                    self.event_publisher.publish(quote.domain_events)
+                quote.clear_domain_events()
+
+        return [results[quote_id] for quote_id in quote_ids]
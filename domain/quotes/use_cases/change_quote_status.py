@@ -1,14 +1,30 @@
+from typing import Optional
 from uuid import UUID
+from domain.quotes.entities.quote import Quote
 from domain.quotes.repositories.quote_repository import QuoteRepository
 from domain.quotes.dto.quote_dto import QuoteResponseDTO, QuoteItemDTO
 from domain.quotes.value_objects.quote_status import QuoteStatus
+from domain.shared.event_publisher import EventPublisher
+
+
+def apply_status_change(quote: Quote, new_status: QuoteStatus):
+    """Applique la transition demandée via les règles de l'entité (ValueError si interdite)."""
+    if new_status == QuoteStatus.SENT:
+        quote.send()
+    elif new_status == QuoteStatus.ACCEPTED:
+        quote.accept()
+    elif new_status == QuoteStatus.REJECTED:
+        quote.reject()
+    elif new_status == QuoteStatus.EXPIRED:
+        quote.mark_as_expired()
 
 
 class ChangeQuoteStatusUseCase:
     """Cas d'utilisation pour changer le statut d'un devis."""
 
-    def __init__(self, quote_repository: QuoteRepository):
+    def __init__(self, quote_repository: QuoteRepository, event_publisher: Optional[EventPublisher] = None):
         self.quote_repository = quote_repository
+        self.event_publisher = event_publisher
 
     async def execute(self, quote_id: UUID, new_status: QuoteStatus) -> QuoteResponseDTO:
         """Exécute le cas d'utilisation."""
@@ -18,20 +34,16 @@ class ChangeQuoteStatusUseCase:
             raise ValueError(f"Quote with ID {quote_id} not found")
 
         # Appliquer le changement de statut
-        if new_status == QuoteStatus.SENT:
-            quote.send()
-        elif new_status == QuoteStatus.ACCEPTED:
-            quote.accept()
-        elif new_status == QuoteStatus.REJECTED:
-            quote.reject()
-        elif new_status == QuoteStatus.EXPIRED:
-            quote.mark_as_expired()
+        apply_status_change(quote, new_status)
 
         # Sauvegarder
         saved_quote = await self.quote_repository.save(quote)
 
-        # TODO: Publier les événements de domaine
-        saved_quote.clear_domain_events()
+        # Publier les événements de domaine (diffusés après le commit) ; l'entité
+        # relue par save() n'en porte pas, ils sont sur celle qui a été modifiée
+        if self.event_publisher is not None:
+            self.event_publisher.publish(quote.domain_events)
+        quote.clear_domain_events()
 
         # Mapper vers le DTO de réponse
         items_dto = [
@@ -1,3 +1,4 @@
+from typing import Optional
 from decimal import Decimal
 from domain.quotes.entities.quote import Quote
 from domain.quotes.entities.quote_item import QuoteItem
@@ -5,13 +6,15 @@ from domain.quotes.repositories.quote_repository import QuoteRepository
 from domain.quotes.value_objects.money import Money
 from domain.quotes.value_objects.tax_rate import TaxRate
 from domain.quotes.dto.quote_dto import CreateQuoteDTO, QuoteResponseDTO, QuoteItemDTO
+from domain.shared.event_publisher import EventPublisher
 
 
 class CreateQuoteUseCase:
     """Cas d'utilisation pour créer un devis."""
 
-    def __init__(self, quote_repository: QuoteRepository):
+    def __init__(self, quote_repository: QuoteRepository, event_publisher: Optional[EventPublisher] = None):
         self.quote_repository = quote_repository
+        self.event_publisher = event_publisher
 
     async def execute(self, dto: CreateQuoteDTO) -> QuoteResponseDTO:
         """Exécute le cas d'utilisation."""
@@ -40,8 +43,11 @@ class CreateQuoteUseCase:
         # Sauvegarder via le repository
         saved_quote = await self.quote_repository.save(quote)
 
-        # TODO: Publier les événements de domaine
-        saved_quote.clear_domain_events()
+        # Publier les événements de domaine (diffusés après le commit) ; l'entité
+        # relue par save() n'en porte pas, ils sont sur celle qui a été modifiée
+        if self.event_publisher is not None:
+            self.event_publisher.publish(quote.domain_events)
+        quote.clear_domain_events()
 
         # Mapper vers le DTO de réponse
         return self._to_response_dto(saved_quote)
@@ -1,12 +1,15 @@
+from typing import Optional
 from uuid import UUID
 from domain.quotes.repositories.quote_repository import QuoteRepository
+from domain.shared.event_publisher import EventPublisher
 
 
 class DeleteQuoteUseCase:
     """Cas d'utilisation pour supprimer un devis."""
 
-    def __init__(self, quote_repository: QuoteRepository):
+    def __init__(self, quote_repository: QuoteRepository, event_publisher: Optional[EventPublisher] = None):
         self.quote_repository = quote_repository
+        self.event_publisher = event_publisher
 
     async def execute(self, quote_id: UUID) -> None:
         """Exécute le cas d'utilisation."""
@@ -18,7 +21,9 @@ class DeleteQuoteUseCase:
         # Marquer comme supprimé (événement de domaine)
         quote.mark_as_deleted()
 
-        # TODO: Publier les événements de domaine
+        # Publier les événements de domaine (diffusés après le commit)
+        if self.event_publisher is not None:
+            self.event_publisher.publish(quote.domain_events)
 
         # Supprimer du repository
         await self.quote_repository.delete(quote_id)
@@ -0,0 +1,86 @@
+from uuid import UUID
+from domain.quotes.entities.quote import Quote
+from domain.quotes.entities.quote_item import QuoteItem
+from domain.quotes.repositories.quote_repository import QuoteRepository
+from domain.quotes.value_objects.money import Money
+from domain.quotes.dto.quote_dto import EditQuoteItemsDTO, QuoteResponseDTO, QuoteItemDTO
+
+
+class EditQuoteItemsUseCase:
+    """Cas d'utilisation pour ajouter, modifier et supprimer des items d'un devis en une fois."""
+
+    def __init__(self, quote_repository: QuoteRepository):
+        self.quote_repository = quote_repository
+
+    async def execute(self, quote_id: UUID, dto: EditQuoteItemsDTO) -> QuoteResponseDTO:
+        """Exécute le cas d'utilisation."""
+        quote = await self.quote_repository.find_by_id(quote_id)
+
+        if not quote:
+            raise ValueError(f"Quote with ID {quote_id} not found")
+
+        # Vérifier les items ciblés avant toute modification (tout ou rien)
+        existing_ids = {item.id for item in quote.items}
+        unknown_ids = [item_id for item_id in dto.remove if item_id not in existing_ids]
+        unknown_ids += [item_dto.id for item_dto in dto.update if item_dto.id not in existing_ids]
+        if unknown_ids:
+            raise ValueError(f"Items not found in quote {quote_id}: {', '.join(map(str, unknown_ids))}")
+
+        for item_id in dto.remove:
+            quote.remove_item(item_id)
+
+        for item_dto in dto.update:
+            quote.update_item(
+                item_dto.id,
+                description=item_dto.description,
+                unit_price=Money(amount=item_dto.unit_price, currency=quote.currency)
+                if item_dto.unit_price is not None
+                else None,
+                quantity=item_dto.quantity,
+            )
+
+        for item_dto in dto.add:
+            quote.add_item(
+                QuoteItem.create(
+                    quote_id=quote.id,
+                    description=item_dto.description,
+                    unit_price=Money(amount=item_dto.unit_price, currency=quote.currency),
+                    quantity=item_dto.quantity,
+                )
+            )
+
+        # Une seule sauvegarde pour l'ensemble des modifications
+        saved_quote = await self.quote_repository.save(quote)
+
+        return self._to_response_dto(saved_quote)
+
+    def _to_response_dto(self, quote: Quote) -> QuoteResponseDTO:
+        """Convertit l'entité en DTO de réponse."""
+        items_dto = [
+            QuoteItemDTO(
+                id=item.id,
+                quote_id=item.quote_id,
+                description=item.description,
+                unit_price=item.unit_price.amount,
+                quantity=item.quantity,
+                total=item.total.amount,
+                currency=item.unit_price.currency,
+            )
+            for item in quote.items
+        ]
+
+        return QuoteResponseDTO(
+            id=quote.id,
+            client_id=quote.client_id,
+            project_id=quote.project_id,
+            title=quote.title,
+            status=quote.status,
+            currency=quote.currency,
+            total_ht=quote.total_ht.amount,
+            total_ttc=quote.total_ttc.amount,
+            tax_rate=quote.tax_rate.rate,
+            created_at=quote.created_at,
+            updated_at=quote.updated_at,
+            valid_until=quote.valid_until,
+            items=items_dto,
+        )
@@ -0,0 +1,32 @@
+from typing import List
+from domain.quotes.repositories.quote_repository import QuoteRepository
+from domain.quotes.value_objects.quote_filter import QuoteFilter
+from domain.quotes.dto.quote_dto import QuoteStatsRequestDTO, QuoteStatsDTO
+
+
+class GetQuoteStatsUseCase:
+    """Cas d'utilisation pour calculer des statistiques agrégées sur les devis."""
+
+    def __init__(self, quote_repository: QuoteRepository):
+        self.quote_repository = quote_repository
+
+    async def execute(self, dto: QuoteStatsRequestDTO) -> List[QuoteStatsDTO]:
+        """Exécute le cas d'utilisation."""
+        # Dédoublonner les axes en conservant l'ordre demandé
+        group_by = list(dict.fromkeys(dto.group_by))
+
+        quote_filter = dto.filter.to_value_object() if dto.filter else QuoteFilter()
+        rows = await self.quote_repository.aggregate(group_by, quote_filter)
+
+        return [
+            QuoteStatsDTO(
+                status=row.status,
+                client_id=row.client_id,
+                month=row.month,
+                currency=row.currency,
+                count=row.count,
+                total_ht=row.total_ht,
+                total_ttc=row.total_ttc,
+            )
+            for row in rows
+        ]
@@ -1,6 +1,8 @@
-from typing import List
+from typing import AsyncIterator, List, Optional
 from domain.quotes.repositories.quote_repository import QuoteRepository
-from domain.quotes.dto.quote_dto import QuoteResponseDTO, QuoteItemDTO
+from domain.quotes.value_objects.quote_filter import QuoteFilter
+from domain.quotes.value_objects.quote_sort import QuoteSort
+from domain.quotes.dto.quote_dto import QuoteResponseDTO, QuoteItemDTO, QuoteFilterDTO, QuoteSortDTO
 
 
 class ListQuotesUseCase:
@@ -9,12 +11,42 @@ class ListQuotesUseCase:
     def __init__(self, quote_repository: QuoteRepository):
         self.quote_repository = quote_repository
 
-    async def execute(self, skip: int = 0, limit: int = 100) -> List[QuoteResponseDTO]:
+    async def execute(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        filter_dto: Optional[QuoteFilterDTO] = None,
+        sort_dto: Optional[QuoteSortDTO] = None,
+    ) -> List[QuoteResponseDTO]:
         """Exécute le cas d'utilisation."""
-        quotes = await self.quote_repository.find_all(skip=skip, limit=limit)
+        if filter_dto is None and sort_dto is None:
+            quotes = await self.quote_repository.find_all(skip=skip, limit=limit)
+        else:
+            quotes = await self.quote_repository.find_by_filter(
+                filter_dto.to_value_object() if filter_dto else QuoteFilter(),
+                sort=QuoteSort(field=sort_dto.field, descending=sort_dto.descending) if sort_dto else None,
+                skip=skip,
+                limit=limit,
+            )
 
         return [self._to_response_dto(quote) for quote in quotes]
 
+    async def stream(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        filter_dto: Optional[QuoteFilterDTO] = None,
+        sort_dto: Optional[QuoteSortDTO] = None,
+    ) -> AsyncIterator[QuoteResponseDTO]:
+        """Produit les devis un à un, dès leur lecture par le repository."""
+        async for quote in self.quote_repository.stream_by_filter(
+            filter_dto.to_value_object() if filter_dto else QuoteFilter(),
+            sort=QuoteSort(field=sort_dto.field, descending=sort_dto.descending) if sort_dto else None,
+            skip=skip,
+            limit=limit,
+        ):
+            yield self._to_response_dto(quote)
+
     def _to_response_dto(self, quote) -> QuoteResponseDTO:
         items_dto = [
             QuoteItemDTO(
@@ -0,0 +1,39 @@
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Optional, Tuple
+from uuid import UUID
+from domain.quotes.value_objects.quote_status import QuoteStatus
+
+
+@dataclass(frozen=True)
+class QuoteFilter:
+    """Value Object représentant les critères de recherche de devis."""
+
+    statuses: Tuple[QuoteStatus, ...] = ()
+    client_id: Optional[UUID] = None
+    project_id: Optional[UUID] = None
+    valid_until_from: Optional[date] = None
+    valid_until_to: Optional[date] = None
+    created_from: Optional[datetime] = None
+    created_to: Optional[datetime] = None
+    min_total_ttc: Optional[Decimal] = None
+    max_total_ttc: Optional[Decimal] = None
+
+    def __post_init__(self):
+        """Validation du Value Object."""
+        if not isinstance(self.statuses, tuple):
+            object.__setattr__(self, "statuses", tuple(self.statuses))
+
+        if self.valid_until_from and self.valid_until_to and self.valid_until_from > self.valid_until_to:
+            raise ValueError("valid_until_from cannot be after valid_until_to")
+        if self.created_from and self.created_to and self.created_from > self.created_to:
+            raise ValueError("created_from cannot be after created_to")
+        if self.min_total_ttc is not None and self.min_total_ttc < 0:
+            raise ValueError("min_total_ttc cannot be negative")
+        if (
+            self.min_total_ttc is not None
+            and self.max_total_ttc is not None
+            and self.min_total_ttc > self.max_total_ttc
+        ):
+            raise ValueError("min_total_ttc cannot be greater than max_total_ttc")
@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+from enum import Enum
+
+
+class QuoteSortField(str, Enum):
+    """Énumération des champs de tri des devis."""
+
+    CREATED_AT = "created_at"
+    VALID_UNTIL = "valid_until"
+    TOTAL_HT = "total_ht"
+    TOTAL_TTC = "total_ttc"
+    TITLE = "title"
+
+    def __str__(self) -> str:
+        return self.value
+
+
+@dataclass(frozen=True)
+class QuoteSort:
+    """Value Object représentant l'ordre de tri des devis."""
+
+    field: QuoteSortField = QuoteSortField.CREATED_AT
+    descending: bool = True
+
+    def __post_init__(self):
+        """Validation du Value Object."""
+        if not isinstance(self.field, QuoteSortField):
+            object.__setattr__(self, "field", QuoteSortField(self.field))
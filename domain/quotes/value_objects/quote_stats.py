@@ -0,0 +1,40 @@
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from enum import Enum
+from typing import Optional
+from uuid import UUID
+from domain.quotes.value_objects.quote_status import QuoteStatus
+
+
+class QuoteStatsDimension(str, Enum):
+    """Énumération des axes de regroupement des statistiques de devis."""
+
+    STATUS = "status"
+    CLIENT = "client"
+    MONTH = "month"
+
+    def __str__(self) -> str:
+        return self.value
+
+
+@dataclass(frozen=True)
+class QuoteStatsRow:
+    """Value Object représentant un agrégat de devis pour une combinaison d'axes.
+
+    Les axes non demandés valent None. Les montants ne sont jamais
+    additionnés entre devises : la devise fait toujours partie du groupe.
+    """
+
+    currency: str
+    count: int
+    total_ht: Decimal
+    total_ttc: Decimal
+    status: Optional[QuoteStatus] = None
+    client_id: Optional[UUID] = None
+    month: Optional[date] = None
+
+    def __post_init__(self):
+        """Validation du Value Object."""
+        if self.count < 0:
+            raise ValueError("Count cannot be negative")
@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+
+class EventPublisher(ABC):
+    """Interface de publication des événements de domaine (Port)."""
+
+    @abstractmethod
+    def publish(self, events: List) -> None:
+        """Publie les événements émis par une entité."""
+        pass
@@ -0,0 +1,389 @@
+"""Génère un jeu de données synthétique volumineux (tests de charge, dimensionnement).
+
+Usage : python -m infrastructure.commands.generate_dataset [--scale 1.0] [--seed 42] [--reset]
+
+À l'échelle 1 : 100 000 clients, 500 000 projets (modules et features),
+1 000 000 de devis et environ 5 500 000 lignes de devis. Les données sont
+déterministes pour une graine et des paramètres donnés, respectent les
+invariants du domaine (allocation des features sommant à 1, échéance des
+devis postérieure à leur création, totaux cohérents avec les lignes) et
+sont chargées par insertions groupées, sans passer par les cas
+d'utilisation. Le read model client_quote_summary est reconstruit à la fin.
+"""
+import argparse
+import asyncio
+import hashlib
+import random
+import time
+import uuid
+from array import array
+from dataclasses import dataclass
+from datetime import date, datetime, time as dt_time, timedelta, timezone
+from decimal import Decimal
+from typing import Dict, Iterator, List, Tuple
+
+from sqlalchemy import insert
+
+from domain.projects.entities.feature import Feature
+from domain.projects.value_objects.complexity import Complexity
+from domain.projects.value_objects.project_period import ProjectPeriod
+from domain.projects.value_objects.project_status import ProjectStatus
+from domain.quotes.entities.quote import Quote
+from domain.quotes.entities.quote_item import QuoteItem
+from domain.quotes.value_objects.money import Money
+from domain.quotes.value_objects.quote_status import QuoteStatus
+from domain.quotes.value_objects.tax_rate import TaxRate
+from infrastructure.database.session import Base, engine, init_db, async_session_maker
+from infrastructure.persistence.sqlalchemy_models import (
+    ClientModel,
+    ProjectModel,
+    ModuleModel,
+    FeatureModel,
+    QuoteModel,
+    QuoteItemModel,
+)
+from infrastructure.persistence.client_quote_summary_projector import ClientQuoteSummaryProjector
+
+CENT = Decimal("0.01")
+ROLES = ("developer", "designer", "project_manager", "qa")
+CITIES = ("Paris", "Lyon", "Marseille", "Toulouse", "Nantes", "Lille", "Bordeaux", "Rennes", "Strasbourg", "Nice")
+STREETS = ("rue de la République", "avenue Jean Jaurès", "boulevard Victor Hugo", "rue Pasteur", "place de la Gare")
+COMPANY_SUFFIXES = ("SAS", "SARL", "SA", "Conseil", "Studio", "Industries", "Services")
+TAX_RATES = (Decimal("0.20"), Decimal("0.10"), Decimal("0.055"))
+CURRENCIES = ("EUR", "EUR", "EUR", "EUR", "USD", "GBP")
+
+
+@dataclass(frozen=True)
+class DatasetSpec:
+    """Volumes et paramètres de génération."""
+
+    clients: int = 100_000
+    projects: int = 500_000
+    max_modules_per_project: int = 5
+    max_features_per_module: int = 6
+    quotes: int = 1_000_000
+    max_items_per_quote: int = 10
+    seed: int = 42
+    # Date de référence fixe : le jeu généré ne dépend pas du jour d'exécution
+    reference_date: date = date(2025, 1, 1)
+    batch_size: int = 5_000
+
+    @staticmethod
+    def scaled(scale: float, **overrides) -> "DatasetSpec":
+        """Volumes de référence multipliés par ``scale`` (au moins une ligne par table)."""
+        base = DatasetSpec(**overrides)
+        return DatasetSpec(
+            clients=max(int(base.clients * scale), 1),
+            projects=max(int(base.projects * scale), 1),
+            max_modules_per_project=base.max_modules_per_project,
+            max_features_per_module=base.max_features_per_module,
+            quotes=max(int(base.quotes * scale), 1),
+            max_items_per_quote=base.max_items_per_quote,
+            seed=base.seed,
+            reference_date=base.reference_date,
+            batch_size=base.batch_size,
+        )
+
+
+class DatasetGenerator:
+    """Produit les lignes de chaque table par lots, de façon déterministe.
+
+    Chaque table a son propre flux aléatoire et les identifiants sont
+    dérivés de (graine, table, rang) : les références entre tables se
+    calculent sans garder les lignes en mémoire.
+    """
+
+    def __init__(self, spec: DatasetSpec):
+        self.spec = spec
+        self.reference = datetime.combine(spec.reference_date, dt_time(12, 0), tzinfo=timezone.utc)
+        # Client de chaque projet (4 octets par projet)
+        self.project_clients = array("I")
+
+    def _rng(self, table: str) -> random.Random:
+        return random.Random(f"{self.spec.seed}:{table}")
+
+    def _uuid(self, table: str, index: int) -> uuid.UUID:
+        digest = hashlib.blake2b(f"{self.spec.seed}:{table}:{index}".encode(), digest_size=16).digest()
+        return uuid.UUID(bytes=digest, version=4)
+
+    def _batches(self, total: int) -> Iterator[range]:
+        for start in range(0, total, self.spec.batch_size):
+            yield range(start, min(start + self.spec.batch_size, total))
+
+    def clients(self) -> Iterator[List[Dict]]:
+        rng = self._rng("clients")
+        for batch in self._batches(self.spec.clients):
+            rows = []
+            for index in batch:
+                created_at = self.reference - timedelta(days=rng.randint(30, 5 * 365), seconds=rng.randint(0, 86399))
+                rows.append(
+                    {
+                        "id": self._uuid("clients", index),
+                        "name": f"{rng.choice(CITIES)} {rng.choice(COMPANY_SUFFIXES)} {index:07d}",
+                        "contact_name": f"Contact {index:07d}",
+                        # Unicité garantie par le rang
+                        "email": f"contact{index:07d}@client.example",
+                        "phone": f"+33 1 {rng.randint(10, 99)} {rng.randint(10, 99)} {rng.randint(10, 99)} {rng.randint(10, 99)}",
+                        "address_street": f"{rng.randint(1, 250)} {rng.choice(STREETS)}",
+                        "address_city": rng.choice(CITIES),
+                        "address_zip_code": f"{rng.randint(1000, 95999):05d}",
+                        "address_country": "France",
+                        "created_at": created_at,
+                        "updated_at": created_at,
+                    }
+                )
+            yield rows
+
+    def _allocation(self, rng: random.Random) -> Dict[str, float]:
+        """Répartition entre 1 et 4 profils, en pourcentages entiers sommant à 100."""
+        roles = rng.sample(ROLES, rng.randint(1, len(ROLES)))
+        cuts = sorted(rng.sample(range(1, 100), len(roles) - 1))
+        parts = [upper - lower for lower, upper in zip([0] + cuts, cuts + [100])]
+        return {role: part / 100 for role, part in zip(roles, parts)}
+
+    def projects(self) -> Iterator[Tuple[List[Dict], List[Dict], List[Dict]]]:
+        """Lots (projets, modules, features)."""
+        rng = self._rng("projects")
+        complexities = list(Complexity)
+        statuses = list(ProjectStatus)
+        module_index = feature_index = 0
+
+        for batch in self._batches(self.spec.projects):
+            projects, modules, features = [], [], []
+            for index in batch:
+                client_index = rng.randrange(self.spec.clients)
+                self.project_clients.append(client_index)
+                project_id = self._uuid("projects", index)
+                status = rng.choice(statuses)
+                start_date = self.spec.reference_date + timedelta(days=rng.randint(-3 * 365, 90))
+                end_date = None
+                if status in (ProjectStatus.COMPLETED, ProjectStatus.CANCELLED) or rng.random() < 0.3:
+                    end_date = start_date + timedelta(days=rng.randint(7, 365))
+                created_at = datetime.combine(start_date, dt_time(9, 0), tzinfo=timezone.utc) - timedelta(
+                    days=rng.randint(0, 60)
+                )
+                projects.append(
+                    {
+                        "id": project_id,
+                        "client_id": self._uuid("clients", client_index),
+                        "name": f"Project {index:07d}",
+                        "description": f"Synthetic project {index} ({status.value})",
+                        "status": status,
+                        "start_date": start_date,
+                        "end_date": end_date,
+                        "created_at": created_at,
+                        "updated_at": created_at,
+                    }
+                )
+
+                for module_rank in range(rng.randint(1, self.spec.max_modules_per_project)):
+                    module_id = self._uuid("modules", module_index)
+                    module_index += 1
+                    modules.append({"id": module_id, "project_id": project_id, "name": f"Module {module_rank + 1}"})
+
+                    for feature_rank in range(rng.randint(1, self.spec.max_features_per_module)):
+                        features.append(
+                            {
+                                "id": self._uuid("features", feature_index),
+                                "module_id": module_id,
+                                "name": f"Feature {feature_rank + 1}",
+                                "description": "Synthetic feature",
+                                "complexity": rng.choice(complexities),
+                                "profile_allocation": self._allocation(rng),
+                                "extra_hours": rng.choice((0, 0, 0, 2, 4, 8)),
+                            }
+                        )
+                        feature_index += 1
+
+            yield projects, modules, features
+
+    def _quote_status(self, rng: random.Random, valid_until: date) -> QuoteStatus:
+        """Statut plausible : les devis échus sont clos, les autres encore ouverts."""
+        if valid_until < self.spec.reference_date:
+            return rng.choices(
+                (QuoteStatus.ACCEPTED, QuoteStatus.REJECTED, QuoteStatus.EXPIRED), weights=(45, 25, 30)
+            )[0]
+        return rng.choices((QuoteStatus.DRAFT, QuoteStatus.SENT), weights=(40, 60))[0]
+
+    def quotes(self) -> Iterator[Tuple[List[Dict], List[Dict]]]:
+        """Lots (devis, lignes). Nécessite la génération préalable des projets."""
+        rng = self._rng("quotes")
+        item_index = 0
+
+        for batch in self._batches(self.spec.quotes):
+            quotes, items = [], []
+            for index in batch:
+                quote_id = self._uuid("quotes", index)
+                # 60 % des devis rattachés à un projet, toujours du même client
+                if self.project_clients and rng.random() < 0.6:
+                    project_index = rng.randrange(len(self.project_clients))
+                    project_id = self._uuid("projects", project_index)
+                    client_index = self.project_clients[project_index]
+                else:
+                    project_id = None
+                    client_index = rng.randrange(self.spec.clients)
+
+                currency = rng.choice(CURRENCIES)
+                tax_rate = rng.choice(TAX_RATES)
+                created_at = self.reference - timedelta(days=rng.randint(0, 2 * 365), seconds=rng.randint(0, 86399))
+                valid_until = created_at.date() + timedelta(days=rng.randint(15, 90))
+
+                total_ht = Decimal("0")
+                for line in range(rng.randint(1, self.spec.max_items_per_quote)):
+                    unit_price = Decimal(rng.randint(500, 500_000)) * CENT
+                    quantity = Decimal(rng.randint(1, 20))
+                    total = (unit_price * quantity).quantize(CENT)
+                    total_ht += total
+                    items.append(
+                        {
+                            "id": self._uuid("quote_items", item_index),
+                            "quote_id": quote_id,
+                            "description": f"Line {line + 1}",
+                            "unit_price": unit_price,
+                            "quantity": quantity,
+                            "total": total,
+                            "currency": currency,
+                        }
+                    )
+                    item_index += 1
+
+                quotes.append(
+                    {
+                        "id": quote_id,
+                        "client_id": self._uuid("clients", client_index),
+                        "project_id": project_id,
+                        "title": f"Quote {index:07d}",
+                        "status": self._quote_status(rng, valid_until),
+                        "currency": currency,
+                        "total_ht": total_ht,
+                        "total_ttc": (total_ht * (1 + tax_rate)).quantize(CENT),
+                        "tax_rate": tax_rate,
+                        "created_at": created_at,
+                        "updated_at": created_at,
+                        "valid_until": valid_until,
+                    }
+                )
+
+            yield quotes, items
+
+
+def check_projects(projects: List[Dict], features: List[Dict]):
+    """Reconstruit quelques lignes via le domaine (ValueError si un invariant est violé)."""
+    for row in projects[:10]:
+        ProjectPeriod(start_date=row["start_date"], end_date=row["end_date"])
+    for row in features[:10]:
+        Feature(**row)
+
+
+def check_quotes(quotes: List[Dict], items: List[Dict]):
+    """Reconstruit quelques devis via le domaine et compare leurs totaux aux valeurs générées."""
+    items_by_quote: Dict[uuid.UUID, List[Dict]] = {}
+    for item in items:
+        items_by_quote.setdefault(item["quote_id"], []).append(item)
+
+    for row in quotes[:10]:
+        quote = Quote(
+            id=row["id"],
+            client_id=row["client_id"],
+            project_id=row["project_id"],
+            title=row["title"],
+            status=row["status"],
+            currency=row["currency"],
+            tax_rate=TaxRate(row["tax_rate"]),
+            created_at=row["created_at"],
+            updated_at=row["updated_at"],
+            valid_until=row["valid_until"],
+            items=[
+                QuoteItem(
+                    id=item["id"],
+                    quote_id=item["quote_id"],
+                    description=item["description"],
+                    unit_price=Money(item["unit_price"], item["currency"]),
+                    quantity=item["quantity"],
+                )
+                for item in items_by_quote[row["id"]]
+            ],
+        )
+        if quote.total_ht.amount != row["total_ht"]:
+            raise ValueError(f"Inconsistent total_ht for generated quote {row['id']}")
+        if quote.total_ttc.amount.quantize(CENT) != row["total_ttc"]:
+            raise ValueError(f"Inconsistent total_ttc for generated quote {row['id']}")
+
+
+async def reset_schema():
+    """Supprime et recrée toutes les tables."""
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    await init_db()
+
+
+async def generate(spec: DatasetSpec, reset: bool = False) -> Dict[str, int]:
+    """Génère et charge le jeu de données ; retourne le nombre de lignes par table."""
+    if reset:
+        await reset_schema()
+
+    generator = DatasetGenerator(spec)
+    counts = {"clients": 0, "projects": 0, "modules": 0, "features": 0, "quotes": 0, "quote_items": 0}
+
+    for rows in generator.clients():
+        async with engine.begin() as conn:
+            await conn.execute(insert(ClientModel), rows)
+        counts["clients"] += len(rows)
+
+    checked = False
+    for projects, modules, features in generator.projects():
+        if not checked:
+            check_projects(projects, features)
+            checked = True
+        # Un lot = une transaction, parents avant enfants
+        async with engine.begin() as conn:
+            await conn.execute(insert(ProjectModel), projects)
+            await conn.execute(insert(ModuleModel), modules)
+            await conn.execute(insert(FeatureModel), features)
+        counts["projects"] += len(projects)
+        counts["modules"] += len(modules)
+        counts["features"] += len(features)
+
+    checked = False
+    for quotes, items in generator.quotes():
+        if not checked:
+            check_quotes(quotes, items)
+            checked = True
+        async with engine.begin() as conn:
+            await conn.execute(insert(QuoteModel), quotes)
+            await conn.execute(insert(QuoteItemModel), items)
+        counts["quotes"] += len(quotes)
+        counts["quote_items"] += len(items)
+
+    async with async_session_maker() as session:
+        counts["client_quote_summary"] = await ClientQuoteSummaryProjector(session).rebuild()
+        await session.commit()
+
+    return counts
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Generate a synthetic dataset.")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiplier applied to the reference volumes")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--batch-size", type=int, default=5_000, help="Rows per INSERT batch")
+    parser.add_argument("--reference-date", type=date.fromisoformat, default=DatasetSpec.reference_date,
+                        help="Date the data is generated around (YYYY-MM-DD)")
+    parser.add_argument("--reset", action="store_true", help="Drop and recreate all tables first")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    spec = DatasetSpec.scaled(
+        args.scale,
+        seed=args.seed,
+        batch_size=args.batch_size,
+        reference_date=args.reference_date,
+    )
+    started = time.perf_counter()
+    counts = asyncio.run(generate(spec, reset=args.reset))
+    elapsed = time.perf_counter() - started
+    for table, rows in counts.items():
+        print(f"{table}: {rows} row(s)")
+    print(f"Generated in {elapsed:.1f}s")
@@ -0,0 +1,21 @@
+"""Reconstruit la table client_quote_summary à partir des devis existants.
+
+Usage : python -m infrastructure.commands.rebuild_client_quote_summary
+"""
+import asyncio
+
+from infrastructure.database.session import async_session_maker
+from infrastructure.persistence.client_quote_summary_projector import ClientQuoteSummaryProjector
+
+
+async def rebuild() -> int:
+    """Reconstruit le read model dans une seule transaction."""
+    async with async_session_maker() as session:
+        rows = await ClientQuoteSummaryProjector(session).rebuild()
+        await session.commit()
+        return rows
+
+
+if __name__ == "__main__":
+    rows = asyncio.run(rebuild())
+    print(f"client_quote_summary rebuilt: {rows} row(s)")
@@ -0,0 +1,42 @@
+from typing import Tuple
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.api.response_cache import TagVersionStore
+from infrastructure.persistence.sqlalchemy_models import ResponseCacheVersionModel
+
+
+class DatabaseTagVersions(TagVersionStore):
+    """Versions des étiquettes dans la table response_cache_versions (primaire).
+
+    Une lecture sur clé primaire par requête cachable, une insertion/mise à
+    jour par mutation ; le replica n'est jamais consulté, son retard ferait
+    servir des réponses périmées.
+    """
+
+    def __init__(self, engine: AsyncEngine):
+        self.engine = engine
+
+    async def current(self, tags: Tuple[str, ...]) -> Tuple[Tuple[str, int], ...]:
+        async with self.engine.connect() as connection:
+            result = await connection.execute(
+                select(ResponseCacheVersionModel.tag, ResponseCacheVersionModel.version).where(
+                    ResponseCacheVersionModel.tag.in_(tags)
+                )
+            )
+            versions = dict(result.all())
+        return tuple((tag, versions.get(tag, 0)) for tag in tags)
+
+    async def bump(self, tags: Tuple[str, ...]):
+        # Étiquettes triées : ordre de verrouillage identique entre mutations concurrentes
+        statement = insert(ResponseCacheVersionModel).values(
+            [{"tag": tag, "version": 1} for tag in sorted(set(tags))]
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[ResponseCacheVersionModel.tag],
+            set_={"version": ResponseCacheVersionModel.version + 1},
+        )
+        async with self.engine.begin() as connection:
+            await connection.execute(statement)
@@ -0,0 +1,69 @@
+from typing import Iterable, List
+
+from app.core.metrics import MetricsRegistry, format_labels, histogram_lines
+from infrastructure.database import session
+
+
+def _pool_lines() -> Iterable[str]:
+    """Métriques des pools de connexions (primaire et replica)."""
+    engines = {"primary": session.engine}
+    if session.replica_engine is not None:
+        engines["replica"] = session.replica_engine
+
+    gauges = {
+        "db_pool_size": ("Connections kept in the pool.", lambda pool: pool.size()),
+        "db_pool_checked_out": ("Connections currently checked out.", lambda pool: pool.checkedout()),
+        "db_pool_overflow": ("Overflow connections currently open.", lambda pool: max(pool.overflow(), 0)),
+    }
+    counters = {
+        "db_pool_checkouts_total": ("Connection checkouts.", "checkouts"),
+        "db_pool_overflow_events_total": ("Checkouts that opened an overflow connection.", "overflow_events"),
+        "db_pool_timeouts_total": ("Checkouts that timed out waiting for a connection.", "timeouts"),
+        "db_pool_invalidations_total": ("Invalidated connections.", "invalidations"),
+    }
+
+    lines: List[str] = []
+    for name, (documentation, read) in gauges.items():
+        lines += [f"# HELP {name} {documentation}", f"# TYPE {name} gauge"]
+        for pool_name, engine in engines.items():
+            lines.append(f"{name}{format_labels({'pool': pool_name})} {read(engine.sync_engine.pool)}")
+
+    for name, (documentation, attribute) in counters.items():
+        lines += [f"# HELP {name} {documentation}", f"# TYPE {name} counter"]
+        for pool_name, engine in engines.items():
+            metrics = engine.sync_engine.pool.metrics
+            if metrics is not None:
+                lines.append(f"{name}{format_labels({'pool': pool_name})} {getattr(metrics, attribute)}")
+
+    for name, documentation, attribute in (
+        ("db_pool_wait_seconds", "Time spent waiting for a pooled connection.", "wait_seconds"),
+        ("db_pool_pre_ping_seconds", "Time spent pinging connections on checkout.", "pre_ping_seconds"),
+    ):
+        lines += [f"# HELP {name} {documentation}", f"# TYPE {name} histogram"]
+        for pool_name, engine in engines.items():
+            metrics = engine.sync_engine.pool.metrics
+            if metrics is not None:
+                lines += histogram_lines(name, getattr(metrics, attribute), {"pool": pool_name})
+
+    return lines
+
+
+def _query_lines() -> Iterable[str]:
+    """Métriques des requêtes SQL, par empreinte."""
+    observer = session.query_observer
+    lines = [
+        "# HELP db_slow_queries_total Statements slower than the slow query threshold.",
+        "# TYPE db_slow_queries_total counter",
+        f"db_slow_queries_total {observer.slow_queries}",
+        "# HELP db_statement_duration_seconds Sampled statement duration by fingerprint.",
+        "# TYPE db_statement_duration_seconds histogram",
+    ]
+    for stats in list(observer.statements.values()):
+        lines += histogram_lines("db_statement_duration_seconds", stats.latency, {"fingerprint": stats.fingerprint})
+    return lines
+
+
+def register_database_metrics(registry: MetricsRegistry):
+    """Ajoute les métriques base de données à l'export Prometheus."""
+    registry.register_collector(_pool_lines)
+    registry.register_collector(_query_lines)
@@ -0,0 +1,158 @@
+"""Initial schema: clients, projects, quotes and the client_quote_summary read model
+
+Reprend le schéma créé jusqu'ici par ``Base.metadata.create_all`` (tables,
+index et extension pg_trgm). Une base existante créée ainsi est adoptée
+sans migration par ``alembic stamp 0001``.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19 00:00:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PROJECT_STATUS = sa.Enum("PLANNED", "IN_PROGRESS", "ON_HOLD", "COMPLETED", "CANCELLED", name="projectstatus")
+COMPLEXITY = sa.Enum("SIMPLE", "MEDIUM", "COMPLEX", name="complexity")
+QUOTE_STATUS = sa.Enum("DRAFT", "SENT", "ACCEPTED", "REJECTED", "EXPIRED", name="quotestatus")
+
+
+def _timestamps():
+    return [
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+    ]
+
+
+def upgrade() -> None:
+    # Index trigram de la détection de doublons clients
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.create_table(
+        "clients",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("name", sa.String(255), nullable=False),
+        sa.Column("contact_name", sa.String(255), nullable=False),
+        sa.Column("email", sa.String(255), nullable=False),
+        sa.Column("phone", sa.String(50), nullable=False),
+        sa.Column("address_street", sa.String(255), nullable=False),
+        sa.Column("address_city", sa.String(100), nullable=False),
+        sa.Column("address_zip_code", sa.String(20), nullable=False),
+        sa.Column("address_country", sa.String(100), nullable=False),
+        *_timestamps(),
+    )
+    op.create_index("ix_clients_name", "clients", ["name"])
+    op.create_index("ix_clients_email", "clients", ["email"], unique=True)
+    # La ville n'entre que dans le score : seuls le nom et la rue sont filtrés par %
+    for column in ("name", "address_street"):
+        op.create_index(
+            f"ix_clients_{column}_trgm",
+            "clients",
+            [column],
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+
+    op.create_table(
+        "client_quote_summary",
+        sa.Column(
+            "client_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("clients.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("currency", sa.String(3), primary_key=True),
+        sa.Column("quote_count", sa.Integer(), nullable=False),
+        sa.Column("quoted_amount", sa.DECIMAL(14, 2), nullable=False),
+        sa.Column("accepted_amount", sa.DECIMAL(14, 2), nullable=False),
+        sa.Column("pending_amount", sa.DECIMAL(14, 2), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+    )
+
+    op.create_table(
+        "projects",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("client_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("clients.id"), nullable=False),
+        sa.Column("name", sa.String(255), nullable=False),
+        sa.Column("description", sa.String(1000), nullable=False),
+        sa.Column("status", PROJECT_STATUS, nullable=False),
+        sa.Column("start_date", sa.Date(), nullable=False),
+        sa.Column("end_date", sa.Date(), nullable=True),
+        *_timestamps(),
+    )
+    op.create_index("ix_projects_client_id", "projects", ["client_id"])
+    op.create_index("ix_projects_name", "projects", ["name"])
+    op.create_index("ix_projects_status", "projects", ["status"])
+
+    op.create_table(
+        "modules",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("project_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("projects.id"), nullable=False),
+        sa.Column("name", sa.String(255), nullable=False),
+    )
+    op.create_index("ix_modules_project_id", "modules", ["project_id"])
+    op.create_index("ix_modules_name", "modules", ["name"])
+
+    op.create_table(
+        "features",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("module_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("modules.id"), nullable=False),
+        sa.Column("name", sa.String(255), nullable=False),
+        sa.Column("description", sa.String(1000), nullable=False),
+        sa.Column("complexity", COMPLEXITY, nullable=False),
+        sa.Column("profile_allocation", sa.JSON(), nullable=False),
+        sa.Column("extra_hours", sa.Integer(), nullable=False),
+    )
+    op.create_index("ix_features_module_id", "features", ["module_id"])
+    op.create_index("ix_features_name", "features", ["name"])
+    op.create_index("ix_features_complexity", "features", ["complexity"])
+
+    op.create_table(
+        "quotes",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("client_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("clients.id"), nullable=False),
+        sa.Column("project_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("projects.id"), nullable=True),
+        sa.Column("title", sa.String(255), nullable=False),
+        sa.Column("status", QUOTE_STATUS, nullable=False),
+        sa.Column("currency", sa.String(3), nullable=False),
+        sa.Column("total_ht", sa.DECIMAL(10, 2), nullable=False),
+        sa.Column("total_ttc", sa.DECIMAL(10, 2), nullable=False),
+        sa.Column("tax_rate", sa.DECIMAL(5, 4), nullable=False),
+        *_timestamps(),
+        sa.Column("valid_until", sa.Date(), nullable=False),
+    )
+    op.create_index("ix_quotes_client_id", "quotes", ["client_id"])
+    op.create_index("ix_quotes_project_id", "quotes", ["project_id"])
+    op.create_index("ix_quotes_title", "quotes", ["title"])
+    op.create_index("ix_quotes_status", "quotes", ["status"])
+    op.create_index("ix_quotes_status_valid_until", "quotes", ["status", "valid_until"])
+    op.create_index("ix_quotes_client_id_created_at", "quotes", ["client_id", "created_at"])
+    op.create_index("ix_quotes_status_total_ttc", "quotes", ["status", "total_ttc"])
+    op.create_index("ix_quotes_created_at", "quotes", ["created_at"])
+
+    op.create_table(
+        "quote_items",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("quote_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("quotes.id"), nullable=False),
+        sa.Column("description", sa.String(500), nullable=False),
+        sa.Column("unit_price", sa.DECIMAL(10, 2), nullable=False),
+        sa.Column("quantity", sa.DECIMAL(10, 2), nullable=False),
+        sa.Column("total", sa.DECIMAL(10, 2), nullable=False),
+        sa.Column("currency", sa.String(3), nullable=False),
+    )
+    op.create_index("ix_quote_items_quote_id", "quote_items", ["quote_id"])
+
+
+def downgrade() -> None:
+    # Les index suivent leurs tables ; l'extension pg_trgm reste installée dans la base
+    for table in ("quote_items", "quotes", "features", "modules", "projects", "client_quote_summary", "clients"):
+        op.drop_table(table)
+    for enum in (QUOTE_STATUS, COMPLEXITY, PROJECT_STATUS):
+        enum.drop(op.get_bind(), checkfirst=True)
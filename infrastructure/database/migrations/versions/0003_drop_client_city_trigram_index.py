@@ -0,0 +1,28 @@
+"""Drop the unused trigram index on clients.address_city
+
+La ville n'intervient que dans le score de similarité, jamais dans le
+filtre ``%`` : l'index n'était pas utilisé et ne coûtait qu'en écriture.
+Il n'existe plus que sur les bases créées par ``create_all`` puis adoptées
+par ``alembic stamp 0001``.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19 00:00:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_clients_address_city_trgm")
+
+
+def downgrade() -> None:
+    # Index absent de 0001 : rien à recréer
+    pass
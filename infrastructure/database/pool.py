@@ -0,0 +1,215 @@
+import asyncio
+import logging
+import math
+import time
+from typing import Dict, Optional
+from sqlalchemy import event, exc, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.core.metrics import Histogram
+
+logger = logging.getLogger(__name__)
+
+# Clé posée dans ConnectionRecord.info entre l'obtention et le checkout (mesure du pre-ping)
+_ACQUIRED_AT = "_pool_acquired_at"
+
+
+class PoolMetrics:
+    """Compteurs et histogrammes d'un pool de connexions."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.checkouts = 0
+        self.overflow_events = 0
+        self.timeouts = 0
+        self.invalidations = 0
+        self.liveness_failures = 0
+        self.resizes = 0
+        self.peak_checked_out = 0
+        self.wait_seconds = Histogram()
+        self.pre_ping_seconds = Histogram()
+
+    def reset_peak(self, current: int) -> int:
+        """Retourne le pic de connexions utilisées depuis le dernier appel et le réinitialise."""
+        peak = self.peak_checked_out
+        self.peak_checked_out = current
+        return peak
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Pool asyncio mesurant l'attente de checkout et l'usage de l'overflow, redimensionnable à chaud."""
+
+    metrics: Optional[PoolMetrics] = None
+
+    def _do_get(self):
+        overflow_before = self._overflow
+        started = time.perf_counter()
+        try:
+            record = super()._do_get()
+        except exc.TimeoutError:
+            if self.metrics is not None:
+                self.metrics.timeouts += 1
+            raise
+
+        if self.metrics is not None:
+            acquired = time.perf_counter()
+            self.metrics.wait_seconds.observe(acquired - started)
+            if self._overflow > overflow_before and self._overflow > 0:
+                self.metrics.overflow_events += 1
+            record.info[_ACQUIRED_AT] = acquired
+        return record
+
+    def recreate(self) -> "InstrumentedQueuePool":
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+    def resize(self, pool_size: int, max_overflow: int):
+        """Change le nombre de connexions conservées sans toucher au plafond global.
+
+        Les connexions au-delà de la nouvelle taille sont fermées à leur
+        retour dans le pool (file pleine).
+        """
+        delta = pool_size - self._pool.maxsize
+        if delta == 0 and max_overflow == self._max_overflow:
+            return
+
+        self._pool.maxsize = pool_size
+        # File asyncio créée paresseusement par AsyncAdaptedQueue
+        queue = self._pool.__dict__.get("_queue")
+        if queue is not None:
+            queue._maxsize = pool_size
+        # _overflow = connexions ouvertes - taille du pool
+        self._overflow -= delta
+        self._max_overflow = max_overflow
+
+        if self.metrics is not None:
+            self.metrics.resizes += 1
+
+    def stats(self) -> Dict:
+        """État courant et métriques cumulées du pool."""
+        snapshot = {
+            "size": self.size(),
+            "checked_out": self.checkedout(),
+            "checked_in": self.checkedin(),
+            "overflow": self.overflow(),
+            "max_overflow": self._max_overflow,
+            "pre_ping": self._pre_ping,
+        }
+        if self.metrics is not None:
+            snapshot.update(
+                {
+                    "checkouts": self.metrics.checkouts,
+                    "overflow_events": self.metrics.overflow_events,
+                    "timeouts": self.metrics.timeouts,
+                    "invalidations": self.metrics.invalidations,
+                    "liveness_failures": self.metrics.liveness_failures,
+                    "resizes": self.metrics.resizes,
+                    "peak_checked_out": self.metrics.peak_checked_out,
+                    "wait_seconds": self.metrics.wait_seconds.snapshot(),
+                    "pre_ping_seconds": self.metrics.pre_ping_seconds.snapshot(),
+                }
+            )
+        return snapshot
+
+
+def instrument_pool(engine: AsyncEngine, name: str) -> PoolMetrics:
+    """Attache des métriques au pool du moteur et écoute ses événements."""
+    pool = engine.sync_engine.pool
+    metrics = PoolMetrics(name)
+    pool.metrics = metrics
+
+    @event.listens_for(pool, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        metrics.checkouts += 1
+        acquired = connection_record.info.pop(_ACQUIRED_AT, None)
+        if acquired is not None and engine.sync_engine.pool._pre_ping:
+            # Temps écoulé entre l'obtention de la connexion et le checkout = pre-ping
+            metrics.pre_ping_seconds.observe(time.perf_counter() - acquired)
+        checked_out = engine.sync_engine.pool.checkedout()
+        if checked_out > metrics.peak_checked_out:
+            metrics.peak_checked_out = checked_out
+
+    @event.listens_for(pool, "invalidate")
+    def on_invalidate(dbapi_connection, connection_record, exception):
+        metrics.invalidations += 1
+
+    return metrics
+
+
+class PoolMaintainer:
+    """Tâche de fond du mode adaptatif : test de vie périodique et dimensionnement du pool.
+
+    Remplace le pre-ping (un aller-retour à chaque checkout) par un unique
+    ``SELECT 1`` périodique ; en cas d'échec, le pool est recréé pour
+    abandonner les connexions mortes. Le pool est redimensionné d'après le
+    pic de connexions simultanées observé sur chaque fenêtre.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        min_size: int,
+        max_connections: int,
+        liveness_interval_seconds: float,
+        resize_interval_seconds: float,
+        headroom: float = 1.25,
+    ):
+        self.engine = engine
+        self.min_size = min_size
+        self.max_connections = max_connections
+        self.liveness_interval_seconds = liveness_interval_seconds
+        self.resize_interval_seconds = resize_interval_seconds
+        self.headroom = headroom
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def pool(self) -> InstrumentedQueuePool:
+        return self.engine.sync_engine.pool
+
+    def start(self):
+        """Démarre la tâche de fond."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="pool-maintainer")
+
+    async def stop(self):
+        """Arrête la tâche de fond."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        next_resize = time.monotonic() + self.resize_interval_seconds
+        while True:
+            await asyncio.sleep(self.liveness_interval_seconds)
+            await self.check_liveness()
+            if time.monotonic() >= next_resize:
+                self.adjust_size()
+                next_resize = time.monotonic() + self.resize_interval_seconds
+
+    async def check_liveness(self) -> bool:
+        """Vérifie qu'une connexion du pool répond ; recrée le pool sinon."""
+        try:
+            async with self.engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+            return True
+        except Exception:
+            logger.warning("Database liveness check failed, recycling the connection pool", exc_info=True)
+            if self.pool.metrics is not None:
+                self.pool.metrics.liveness_failures += 1
+            await self.engine.dispose()
+            return False
+
+    def adjust_size(self):
+        """Ajuste la taille du pool au pic de concurrence de la fenêtre écoulée."""
+        pool = self.pool
+        if pool.metrics is None:
+            return
+        peak = pool.metrics.reset_peak(pool.checkedout())
+        target = min(max(math.ceil(peak * self.headroom), self.min_size), self.max_connections)
+        pool.resize(target, self.max_connections - target)
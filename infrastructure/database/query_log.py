@@ -0,0 +1,163 @@
+import logging
+import random
+import re
+import time
+from typing import Dict, List, Optional
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.metrics import Histogram
+from app.core.timing import current_timings
+
+logger = logging.getLogger("memory_business.sql")
+
+# Normalisation des requêtes : littéraux et paramètres remplacés par "?"
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_PARAMETER = re.compile(r"%\(\w+\)s|%s|\$\d+|(?<!:):\w+|\?")
+_NUMBER = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+# Un élément de liste : "?" éventuellement typé ("?::UUID", "?::VARCHAR(?)", "?::INTEGER[]")
+_IN_ITEM = r"\s*\?(?:\s*::\s*\w+(?:\s*\([^()]*\))?(?:\[\])*)?\s*"
+_IN_LIST = re.compile(rf"\bIN\s*\((?:{_IN_ITEM},)*{_IN_ITEM}\)", re.IGNORECASE)
+_VALUES_LIST = re.compile(r"\bVALUES\s*(\([^()]*\))(?:\s*,\s*\([^()]*\))+", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+# Nombre maximal de requêtes distinctes gardées en cache de normalisation
+_FINGERPRINT_CACHE_SIZE = 2048
+
+
+def fingerprint(statement: str) -> str:
+    """Forme normalisée d'une requête SQL, indépendante des valeurs."""
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _PARAMETER.sub("?", normalized)
+    normalized = _NUMBER.sub("?", normalized)
+    normalized = _WHITESPACE.sub(" ", normalized).strip()
+    normalized = _IN_LIST.sub("IN (...)", normalized)
+    normalized = _VALUES_LIST.sub(r"VALUES \1, ...", normalized)
+    return normalized
+
+
+class StatementStats:
+    """Agrégats de latence pour une empreinte de requête."""
+
+    def __init__(self, fingerprint: str):
+        self.fingerprint = fingerprint
+        self.count = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.latency = Histogram()
+
+    def observe(self, seconds: float):
+        self.count += 1
+        self.total_seconds += seconds
+        if seconds > self.max_seconds:
+            self.max_seconds = seconds
+        self.latency.observe(seconds)
+
+    def snapshot(self) -> Dict:
+        return {
+            "fingerprint": self.fingerprint,
+            "count": self.count,
+            "errors": self.errors,
+            "total_ms": round(self.total_seconds * 1000, 3),
+            "mean_ms": round(self.total_seconds * 1000 / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max_seconds * 1000, 3),
+            "latency_seconds": self.latency.snapshot(),
+        }
+
+
+class QueryObserver:
+    """Chronomètre les requêtes via les événements du moteur.
+
+    Les requêtes plus lentes que le seuil sont toujours journalisées ; les
+    agrégats par empreinte ne portent que sur la fraction échantillonnée.
+    """
+
+    OVERFLOW_FINGERPRINT = "<other>"
+
+    def __init__(self, slow_threshold_ms: float, sample_rate: float = 1.0, max_fingerprints: int = 500):
+        self.slow_threshold_seconds = slow_threshold_ms / 1000
+        self.sample_rate = sample_rate
+        self.max_fingerprints = max_fingerprints
+        self.statements: Dict[str, StatementStats] = {}
+        self.slow_queries = 0
+        self._fingerprints: Dict[str, str] = {}
+
+    def attach(self, engine: AsyncEngine):
+        """Écoute les exécutions du moteur."""
+        sync_engine = engine.sync_engine
+        event.listen(sync_engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", self._after_cursor_execute)
+        event.listen(sync_engine, "handle_error", self._handle_error)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        context._query_started_at = time.perf_counter()
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        started_at = getattr(context, "_query_started_at", None)
+        if started_at is None:
+            return
+        seconds = time.perf_counter() - started_at
+        # Temps base de la requête HTTP en cours (en-tête Server-Timing)
+        timings = current_timings()
+        if timings is not None:
+            timings.add_statement(seconds)
+        self.observe(statement, seconds)
+
+    def _handle_error(self, exception_context):
+        statement = exception_context.statement
+        if statement is not None:
+            self._stats_for(self._fingerprint(statement)).errors += 1
+
+    def observe(self, statement: str, seconds: float):
+        """Enregistre la durée d'une requête exécutée."""
+        slow = seconds >= self.slow_threshold_seconds
+        sampled = self.sample_rate >= 1.0 or random.random() < self.sample_rate
+        if not slow and not sampled:
+            return
+
+        statement_fingerprint = self._fingerprint(statement)
+        if sampled:
+            self._stats_for(statement_fingerprint).observe(seconds)
+        if slow:
+            self.slow_queries += 1
+            logger.warning("Slow query (%.1f ms): %s", seconds * 1000, statement_fingerprint)
+
+    def _fingerprint(self, statement: str) -> str:
+        cached = self._fingerprints.get(statement)
+        if cached is None:
+            cached = fingerprint(statement)
+            if len(self._fingerprints) >= _FINGERPRINT_CACHE_SIZE:
+                self._fingerprints.clear()
+            self._fingerprints[statement] = cached
+        return cached
+
+    def _stats_for(self, statement_fingerprint: str) -> StatementStats:
+        stats = self.statements.get(statement_fingerprint)
+        if stats is None:
+            if len(self.statements) >= self.max_fingerprints:
+                statement_fingerprint = self.OVERFLOW_FINGERPRINT
+                stats = self.statements.get(statement_fingerprint)
+            if stats is None:
+                stats = self.statements[statement_fingerprint] = StatementStats(statement_fingerprint)
+        return stats
+
+    def snapshot(self, limit: Optional[int] = 50, order_by: str = "total_ms") -> Dict:
+        """Agrégats par empreinte, triés par ``order_by`` décroissant."""
+        statements: List[Dict] = sorted(
+            (stats.snapshot() for stats in self.statements.values()),
+            key=lambda stats: stats.get(order_by, 0),
+            reverse=True,
+        )
+        return {
+            "slow_query_threshold_ms": self.slow_threshold_seconds * 1000,
+            "sample_rate": self.sample_rate,
+            "slow_queries": self.slow_queries,
+            "fingerprints": len(self.statements),
+            "statements": statements[:limit] if limit else statements,
+        }
+
+    def reset(self):
+        """Remet les agrégats à zéro."""
+        self.statements.clear()
+        self.slow_queries = 0
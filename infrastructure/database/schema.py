@@ -0,0 +1,85 @@
+"""Préparation du schéma au démarrage (DB_STARTUP_MODE).
+
+- ``create_all`` : crée les tables manquantes (développement, tests) ;
+- ``migrate`` : applique les migrations Alembic jusqu'à la tête ;
+- ``verify`` : une seule requête compare la révision de la base à la tête
+  des migrations, qui sont appliquées en amont (``alembic upgrade head``).
+"""
+import os
+from functools import lru_cache
+from typing import Optional
+
+from alembic import command
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.core.config import settings
+from infrastructure.database.session import SCHEMA_INIT_LOCK_KEY, engine, init_db
+
+STARTUP_MODES = ("create_all", "migrate", "verify")
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "migrations")
+
+
+class SchemaRevisionMismatch(RuntimeError):
+    """La base n'est pas à la révision attendue par le code déployé."""
+
+
+def alembic_config(connection: Optional[Connection] = None) -> Config:
+    """Configuration Alembic sans alembic.ini ; ``connection`` est réutilisée par env.py."""
+    config = Config()
+    config.set_main_option("script_location", MIGRATIONS_DIR)
+    # ConfigParser interprète « % » (mots de passe encodés dans l'URL)
+    config.set_main_option("sqlalchemy.url", settings.DATABASE_URL.replace("%", "%%"))
+    if connection is not None:
+        config.attributes["connection"] = connection
+    return config
+
+
+@lru_cache(maxsize=1)
+def head_revision() -> str:
+    """Révision de tête des migrations livrées avec le code."""
+    return ScriptDirectory.from_config(alembic_config()).get_current_head()
+
+
+async def current_revision(connection: AsyncConnection) -> Optional[str]:
+    """Révision appliquée à la base (None si Alembic ne l'a jamais migrée)."""
+    try:
+        result = await connection.execute(text("SELECT version_num FROM alembic_version"))
+    except DBAPIError:
+        return None
+    return result.scalar_one_or_none()
+
+
+async def verify_schema():
+    """Vérifie la révision du schéma sans requête sur le catalogue."""
+    expected = head_revision()
+    async with engine.connect() as connection:
+        revision = await current_revision(connection)
+    if revision != expected:
+        raise SchemaRevisionMismatch(
+            f"Database schema is at revision {revision}, expected {expected}; run 'alembic upgrade head'"
+        )
+
+
+async def migrate():
+    """Applique les migrations ; le verrou sérialise les processus démarrés ensemble."""
+    async with engine.begin() as connection:
+        await connection.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": SCHEMA_INIT_LOCK_KEY})
+        await connection.run_sync(lambda sync_connection: command.upgrade(alembic_config(sync_connection), "head"))
+
+
+async def prepare_database(mode: str):
+    """Prépare le schéma selon le mode de démarrage."""
+    if mode == "create_all":
+        await init_db()
+    elif mode == "migrate":
+        await migrate()
+    elif mode == "verify":
+        await verify_schema()
+    else:
+        raise ValueError(f"Unknown DB_STARTUP_MODE: {mode} (expected one of {', '.join(STARTUP_MODES)})")
@@ -1,16 +1,44 @@
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Optional
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 from app.core.config import settings
+from infrastructure.tracing import tracer
+from infrastructure.database.pool import InstrumentedQueuePool, PoolMaintainer, instrument_pool
+from infrastructure.database.query_log import QueryObserver
+from infrastructure.database.tracing import attach_sql_tracing
+
+logger = logging.getLogger(__name__)
 
 # Créer le moteur async pour PostgreSQL
 engine = create_async_engine(
     settings.DATABASE_URL,
-    echo=True,
+    echo=settings.SQL_ECHO,
     future=True,
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
+    poolclass=InstrumentedQueuePool,
+    # En mode adaptatif, le test de vie périodique remplace le pre-ping
+    pool_pre_ping=settings.DB_POOL_PRE_PING and not settings.DB_POOL_ADAPTIVE,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+)
+instrument_pool(engine, "primary")
+
+# Chronométrage des requêtes (slow query log, agrégats par empreinte)
+query_observer = QueryObserver(
+    slow_threshold_ms=settings.SQL_SLOW_QUERY_MS,
+    sample_rate=settings.SQL_STATS_SAMPLE_RATE,
+    max_fingerprints=settings.SQL_STATS_MAX_FINGERPRINTS,
 )
+query_observer.attach(engine)
+if tracer.enabled:
+    attach_sql_tracing(engine, "primary")
 
 # Session factory
 async_session_maker = async_sessionmaker(
@@ -19,9 +47,159 @@ async_session_maker = async_sessionmaker(
     expire_on_commit=False,
 )
 
+# Moteur de lecture (read replica), avec son propre pool
+replica_engine: Optional[AsyncEngine] = None
+replica_session_maker: Optional[async_sessionmaker] = None
+
+if settings.DATABASE_REPLICA_URL:
+    replica_engine = create_async_engine(
+        settings.DATABASE_REPLICA_URL,
+        echo=settings.SQL_ECHO,
+        future=True,
+        poolclass=InstrumentedQueuePool,
+        pool_pre_ping=settings.DB_POOL_PRE_PING and not settings.DB_POOL_ADAPTIVE,
+        pool_size=settings.REPLICA_POOL_SIZE,
+        max_overflow=settings.REPLICA_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+    )
+    instrument_pool(replica_engine, "replica")
+    query_observer.attach(replica_engine)
+    if tracer.enabled:
+        attach_sql_tracing(replica_engine, "replica")
+    replica_session_maker = async_sessionmaker(
+        replica_engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+
+# Maintenance des pools en mode adaptatif (démarrée dans le lifespan)
+pool_maintainers = []
+if settings.DB_POOL_ADAPTIVE:
+    pool_maintainers.append(
+        PoolMaintainer(
+            engine,
+            min_size=settings.DB_POOL_ADAPTIVE_MIN_SIZE,
+            max_connections=settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW,
+            liveness_interval_seconds=settings.DB_POOL_LIVENESS_INTERVAL_SECONDS,
+            resize_interval_seconds=settings.DB_POOL_ADAPTIVE_INTERVAL_SECONDS,
+        )
+    )
+    if replica_engine is not None:
+        pool_maintainers.append(
+            PoolMaintainer(
+                replica_engine,
+                min_size=settings.DB_POOL_ADAPTIVE_MIN_SIZE,
+                max_connections=settings.REPLICA_POOL_SIZE + settings.REPLICA_MAX_OVERFLOW,
+                liveness_interval_seconds=settings.DB_POOL_LIVENESS_INTERVAL_SECONDS,
+                resize_interval_seconds=settings.DB_POOL_ADAPTIVE_INTERVAL_SECONDS,
+            )
+        )
+
 # Base pour les modèles SQLAlchemy
 Base = declarative_base()
 
+# Vrai dès qu'une écriture a eu lieu dans la requête courante (read-after-write)
+_primary_pinned: ContextVar[bool] = ContextVar("primary_pinned", default=False)
+
+
+class ReplicaLagGuard:
+    """Mesure périodiquement le retard de réplication et indique si le replica est utilisable."""
+
+    # Retard nul si tout le WAL reçu est rejoué (évite un faux retard quand le primaire est inactif)
+    LAG_QUERY = text(
+        "SELECT CASE "
+        "WHEN NOT pg_is_in_recovery() OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+        "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+    )
+
+    def __init__(
+        self,
+        replica: AsyncEngine,
+        max_lag_seconds: float,
+        check_interval_seconds: float,
+        check_timeout_seconds: float = 1.0,
+    ):
+        self.replica = replica
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval_seconds = check_interval_seconds
+        self.check_timeout_seconds = check_timeout_seconds
+        self.lag_seconds: Optional[float] = None
+        self._checked_at = float("-inf")
+        self._lock = asyncio.Lock()
+
+    async def is_healthy(self) -> bool:
+        """Vrai si le dernier retard mesuré est sous le seuil (mesure rafraîchie si expirée)."""
+        if time.monotonic() - self._checked_at >= self.check_interval_seconds:
+            async with self._lock:
+                # Une seule mesure en vol : les autres requêtes réutilisent son résultat
+                if time.monotonic() - self._checked_at >= self.check_interval_seconds:
+                    await self._measure()
+        return self.lag_seconds is not None and self.lag_seconds <= self.max_lag_seconds
+
+    async def _measure(self):
+        """Interroge le replica ; toute erreur le rend indisponible jusqu'à la prochaine mesure.
+
+        La mesure est bornée par ``check_timeout_seconds`` : un replica qui ne
+        répond plus ne bloque pas les lectures en attente du verrou.
+        """
+        try:
+            self.lag_seconds = await asyncio.wait_for(self._query_lag(), timeout=self.check_timeout_seconds)
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Replica lag check timed out after %.1fs, routing reads to primary", self.check_timeout_seconds
+            )
+            self.lag_seconds = None
+        except Exception:
+            logger.warning("Replica lag check failed, routing reads to primary", exc_info=True)
+            self.lag_seconds = None
+        finally:
+            self._checked_at = time.monotonic()
+
+    async def _query_lag(self) -> float:
+        async with self.replica.connect() as conn:
+            return float((await conn.execute(self.LAG_QUERY)).scalar_one())
+
+
+replica_lag_guard: Optional[ReplicaLagGuard] = (
+    ReplicaLagGuard(
+        replica_engine,
+        max_lag_seconds=settings.REPLICA_MAX_LAG_SECONDS,
+        check_interval_seconds=settings.REPLICA_LAG_CHECK_INTERVAL_SECONDS,
+        check_timeout_seconds=settings.REPLICA_LAG_CHECK_TIMEOUT_SECONDS,
+    )
+    if replica_engine is not None
+    else None
+)
+
+
+def pin_primary():
+    """Force les lectures suivantes de la requête courante sur le primaire."""
+    _primary_pinned.set(True)
+
+
+@asynccontextmanager
+async def read_session() -> AsyncIterator[AsyncSession]:
+    """Session de lecture : replica si configuré, à jour et sans écriture préalable dans la requête."""
+    session_maker = async_session_maker
+    if (
+        replica_session_maker is not None
+        and not _primary_pinned.get()
+        and await replica_lag_guard.is_healthy()
+    ):
+        session_maker = replica_session_maker
+
+    async with session_maker() as session:
+        yield session
+
+
+@asynccontextmanager
+async def write_session() -> AsyncIterator[AsyncSession]:
+    """Session d'écriture sur le primaire ; épingle la suite de la requête sur le primaire."""
+    pin_primary()
+    async with async_session_maker() as session:
+        yield session
+
 
 async def get_db() -> AsyncSession:
     """Dependency pour obtenir une session de base de données."""
@@ -36,7 +214,48 @@ async def get_db() -> AsyncSession:
             await session.close()
 
 
+# Verrou consultatif : les workers démarrés ensemble créent le schéma l'un après l'autre
+SCHEMA_INIT_LOCK_KEY = 7_208_431_115
+
+
 async def init_db():
     """Initialise la base de données."""
     async with engine.begin() as conn:
+        await conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": SCHEMA_INIT_LOCK_KEY})
+        # Extension requise par les index trigram (recherche de doublons clients)
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
         await conn.run_sync(Base.metadata.create_all)
+
+
+def pool_stats() -> dict:
+    """État et métriques des pools de connexions."""
+    stats = {"primary": engine.sync_engine.pool.stats()}
+    if replica_engine is not None:
+        stats["replica"] = replica_engine.sync_engine.pool.stats()
+    return stats
+
+
+def start_pool_maintenance():
+    """Démarre les tâches de maintenance des pools (mode adaptatif)."""
+    for maintainer in pool_maintainers:
+        maintainer.start()
+
+
+def reset_engines_after_fork():
+    """Dans un worker forké : nouveaux pools, sans fermer les connexions héritées du parent.
+
+    Les engines sont créés à l'import (avant le fork avec ``preload``) ; les
+    sockets hérités restent la propriété du parent et ne sont jamais réutilisés.
+    """
+    engine.sync_engine.dispose(close=False)
+    if replica_engine is not None:
+        replica_engine.sync_engine.dispose(close=False)
+
+
+async def dispose_engines():
+    """Ferme les pools de connexions (primaire et replica)."""
+    for maintainer in pool_maintainers:
+        await maintainer.stop()
+    await engine.dispose()
+    if replica_engine is not None:
+        await replica_engine.dispose()
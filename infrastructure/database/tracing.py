@@ -0,0 +1,48 @@
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from infrastructure.tracing import SPAN_KIND_CLIENT, tracer
+from infrastructure.database.query_log import fingerprint
+
+
+def attach_sql_tracing(engine: AsyncEngine, pool_name: str):
+    """Crée un span enfant par requête SQL exécutée sur le moteur.
+
+    Le texte est normalisé (empreinte) : aucune valeur de paramètre
+    n'est exportée.
+    """
+    sync_engine = engine.sync_engine
+    database = sync_engine.url.database
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        span, token = tracer.start_span(
+            f"SQL {statement.split(None, 1)[0].upper() if statement else 'QUERY'}",
+            {
+                "db.system": "postgresql",
+                "db.name": database or "",
+                "db.statement": fingerprint(statement),
+                "db.pool": pool_name,
+            },
+            kind=SPAN_KIND_CLIENT,
+        )
+        context._trace_span = (span, token)
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        span, token = getattr(context, "_trace_span", (None, None))
+        if span is not None and cursor.rowcount is not None and cursor.rowcount >= 0:
+            span.set_attribute("db.rowcount", cursor.rowcount)
+        tracer.end_span(span, token)
+        context._trace_span = (None, None)
+
+    @event.listens_for(sync_engine, "handle_error")
+    def handle_error(exception_context):
+        context = exception_context.execution_context
+        if context is None:
+            return
+        span, token = getattr(context, "_trace_span", (None, None))
+        if span is not None:
+            span.record_exception(exception_context.original_exception)
+        tracer.end_span(span, token)
+        context._trace_span = (None, None)
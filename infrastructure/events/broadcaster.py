@@ -0,0 +1,62 @@
+import asyncio
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Set
+
+
+class Subscription:
+    """File d'un abonné ; les messages les plus anciens sont écartés si elle déborde."""
+
+    def __init__(self, maxsize: int):
+        self.queue: "asyncio.Queue[Any]" = asyncio.Queue(maxsize)
+        self.dropped = 0
+
+    def put(self, message: Any):
+        if self.queue.full():
+            # Abonné trop lent : ne jamais bloquer l'émetteur
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(message)
+
+    def __aiter__(self) -> "Subscription":
+        return self
+
+    async def __anext__(self) -> Any:
+        return await self.queue.get()
+
+
+class Broadcaster:
+    """Diffusion en mémoire des messages par canal vers les abonnés du processus.
+
+    La publication est synchrone et en O(abonnés du canal) : chaque abonné
+    dispose de sa propre file, consommée par sa souscription GraphQL.
+    Avec plusieurs workers, seuls les abonnés du worker ayant traité la
+    mutation sont notifiés.
+    """
+
+    def __init__(self, queue_size: int = 100):
+        self.queue_size = queue_size
+        self._channels: Dict[str, Set[Subscription]] = defaultdict(set)
+
+    def publish(self, channel: str, message: Any):
+        for subscription in tuple(self._channels.get(channel, ())):
+            subscription.put(message)
+
+    @asynccontextmanager
+    async def subscribe(self, channel: str) -> AsyncIterator[Subscription]:
+        subscription = Subscription(self.queue_size)
+        self._channels[channel].add(subscription)
+        try:
+            yield subscription
+        finally:
+            subscribers = self._channels.get(channel)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._channels[channel]
+
+    def subscriber_count(self, channel: str) -> int:
+        return len(self._channels.get(channel, ()))
+
+
+broadcaster = Broadcaster()
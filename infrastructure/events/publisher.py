@@ -0,0 +1,46 @@
+from typing import List, Optional
+
+from domain.shared.event_publisher import EventPublisher
+from domain.projects.events.project_events import ProjectUpdated
+from domain.quotes.events.quote_events import QuoteAccepted, QuoteExpired, QuoteRejected, QuoteSent
+from infrastructure.events.broadcaster import Broadcaster, broadcaster as default_broadcaster
+
+QUOTE_STATUS_EVENTS = (QuoteSent, QuoteAccepted, QuoteRejected, QuoteExpired)
+
+
+def quote_status_channel(client_id) -> str:
+    return f"quote_status:{client_id}"
+
+
+def project_channel(project_id) -> str:
+    return f"project:{project_id}"
+
+
+def event_channel(event) -> Optional[str]:
+    """Canal de diffusion d'un événement de domaine (None s'il n'est pas diffusé)."""
+    if isinstance(event, QUOTE_STATUS_EVENTS):
+        return quote_status_channel(event.client_id)
+    if isinstance(event, ProjectUpdated):
+        return project_channel(event.project_id)
+    return None
+
+
+class BufferedEventPublisher(EventPublisher):
+    """Conserve les événements d'une transaction et les diffuse après le commit.
+
+    Un rollback (exception avant ``flush``) ne diffuse donc rien.
+    """
+
+    def __init__(self, target: Optional[Broadcaster] = None):
+        self.target = target or default_broadcaster
+        self._pending: List = []
+
+    def publish(self, events: List) -> None:
+        self._pending.extend(events)
+
+    def flush(self):
+        pending, self._pending = self._pending, []
+        for event in pending:
+            channel = event_channel(event)
+            if channel is not None:
+                self.target.publish(channel, event)
@@ -0,0 +1,103 @@
+from dataclasses import dataclass
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Optional
+from uuid import UUID
+from sqlalchemy import delete, insert, select, func, case, literal_column
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domain.quotes.value_objects.quote_status import QuoteStatus
+from infrastructure.persistence.sqlalchemy_models import ClientQuoteSummaryModel, QuoteModel
+
+
+# INSERT ... ON CONFLICT par dialecte (SQLite : base de substitution des benchmarks)
+UPSERT_BY_DIALECT = {"postgresql": pg_insert, "sqlite": sqlite_insert}
+
+# Statuts comptés comme "en attente" (devis encore ouverts)
+PENDING_STATUSES = (QuoteStatus.DRAFT, QuoteStatus.SENT)
+
+
+@dataclass(frozen=True)
+class QuoteFigures:
+    """Contribution d'un devis au résumé de son client."""
+
+    client_id: UUID
+    currency: str
+    status: QuoteStatus
+    total_ttc: Decimal
+
+    @staticmethod
+    def from_model(db_quote: QuoteModel) -> "QuoteFigures":
+        """Capture la contribution d'un devis tel qu'il est stocké."""
+        return QuoteFigures(
+            client_id=db_quote.client_id,
+            currency=db_quote.currency,
+            status=db_quote.status,
+            total_ttc=Decimal(str(db_quote.total_ttc or 0)).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP),
+        )
+
+
+class ClientQuoteSummaryProjector:
+    """Maintient la table client_quote_summary dans la transaction des écritures de devis."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def apply(self, old: Optional[QuoteFigures], new: Optional[QuoteFigures]):
+        """Applique le passage d'un devis de l'état ``old`` à l'état ``new`` (None = absent)."""
+        if old == new:
+            return
+        if old is not None:
+            await self._add(old, sign=-1)
+        if new is not None:
+            await self._add(new, sign=1)
+
+    async def _add(self, figures: QuoteFigures, sign: int):
+        """Ajoute (ou retranche) la contribution d'un devis via un upsert."""
+        amount = figures.total_ttc * sign
+        values = {
+            "client_id": figures.client_id,
+            "currency": figures.currency,
+            "quote_count": sign,
+            "quoted_amount": amount,
+            "accepted_amount": amount if figures.status == QuoteStatus.ACCEPTED else Decimal("0"),
+            "pending_amount": amount if figures.status in PENDING_STATUSES else Decimal("0"),
+        }
+
+        upsert = UPSERT_BY_DIALECT[self.session.bind.dialect.name]
+        stmt = upsert(ClientQuoteSummaryModel).values(**values)
+        table = ClientQuoteSummaryModel.__table__
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.client_id, table.c.currency],
+            set_={
+                "quote_count": table.c.quote_count + stmt.excluded.quote_count,
+                "quoted_amount": table.c.quoted_amount + stmt.excluded.quoted_amount,
+                "accepted_amount": table.c.accepted_amount + stmt.excluded.accepted_amount,
+                "pending_amount": table.c.pending_amount + stmt.excluded.pending_amount,
+                "updated_at": func.now(),
+            },
+        )
+        await self.session.execute(stmt)
+
+    async def rebuild(self) -> int:
+        """Reconstruit entièrement le read model depuis la table quotes."""
+        await self.session.execute(delete(ClientQuoteSummaryModel))
+
+        zero = literal_column("0")
+        aggregate = select(
+            QuoteModel.client_id,
+            QuoteModel.currency,
+            func.count(QuoteModel.id),
+            func.sum(QuoteModel.total_ttc),
+            func.sum(case((QuoteModel.status == QuoteStatus.ACCEPTED, QuoteModel.total_ttc), else_=zero)),
+            func.sum(case((QuoteModel.status.in_(PENDING_STATUSES), QuoteModel.total_ttc), else_=zero)),
+        ).group_by(QuoteModel.client_id, QuoteModel.currency)
+
+        result = await self.session.execute(
+            insert(ClientQuoteSummaryModel).from_select(
+                ["client_id", "currency", "quote_count", "quoted_amount", "accepted_amount", "pending_amount"],
+                aggregate,
+            )
+        )
+        return result.rowcount
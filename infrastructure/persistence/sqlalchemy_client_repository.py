@@ -1,12 +1,24 @@
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
-from sqlalchemy import select
+from sqlalchemy import select, values, column, func, case, or_, true, Integer, String
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from domain.clients.entities.client import Client
 from domain.clients.repositories.client_repository import ClientRepository
 from domain.clients.value_objects.address import Address
-from infrastructure.persistence.sqlalchemy_models import ClientModel
+from domain.clients.value_objects.client_match import ClientMatch, ClientMatchCandidate
+from domain.clients.value_objects.quote_summary import ClientQuoteSummary
+from infrastructure.persistence.sqlalchemy_models import ClientModel, ClientQuoteSummaryModel
+
+
+# Pondération du score de similarité (nom / rue / ville)
+NAME_WEIGHT = 0.6
+STREET_WEIGHT = 0.3
+CITY_WEIGHT = 0.1
+
+# Nombre de candidats comparés par requête lors d'un import
+SIMILARITY_BATCH_SIZE = 500
 
 
 class SQLAlchemyClientRepository(ClientRepository):
@@ -71,6 +83,34 @@ class SQLAlchemyClientRepository(ClientRepository):
 
         return [self._to_entity(db_client) for db_client in db_clients]
 
+    async def find_all_with_quote_summary(
+        self, skip: int = 0, limit: int = 100
+    ) -> List[Tuple[Client, List[ClientQuoteSummary]]]:
+        """Récupère une page de clients jointe au read model client_quote_summary."""
+        client_page = select(ClientModel).offset(skip).limit(limit).subquery()
+        paged_client = aliased(ClientModel, client_page)
+        stmt = select(paged_client, ClientQuoteSummaryModel).outerjoin(
+            ClientQuoteSummaryModel,
+            ClientQuoteSummaryModel.client_id == paged_client.id,
+        )
+        result = await self.session.execute(stmt)
+
+        # Regrouper les lignes (une par devise) par client en conservant l'ordre
+        summaries: Dict[UUID, Tuple[Client, List[ClientQuoteSummary]]] = {}
+        for db_client, db_summary in result.all():
+            if db_client.id not in summaries:
+                summaries[db_client.id] = (self._to_entity(db_client), [])
+            if db_summary is not None:
+                summaries[db_client.id][1].append(self._to_quote_summary(db_summary))
+
+        return list(summaries.values())
+
+    async def find_quote_summary(self, client_id: UUID) -> List[ClientQuoteSummary]:
+        """Récupère les lignes du read model client_quote_summary d'un client."""
+        stmt = select(ClientQuoteSummaryModel).where(ClientQuoteSummaryModel.client_id == client_id)
+        result = await self.session.execute(stmt)
+        return [self._to_quote_summary(db_summary) for db_summary in result.scalars().all()]
+
     async def find_by_email(self, email: str) -> Optional[Client]:
         """Trouve un client par son email."""
         stmt = select(ClientModel).where(ClientModel.email == email)
@@ -81,6 +121,87 @@ class SQLAlchemyClientRepository(ClientRepository):
             return self._to_entity(db_client)
         return None
 
+    async def find_similar(
+        self,
+        candidates: List[ClientMatchCandidate],
+        threshold: float = 0.4,
+        limit: int = 3,
+    ) -> List[ClientMatch]:
+        """Trouve les clients similaires via les index trigram (pg_trgm)."""
+        if not candidates:
+            return []
+
+        # Seuil de l'opérateur % (index GIN), local à la transaction
+        await self.session.execute(
+            select(func.set_config("pg_trgm.similarity_threshold", str(threshold), True))
+        )
+
+        matches: List[ClientMatch] = []
+        for offset in range(0, len(candidates), SIMILARITY_BATCH_SIZE):
+            batch = candidates[offset:offset + SIMILARITY_BATCH_SIZE]
+            rows = [
+                (
+                    offset + position,
+                    candidate.name,
+                    candidate.address.street if candidate.address else None,
+                    candidate.address.city if candidate.address else None,
+                )
+                for position, candidate in enumerate(batch)
+            ]
+            result = await self.session.execute(self._similarity_query(rows, threshold, limit))
+            for candidate_index, db_client, score in result.all():
+                matches.append(
+                    ClientMatch(
+                        candidate_index=candidate_index,
+                        client=self._to_entity(db_client),
+                        score=min(float(score), 1.0),
+                    )
+                )
+
+        return matches
+
+    def _similarity_query(self, rows, threshold: float, limit: int):
+        """Construit la requête de rapprochement : un LATERAL par candidat, servi par les index GIN."""
+        imported = values(
+            column("idx", Integer),
+            column("name", String),
+            column("street", String),
+            column("city", String),
+            name="imported",
+        ).data(rows)
+
+        name_score = func.similarity(ClientModel.name, imported.c.name)
+        address_score = (
+            func.similarity(ClientModel.address_street, imported.c.street) * STREET_WEIGHT
+            + func.similarity(ClientModel.address_city, imported.c.city) * CITY_WEIGHT
+        )
+        score = case(
+            (imported.c.street.is_(None), name_score),
+            else_=name_score * NAME_WEIGHT + address_score,
+        ).label("score")
+
+        candidates = (
+            select(ClientModel, score)
+            .where(
+                or_(
+                    ClientModel.name.op("%")(imported.c.name),
+                    ClientModel.address_street.op("%")(imported.c.street),
+                )
+            )
+            .order_by(score.desc())
+            .limit(limit)
+            .lateral("candidates")
+        )
+        matched_client = aliased(ClientModel, candidates)
+
+        return (
+            select(imported.c.idx, matched_client, candidates.c.score)
+            .select_from(imported)
+            .join(candidates, true())
+            .where(candidates.c.score >= threshold)
+            .order_by(imported.c.idx, candidates.c.score.desc())
+        )
+
     async def delete(self, client_id: UUID) -> bool:
         """Supprime un client."""
         stmt = select(ClientModel).where(ClientModel.id == client_id)
@@ -99,6 +220,17 @@ class SQLAlchemyClientRepository(ClientRepository):
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none() is not None
 
+    @staticmethod
+    def _to_quote_summary(db_summary: ClientQuoteSummaryModel) -> ClientQuoteSummary:
+        """Convertit une ligne du read model en value object."""
+        return ClientQuoteSummary(
+            currency=db_summary.currency,
+            quote_count=db_summary.quote_count,
+            quoted_amount=db_summary.quoted_amount,
+            accepted_amount=db_summary.accepted_amount,
+            pending_amount=db_summary.pending_amount,
+        )
+
     def _to_entity(self, db_client: ClientModel) -> Client:
         """Convertit un modèle SQLAlchemy en entité de domaine."""
         address = Address(
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, Date, Enum, ForeignKey, func, DECIMAL, Integer, JSON
+from sqlalchemy import BigInteger, Column, String, DateTime, Date, Enum, ForeignKey, func, DECIMAL, Integer, JSON, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -13,6 +13,16 @@ class ClientModel(Base):
     """Modèle SQLAlchemy pour la table clients."""
 
     __tablename__ = "clients"
+    __table_args__ = (
+        # Index trigram (extension pg_trgm) pour la détection de doublons à l'import
+        Index("ix_clients_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+        Index(
+            "ix_clients_address_street_trgm",
+            "address_street",
+            postgresql_using="gin",
+            postgresql_ops={"address_street": "gin_trgm_ops"},
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String(255), nullable=False, index=True)
@@ -33,6 +43,28 @@ class ClientModel(Base):
         return f"<ClientModel(id={self.id}, name='{self.name}', email='{self.email}')>"
 
 
+class ClientQuoteSummaryModel(Base):
+    """Modèle SQLAlchemy pour la table client_quote_summary (read model).
+
+    Une ligne par client et par devise, maintenue incrémentalement par le
+    repository des devis et reconstructible via
+    ``python -m infrastructure.commands.rebuild_client_quote_summary``.
+    """
+
+    __tablename__ = "client_quote_summary"
+
+    client_id = Column(UUID(as_uuid=True), ForeignKey("clients.id", ondelete="CASCADE"), primary_key=True)
+    currency = Column(String(3), primary_key=True)
+    quote_count = Column(Integer, nullable=False, default=0)
+    quoted_amount = Column(DECIMAL(14, 2), nullable=False, default=0)
+    accepted_amount = Column(DECIMAL(14, 2), nullable=False, default=0)
+    pending_amount = Column(DECIMAL(14, 2), nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<ClientQuoteSummaryModel(client_id={self.client_id}, currency='{self.currency}', quote_count={self.quote_count})>"
+
+
 class ProjectModel(Base):
     """Modèle SQLAlchemy pour la table projects."""
 
@@ -98,6 +130,13 @@ class QuoteModel(Base):
     """Modèle SQLAlchemy pour la table quotes."""
 
     __tablename__ = "quotes"
+    __table_args__ = (
+        # Index composites pour les recherches filtrées (ex. devis ouverts expirant bientôt)
+        Index("ix_quotes_status_valid_until", "status", "valid_until"),
+        Index("ix_quotes_client_id_created_at", "client_id", "created_at"),
+        Index("ix_quotes_status_total_ttc", "status", "total_ttc"),
+        Index("ix_quotes_created_at", "created_at"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     client_id = Column(UUID(as_uuid=True), ForeignKey("clients.id"), nullable=False, index=True)
@@ -137,3 +176,19 @@ class QuoteItemModel(Base):
 
     def __repr__(self):
         return f"<QuoteItemModel(id={self.id}, description='{self.description}', total={self.total})>"
+
+
+class ResponseCacheVersionModel(Base):
+    """Modèle SQLAlchemy pour la table response_cache_versions.
+
+    Version de chaque étiquette du cache des réponses GraphQL (``Quote``,
+    ``Quote:<id>``), incrémentée par les mutations et relue par tous les workers.
+    """
+
+    __tablename__ = "response_cache_versions"
+
+    tag = Column(String(100), primary_key=True)
+    version = Column(BigInteger, nullable=False)
+
+    def __repr__(self):
+        return f"<ResponseCacheVersionModel(tag='{self.tag}', version={self.version})>"
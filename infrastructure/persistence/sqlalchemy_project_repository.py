@@ -62,9 +62,12 @@ class SQLAlchemyProjectRepository(ProjectRepository):
 
         await self.session.flush()
 
-        # Recharger avec les relations
-        await self.session.refresh(db_project, ["modules"])
-        return self._to_entity(db_project)
+        # Recharger avec les relations (aucun chargement paresseux hors greenlet dans _to_entity)
+        stmt = select(ProjectModel).options(
+            selectinload(ProjectModel.modules).selectinload(ModuleModel.features)
+        ).where(ProjectModel.id == project.id).execution_options(populate_existing=True)
+        result = await self.session.execute(stmt)
+        return self._to_entity(result.scalar_one())
 
     async def find_by_id(self, project_id: UUID) -> Optional[Project]:
         """Trouve un projet par son ID avec ses modules et features."""
@@ -116,6 +119,46 @@ class SQLAlchemyProjectRepository(ProjectRepository):
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none() is not None
 
+    def _sync_modules(self, db_project: ProjectModel, modules: List[Module]):
+        """Aligne les modules (et leurs features) du modèle sur ceux de l'entité."""
+        existing = {db_module.id: db_module for db_module in db_project.modules}
+        synced = []
+        for module in modules:
+            db_module = existing.get(module.id)
+            if db_module is None:
+                synced.append(self._module_to_model(module))
+                continue
+            db_module.name = module.name
+            features = {db_feature.id: db_feature for db_feature in db_module.features}
+            db_module.features = [
+                self._update_feature_model(features[feature.id], feature)
+                if feature.id in features
+                else self._feature_to_model(feature)
+                for feature in module.features
+            ]
+            synced.append(db_module)
+        # Les modules absents de l'entité sont supprimés (cascade delete-orphan)
+        db_project.modules = synced
+
+    def _module_to_model(self, module: Module) -> ModuleModel:
+        return ModuleModel(
+            id=module.id,
+            project_id=module.project_id,
+            name=module.name,
+            features=[self._feature_to_model(feature) for feature in module.features],
+        )
+
+    def _feature_to_model(self, feature: Feature) -> FeatureModel:
+        return self._update_feature_model(FeatureModel(id=feature.id, module_id=feature.module_id), feature)
+
+    def _update_feature_model(self, db_feature: FeatureModel, feature: Feature) -> FeatureModel:
+        db_feature.name = feature.name
+        db_feature.description = feature.description
+        db_feature.complexity = feature.complexity
+        db_feature.profile_allocation = feature.profile_allocation
+        db_feature.extra_hours = feature.extra_hours
+        return db_feature
+
     def _to_entity(self, db_project: ProjectModel) -> Project:
         """Convertit un modèle SQLAlchemy en entité de domaine."""
         period = ProjectPeriod(
@@ -132,4 +175,24 @@ class SQLAlchemyProjectRepository(ProjectRepository):
             period=period,
             created_at=db_project.created_at,
             updated_at=db_project.updated_at,
+            modules=[
+                Module(
+                    id=db_module.id,
+                    project_id=db_module.project_id,
+                    name=db_module.name,
+                    features=[
+                        Feature(
+                            id=db_feature.id,
+                            module_id=db_feature.module_id,
+                            name=db_feature.name,
+                            description=db_feature.description,
+                            complexity=db_feature.complexity,
+                            profile_allocation=db_feature.profile_allocation,
+                            extra_hours=db_feature.extra_hours,
+                        )
+                        for db_feature in db_module.features
+                    ],
+                )
+                for db_module in db_project.modules
+            ],
         )
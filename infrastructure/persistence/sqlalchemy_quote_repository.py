@@ -1,7 +1,9 @@
-from typing import List, Optional
+from dataclasses import replace
+from datetime import datetime
+from typing import AsyncIterator, List, Optional
 from uuid import UUID
-from decimal import Decimal
-from sqlalchemy import select
+from decimal import Decimal, ROUND_HALF_UP
+from sqlalchemy import DateTime, select, func, literal_column, type_coerce, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -10,7 +12,40 @@ from domain.quotes.entities.quote_item import QuoteItem
 from domain.quotes.repositories.quote_repository import QuoteRepository
 from domain.quotes.value_objects.money import Money
 from domain.quotes.value_objects.tax_rate import TaxRate
+from domain.quotes.value_objects.quote_filter import QuoteFilter
+from domain.quotes.value_objects.quote_status import QuoteStatus
+from domain.quotes.value_objects.quote_sort import QuoteSort, QuoteSortField
+from domain.quotes.value_objects.quote_stats import QuoteStatsDimension, QuoteStatsRow
 from infrastructure.persistence.sqlalchemy_models import QuoteModel, QuoteItemModel
+from infrastructure.persistence.client_quote_summary_projector import ClientQuoteSummaryProjector, QuoteFigures
+from infrastructure.tracing import tracer
+
+
+# Correspondance champ de tri -> colonne
+SORT_COLUMNS = {
+    QuoteSortField.CREATED_AT: QuoteModel.created_at,
+    QuoteSortField.VALID_UNTIL: QuoteModel.valid_until,
+    QuoteSortField.TOTAL_HT: QuoteModel.total_ht,
+    QuoteSortField.TOTAL_TTC: QuoteModel.total_ttc,
+    QuoteSortField.TITLE: QuoteModel.title,
+}
+
+# Correspondance axe de regroupement -> expression SQL (le mois dépend du dialecte)
+STATS_DIMENSIONS = {
+    QuoteStatsDimension.STATUS: QuoteModel.status.label("status"),
+    QuoteStatsDimension.CLIENT: QuoteModel.client_id.label("client_id"),
+}
+
+# Début du mois UTC de created_at, indépendant du fuseau de la session :
+# timezone('UTC', ...) est la forme fonctionnelle de « created_at AT TIME ZONE 'UTC' ».
+# Constantes littérales : l'expression du SELECT et celle du GROUP BY restent identiques
+# (SQLite : base de substitution des benchmarks, dates stockées en UTC)
+MONTH_BY_DIALECT = {
+    "postgresql": lambda column: func.date_trunc(
+        literal_column("'month'"), func.timezone(literal_column("'UTC'"), column)
+    ),
+    "sqlite": lambda column: type_coerce(func.strftime("%Y-%m-01 00:00:00", column), DateTime),
+}
 
 
 class SQLAlchemyQuoteRepository(QuoteRepository):
@@ -18,14 +53,23 @@ class SQLAlchemyQuoteRepository(QuoteRepository):
 
     def __init__(self, session: AsyncSession):
         self.session = session
+        self.summary_projector = ClientQuoteSummaryProjector(session)
 
     async def save(self, quote: Quote) -> Quote:
         """Sauvegarde un devis."""
-        # Chercher si le devis existe déjà
-        stmt = select(QuoteModel).where(QuoteModel.id == quote.id).options(selectinload(QuoteModel.items))
+        # Chercher si le devis existe déjà ; verrou de ligne : deux écritures concurrentes
+        # du même devis appliqueraient chacune leur delta au résumé client
+        stmt = (
+            select(QuoteModel)
+            .where(QuoteModel.id == quote.id)
+            .options(selectinload(QuoteModel.items))
+            .with_for_update(of=QuoteModel)
+        )
         result = await self.session.execute(stmt)
         db_quote = result.scalar_one_or_none()
 
+        previous_figures = QuoteFigures.from_model(db_quote) if db_quote else None
+
         if db_quote:
             # Mise à jour
             db_quote.client_id = quote.client_id
@@ -39,19 +83,8 @@ class SQLAlchemyQuoteRepository(QuoteRepository):
             db_quote.valid_until = quote.valid_until
             db_quote.updated_at = quote.updated_at
 
-            # Supprimer les anciens items et ajouter les nouveaux
-            db_quote.items.clear()
-            for item in quote.items:
-                db_item = QuoteItemModel(
-                    id=item.id,
-                    quote_id=item.quote_id,
-                    description=item.description,
-                    unit_price=item.unit_price.amount,
-                    quantity=item.quantity,
-                    total=item.total.amount,
-                    currency=item.unit_price.currency,
-                )
-                db_quote.items.append(db_item)
+            # Appliquer la différence : seules les lignes ajoutées, modifiées ou retirées sont écrites
+            self._sync_items(db_quote, quote.items)
         else:
             # Création
             db_quote = QuoteModel(
@@ -71,21 +104,25 @@ class SQLAlchemyQuoteRepository(QuoteRepository):
 
             # Ajouter les items
             for item in quote.items:
-                db_item = QuoteItemModel(
-                    id=item.id,
-                    quote_id=item.quote_id,
-                    description=item.description,
-                    unit_price=item.unit_price.amount,
-                    quantity=item.quantity,
-                    total=item.total.amount,
-                    currency=item.unit_price.currency,
-                )
-                db_quote.items.append(db_item)
+                db_quote.items.append(self._to_item_model(item))
 
             self.session.add(db_quote)
 
-        await self.session.flush()
-        await self.session.refresh(db_quote)
+        with tracer.span("orm.flush", {"quote.id": str(quote.id), "quote.item_count": len(quote.items)}):
+            await self.session.flush()
+        with tracer.span("orm.refresh", {"quote.id": str(quote.id)}):
+            # Relecture avec les items : aucun chargement paresseux hors greenlet dans _to_entity
+            result = await self.session.execute(
+                select(QuoteModel)
+                .where(QuoteModel.id == quote.id)
+                .options(selectinload(QuoteModel.items))
+                .execution_options(populate_existing=True)
+            )
+            db_quote = result.scalar_one()
+
+        # Maintenir le résumé financier du client dans la même transaction
+        await self.summary_projector.apply(previous_figures, QuoteFigures.from_model(db_quote))
+
         return self._to_entity(db_quote)
 
     async def find_by_id(self, quote_id: UUID) -> Optional[Quote]:
@@ -98,6 +135,48 @@ class SQLAlchemyQuoteRepository(QuoteRepository):
             return self._to_entity(db_quote)
         return None
 
+    async def find_by_ids(self, quote_ids: List[UUID], for_update: bool = False) -> List[Quote]:
+        """Trouve plusieurs devis en une requête (verrouillés si ``for_update``)."""
+        if not quote_ids:
+            return []
+        stmt = select(QuoteModel).where(QuoteModel.id.in_(quote_ids)).options(selectinload(QuoteModel.items))
+        if for_update:
+            stmt = stmt.with_for_update(of=QuoteModel)
+        result = await self.session.execute(stmt)
+
+        return [self._to_entity(db_quote) for db_quote in result.scalars().all()]
+
+    async def update_status(self, quote_ids: List[UUID], status: QuoteStatus, updated_at: datetime) -> int:
+        """Passe les devis au statut donné en une mise à jour ensembliste."""
+        if not quote_ids:
+            return 0
+
+        # Contributions au résumé avant la mise à jour, par client, devise et statut
+        before = await self.session.execute(
+            select(QuoteModel.client_id, QuoteModel.currency, QuoteModel.status, func.sum(QuoteModel.total_ttc))
+            .where(QuoteModel.id.in_(quote_ids))
+            .group_by(QuoteModel.client_id, QuoteModel.currency, QuoteModel.status)
+        )
+        groups = before.all()
+
+        result = await self.session.execute(
+            update(QuoteModel)
+            .where(QuoteModel.id.in_(quote_ids))
+            .values(status=status, updated_at=updated_at)
+        )
+
+        # Un delta du résumé par groupe plutôt qu'un par devis
+        for client_id, currency, previous_status, total_ttc in groups:
+            previous = QuoteFigures(
+                client_id=client_id,
+                currency=currency,
+                status=previous_status,
+                total_ttc=Decimal(str(total_ttc or 0)).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP),
+            )
+            await self.summary_projector.apply(previous, replace(previous, status=status))
+
+        return result.rowcount
+
     async def find_all(self, skip: int = 0, limit: int = 100) -> List[Quote]:
         """Récupère tous les devis avec pagination."""
         stmt = select(QuoteModel).offset(skip).limit(limit).options(selectinload(QuoteModel.items))
@@ -106,6 +185,75 @@ class SQLAlchemyQuoteRepository(QuoteRepository):
 
         return [self._to_entity(db_quote) for db_quote in db_quotes]
 
+    async def find_by_filter(
+        self,
+        quote_filter: QuoteFilter,
+        sort: Optional[QuoteSort] = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> List[Quote]:
+        """Récupère les devis correspondant aux critères, triés et paginés."""
+        result = await self.session.execute(self._filtered_statement(quote_filter, sort, skip, limit))
+        db_quotes = result.scalars().all()
+
+        return [self._to_entity(db_quote) for db_quote in db_quotes]
+
+    async def stream_by_filter(
+        self,
+        quote_filter: QuoteFilter,
+        sort: Optional[QuoteSort] = None,
+        skip: int = 0,
+        limit: int = 100,
+        batch_size: int = 100,
+    ) -> AsyncIterator[Quote]:
+        """Produit les devis au fil de la lecture, par lots de ``batch_size`` lignes (curseur serveur)."""
+        stmt = self._filtered_statement(quote_filter, sort, skip, limit).execution_options(yield_per=batch_size)
+        result = await self.session.stream_scalars(stmt)
+        async for db_quote in result:
+            yield self._to_entity(db_quote)
+
+    async def aggregate(
+        self,
+        group_by: List[QuoteStatsDimension],
+        quote_filter: QuoteFilter,
+    ) -> List[QuoteStatsRow]:
+        """Agrège les devis en base (GROUP BY) sur les totaux stockés."""
+        dimensions = [self._stats_dimension(dimension) for dimension in group_by]
+        group_columns = [*dimensions, QuoteModel.currency]
+
+        stmt = self._apply_filter(
+            select(
+                *group_columns,
+                func.count(QuoteModel.id).label("count"),
+                func.coalesce(func.sum(QuoteModel.total_ht), 0).label("total_ht"),
+                func.coalesce(func.sum(QuoteModel.total_ttc), 0).label("total_ttc"),
+            ),
+            quote_filter,
+        ).group_by(*group_columns).order_by(*group_columns)
+        result = await self.session.execute(stmt)
+
+        rows = []
+        for row in result.mappings().all():
+            month = row.get("month")
+            rows.append(
+                QuoteStatsRow(
+                    status=row.get("status"),
+                    client_id=row.get("client_id"),
+                    month=month.date() if month is not None else None,
+                    currency=row["currency"],
+                    count=row["count"],
+                    total_ht=Decimal(str(row["total_ht"])),
+                    total_ttc=Decimal(str(row["total_ttc"])),
+                )
+            )
+        return rows
+
+    def _stats_dimension(self, dimension: QuoteStatsDimension):
+        """Expression SQL d'un axe de regroupement."""
+        if dimension == QuoteStatsDimension.MONTH:
+            return MONTH_BY_DIALECT[self.session.bind.dialect.name](QuoteModel.created_at).label("month")
+        return STATS_DIMENSIONS[dimension]
+
     async def find_by_client_id(self, client_id: UUID) -> List[Quote]:
         """Trouve tous les devis d'un client."""
         stmt = select(QuoteModel).where(QuoteModel.client_id == client_id).options(selectinload(QuoteModel.items))
@@ -129,8 +277,10 @@ class SQLAlchemyQuoteRepository(QuoteRepository):
         db_quote = result.scalar_one_or_none()
 
         if db_quote:
+            previous_figures = QuoteFigures.from_model(db_quote)
             await self.session.delete(db_quote)
             await self.session.flush()
+            await self.summary_projector.apply(previous_figures, None)
             return True
         return False
 
@@ -140,6 +290,81 @@ class SQLAlchemyQuoteRepository(QuoteRepository):
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none() is not None
 
+    def _sync_items(self, db_quote: QuoteModel, items: List[QuoteItem]):
+        """Aligne les lignes chargées sur celles de l'entité sans réécrire les lignes inchangées."""
+        db_items = {db_item.id: db_item for db_item in db_quote.items}
+        wanted_ids = {item.id for item in items}
+
+        for db_item in [db_item for item_id, db_item in db_items.items() if item_id not in wanted_ids]:
+            # delete-orphan : la ligne retirée de la collection est supprimée au flush
+            db_quote.items.remove(db_item)
+
+        for item in items:
+            db_item = db_items.get(item.id)
+            if db_item is None:
+                db_quote.items.append(self._to_item_model(item))
+                continue
+            # Affectation conditionnelle : l'unité de travail n'émet d'UPDATE que pour les lignes modifiées
+            values = {
+                "description": item.description,
+                "unit_price": item.unit_price.amount,
+                "quantity": item.quantity,
+                "total": item.total.amount,
+                "currency": item.unit_price.currency,
+            }
+            for column, value in values.items():
+                if getattr(db_item, column) != value:
+                    setattr(db_item, column, value)
+
+    @staticmethod
+    def _to_item_model(item: QuoteItem) -> QuoteItemModel:
+        """Convertit un item en modèle SQLAlchemy."""
+        return QuoteItemModel(
+            id=item.id,
+            quote_id=item.quote_id,
+            description=item.description,
+            unit_price=item.unit_price.amount,
+            quantity=item.quantity,
+            total=item.total.amount,
+            currency=item.unit_price.currency,
+        )
+
+    def _filtered_statement(self, quote_filter: QuoteFilter, sort: Optional[QuoteSort], skip: int, limit: int):
+        """SELECT filtré, trié (ID en départage) et paginé, lignes de devis chargées par lot."""
+        sort = sort or QuoteSort()
+        column = SORT_COLUMNS[sort.field]
+        order_by = column.desc() if sort.descending else column.asc()
+
+        return (
+            self._apply_filter(select(QuoteModel), quote_filter)
+            .order_by(order_by, QuoteModel.id)
+            .offset(skip)
+            .limit(limit)
+            .options(selectinload(QuoteModel.items))
+        )
+
+    def _apply_filter(self, stmt, quote_filter: QuoteFilter):
+        """Ajoute les critères du filtre à la clause WHERE."""
+        if quote_filter.statuses:
+            stmt = stmt.where(QuoteModel.status.in_(quote_filter.statuses))
+        if quote_filter.client_id is not None:
+            stmt = stmt.where(QuoteModel.client_id == quote_filter.client_id)
+        if quote_filter.project_id is not None:
+            stmt = stmt.where(QuoteModel.project_id == quote_filter.project_id)
+        if quote_filter.valid_until_from is not None:
+            stmt = stmt.where(QuoteModel.valid_until >= quote_filter.valid_until_from)
+        if quote_filter.valid_until_to is not None:
+            stmt = stmt.where(QuoteModel.valid_until <= quote_filter.valid_until_to)
+        if quote_filter.created_from is not None:
+            stmt = stmt.where(QuoteModel.created_at >= quote_filter.created_from)
+        if quote_filter.created_to is not None:
+            stmt = stmt.where(QuoteModel.created_at <= quote_filter.created_to)
+        if quote_filter.min_total_ttc is not None:
+            stmt = stmt.where(QuoteModel.total_ttc >= quote_filter.min_total_ttc)
+        if quote_filter.max_total_ttc is not None:
+            stmt = stmt.where(QuoteModel.total_ttc <= quote_filter.max_total_ttc)
+        return stmt
+
     def _to_entity(self, db_quote: QuoteModel) -> Quote:
         """Convertit un modèle SQLAlchemy en entité de domaine."""
         tax_rate = TaxRate(Decimal(str(db_quote.tax_rate)))
@@ -0,0 +1,345 @@
+import json
+import logging
+import os
+import queue
+import random
+import threading
+import time
+import urllib.request
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Codes de statut OTLP
+STATUS_UNSET = 0
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+# Types de span OTLP
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+SPAN_KIND_CLIENT = 3
+
+
+class Span:
+    """Span compatible OpenTelemetry (identifiants W3C, attributs, statut)."""
+
+    __slots__ = (
+        "trace_id", "span_id", "parent_span_id", "name", "kind",
+        "start_ns", "end_ns", "attributes", "status_code", "status_message",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        trace_id: str,
+        parent_span_id: Optional[str] = None,
+        kind: int = SPAN_KIND_INTERNAL,
+        attributes: Optional[Dict[str, Any]] = None,
+    ):
+        self.trace_id = trace_id
+        self.span_id = os.urandom(8).hex()
+        self.parent_span_id = parent_span_id
+        self.name = name
+        self.kind = kind
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes: Dict[str, Any] = dict(attributes or {})
+        self.status_code = STATUS_UNSET
+        self.status_message = ""
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    def record_exception(self, exception: BaseException):
+        """Marque le span en erreur."""
+        self.status_code = STATUS_ERROR
+        self.status_message = f"{type(exception).__name__}: {exception}"
+        self.attributes["exception.type"] = type(exception).__name__
+
+    def end(self):
+        if self.end_ns is None:
+            self.end_ns = time.time_ns()
+
+    def to_otlp(self) -> Dict:
+        """Représentation OTLP/JSON du span."""
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns or self.start_ns),
+            "attributes": [_otlp_attribute(key, value) for key, value in self.attributes.items()],
+            "status": {"code": self.status_code, "message": self.status_message},
+        }
+        if self.parent_span_id:
+            span["parentSpanId"] = self.parent_span_id
+        return span
+
+
+def _otlp_attribute(key: str, value: Any) -> Dict:
+    """Attribut au format OTLP/JSON (valeur typée)."""
+    if isinstance(value, bool):
+        typed = {"boolValue": value}
+    elif isinstance(value, int):
+        typed = {"intValue": str(value)}
+    elif isinstance(value, float):
+        typed = {"doubleValue": value}
+    else:
+        typed = {"stringValue": str(value)}
+    return {"key": key, "value": typed}
+
+
+# Span courant ; _NOT_SAMPLED marque une trace écartée par l'échantillonnage
+_NOT_SAMPLED = object()
+_current_span: ContextVar[Any] = ContextVar("current_span", default=None)
+
+
+def current_span() -> Optional[Span]:
+    """Span actif de la tâche courante, s'il est enregistré."""
+    span = _current_span.get()
+    return span if isinstance(span, Span) else None
+
+
+def set_attribute(key: str, value: Any):
+    """Ajoute un attribut au span actif (sans effet hors trace)."""
+    span = current_span()
+    if span is not None:
+        span.set_attribute(key, value)
+
+
+def parse_traceparent(header: Optional[str]) -> Optional[Tuple[str, str, bool]]:
+    """Lit un en-tête W3C ``traceparent`` : (trace_id, parent_span_id, sampled)."""
+    if not header:
+        return None
+    parts = header.strip().split("-")
+    if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+        return None
+    version, trace_id, parent_span_id, flags = parts
+    if version == "ff" or trace_id == "0" * 32 or parent_span_id == "0" * 16:
+        return None
+    try:
+        sampled = bool(int(flags, 16) & 0x01)
+    except ValueError:
+        return None
+    return trace_id, parent_span_id, sampled
+
+
+class SpanExporter:
+    """Destination d'un lot de spans terminés."""
+
+    def export(self, spans: List[Span]):
+        raise NotImplementedError
+
+    def shutdown(self):
+        pass
+
+
+def _otlp_payload(spans: List[Span], service_name: str) -> Dict:
+    """Requête ExportTraceServiceRequest (OTLP/JSON)."""
+    return {
+        "resourceSpans": [
+            {
+                "resource": {"attributes": [_otlp_attribute("service.name", service_name)]},
+                "scopeSpans": [
+                    {
+                        "scope": {"name": "memory_business"},
+                        "spans": [span.to_otlp() for span in spans],
+                    }
+                ],
+            }
+        ]
+    }
+
+
+class FileSpanExporter(SpanExporter):
+    """Écrit chaque lot comme une ligne OTLP/JSON (rejouable vers un collecteur)."""
+
+    def __init__(self, path: str, service_name: str):
+        self.path = path
+        self.service_name = service_name
+
+    def export(self, spans: List[Span]):
+        with open(self.path, "a", encoding="utf-8") as output:
+            output.write(json.dumps(_otlp_payload(spans, self.service_name)) + "\n")
+
+
+class OTLPHttpSpanExporter(SpanExporter):
+    """Envoie les lots à un collecteur OTLP/HTTP (encodage JSON)."""
+
+    def __init__(self, endpoint: str, service_name: str, timeout_seconds: float = 5.0):
+        self.endpoint = endpoint
+        self.service_name = service_name
+        self.timeout_seconds = timeout_seconds
+
+    def export(self, spans: List[Span]):
+        request = urllib.request.Request(
+            self.endpoint,
+            data=json.dumps(_otlp_payload(spans, self.service_name)).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout_seconds):
+            pass
+
+
+class BatchSpanProcessor:
+    """Exporte les spans par lots depuis un thread dédié (hors boucle asyncio)."""
+
+    def __init__(
+        self,
+        exporter: SpanExporter,
+        max_batch_size: int = 512,
+        schedule_delay_seconds: float = 2.0,
+        max_queue_size: int = 10000,
+    ):
+        self.exporter = exporter
+        self.max_batch_size = max_batch_size
+        self.schedule_delay_seconds = schedule_delay_seconds
+        self.dropped_spans = 0
+        self._queue: "queue.Queue[Optional[Span]]" = queue.Queue(max_queue_size)
+        self._thread = threading.Thread(target=self._run, name="span-exporter", daemon=True)
+        self._thread.start()
+
+    def after_fork(self):
+        """Relance le thread d'export dans un processus forké (il n'existe que dans le parent)."""
+        self._queue = queue.Queue(self._queue.maxsize)
+        self._thread = threading.Thread(target=self._run, name="span-exporter", daemon=True)
+        self._thread.start()
+
+    def on_end(self, span: Span):
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            # Ne jamais bloquer une requête pour l'export
+            self.dropped_spans += 1
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            batch: List[Span] = []
+            deadline = time.monotonic() + self.schedule_delay_seconds
+            while len(batch) < self.max_batch_size:
+                try:
+                    span = self._queue.get(timeout=max(deadline - time.monotonic(), 0.0))
+                except queue.Empty:
+                    break
+                if span is None:
+                    stopping = True
+                    break
+                batch.append(span)
+            if batch:
+                try:
+                    self.exporter.export(batch)
+                except Exception:
+                    logger.warning("Span export failed, dropping %d spans", len(batch), exc_info=True)
+
+    def shutdown(self):
+        """Exporte les spans en attente puis arrête le thread."""
+        self._queue.put(None)
+        self._thread.join(timeout=10)
+        self.exporter.shutdown()
+
+
+class Tracer:
+    """Crée les spans imbriqués via un ContextVar (suivi à travers les await)."""
+
+    def __init__(self, processor: Optional[BatchSpanProcessor] = None, sample_rate: float = 1.0):
+        self.processor = processor
+        self.sample_rate = sample_rate
+
+    @property
+    def enabled(self) -> bool:
+        return self.processor is not None
+
+    def start_span(
+        self,
+        name: str,
+        attributes: Optional[Dict[str, Any]] = None,
+        kind: int = SPAN_KIND_INTERNAL,
+        traceparent: Optional[str] = None,
+    ) -> Tuple[Optional[Span], Optional[Token]]:
+        """Démarre un span enfant du span actif et le rend courant.
+
+        Retourne ``(None, token)`` si la trace n'est pas échantillonnée, et
+        ``(None, None)`` si le traçage est désactivé.
+        """
+        if self.processor is None:
+            return None, None
+
+        parent = _current_span.get()
+        if parent is _NOT_SAMPLED:
+            return None, None
+
+        if isinstance(parent, Span):
+            span = Span(name, parent.trace_id, parent.span_id, kind, attributes)
+        else:
+            remote = parse_traceparent(traceparent)
+            if remote is not None:
+                trace_id, parent_span_id, sampled = remote
+            else:
+                trace_id, parent_span_id = os.urandom(16).hex(), None
+                sampled = self.sample_rate >= 1.0 or random.random() < self.sample_rate
+            if not sampled:
+                return None, _current_span.set(_NOT_SAMPLED)
+            span = Span(name, trace_id, parent_span_id, kind, attributes)
+
+        return span, _current_span.set(span)
+
+    def end_span(self, span: Optional[Span], token: Optional[Token]):
+        """Termine le span et restaure le span parent."""
+        if token is not None:
+            _current_span.reset(token)
+        if span is not None:
+            span.end()
+            self.processor.on_end(span)
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        attributes: Optional[Dict[str, Any]] = None,
+        kind: int = SPAN_KIND_INTERNAL,
+        traceparent: Optional[str] = None,
+    ) -> Iterator[Optional[Span]]:
+        """Span couvrant le bloc ; les exceptions le marquent en erreur."""
+        span, token = self.start_span(name, attributes, kind, traceparent)
+        try:
+            yield span
+        except BaseException as error:
+            if span is not None:
+                span.record_exception(error)
+            raise
+        finally:
+            self.end_span(span, token)
+
+    def after_fork(self):
+        if self.processor is not None:
+            self.processor.after_fork()
+
+    def shutdown(self):
+        if self.processor is not None:
+            self.processor.shutdown()
+
+
+def _build_tracer() -> Tracer:
+    """Tracer configuré d'après les settings (inactif si TRACING_ENABLED est faux)."""
+    from app.core.config import settings
+
+    if not settings.TRACING_ENABLED:
+        return Tracer()
+
+    if settings.TRACING_EXPORTER == "otlp":
+        exporter: SpanExporter = OTLPHttpSpanExporter(settings.TRACING_OTLP_ENDPOINT, settings.TRACING_SERVICE_NAME)
+    elif settings.TRACING_EXPORTER == "file":
+        exporter = FileSpanExporter(settings.TRACING_FILE_PATH, settings.TRACING_SERVICE_NAME)
+    else:
+        raise ValueError(f"Unknown tracing exporter: {settings.TRACING_EXPORTER}")
+
+    return Tracer(BatchSpanProcessor(exporter), sample_rate=settings.TRACING_SAMPLE_RATE)
+
+
+tracer = _build_tracer()
@@ -0,0 +1,49 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from app.core.config import settings
+from app.core.startup import startup_timer
+from app.middleware.profiling import token_matches
+from infrastructure.database.session import pool_stats, query_observer
+
+
+async def require_diagnostics_token(
+    x_diagnostics_token: Optional[str] = Header(None),
+    diagnostics_token: Optional[str] = Query(None),
+):
+    """Accès réservé aux détenteurs du jeton de diagnostic (empreintes SQL, remise à zéro)."""
+    if not token_matches(x_diagnostics_token or diagnostics_token, settings.DIAGNOSTICS_TOKEN):
+        raise HTTPException(status_code=403, detail="Invalid diagnostics token")
+
+
+router = APIRouter(
+    prefix="/diagnostics",
+    tags=["diagnostics"],
+    dependencies=[Depends(require_diagnostics_token)],
+)
+
+
+@router.get("/pool")
+async def connection_pools():
+    """État et métriques des pools de connexions (attente de checkout, overflow, pre-ping)."""
+    return pool_stats()
+
+
+@router.get("/queries")
+async def query_statistics(
+    limit: int = Query(50, ge=1, le=500),
+    order_by: str = Query("total_ms", pattern="^(total_ms|mean_ms|max_ms|count|errors)$"),
+):
+    """Latences agrégées par empreinte de requête SQL."""
+    return query_observer.snapshot(limit=limit, order_by=order_by)
+
+
+@router.delete("/queries", status_code=204)
+async def reset_query_statistics():
+    """Remet à zéro les agrégats de requêtes."""
+    query_observer.reset()
+
+
+@router.get("/startup")
+async def startup_timings():
+    """Durées du démarrage de ce processus (interpréteur, imports, base de données)."""
+    return startup_timer.snapshot()
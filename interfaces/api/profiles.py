@@ -0,0 +1,40 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+from app.core.config import settings
+from app.core.profiling import request_profiler
+from app.middleware.profiling import token_matches
+
+
+async def require_profiling_token(
+    x_profile_token: Optional[str] = Header(None),
+    profile_token: Optional[str] = Query(None),
+):
+    """Accès réservé aux détenteurs du jeton de profilage."""
+    if not token_matches(x_profile_token or profile_token, settings.PROFILING_TOKEN):
+        raise HTTPException(status_code=403, detail="Invalid profiling token")
+
+
+router = APIRouter(
+    prefix="/diagnostics/profiles",
+    tags=["diagnostics"],
+    dependencies=[Depends(require_profiling_token)],
+)
+
+
+@router.get("")
+async def list_profiles():
+    """Profils enregistrés, du plus récent au plus ancien."""
+    return request_profiler.store.list()
+
+
+@router.get("/{profile_id}", response_class=PlainTextResponse)
+async def download_profile(profile_id: str):
+    """Profil au format collapsed (flamegraph.pl, speedscope)."""
+    profile = request_profiler.store.read(profile_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return PlainTextResponse(
+        profile,
+        headers={"Content-Disposition": f'attachment; filename="{profile_id}.collapsed"'},
+    )
@@ -0,0 +1,111 @@
+"""Test de charge GraphQL : python -m loadtest --base-url http://localhost:8000 [--mix read_heavy].
+
+Les opérations viennent de la collection Postman ; un mélange (loadtest/mixes/<nom>.json)
+associe un poids à chaque opération. Les identifiants fictifs des exemples sont
+remplacés par des identifiants réels lus sur l'instance ciblée.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+from typing import Dict, List
+
+import httpx
+
+from loadtest.collection import VariableRenderer, load_operations
+from loadtest.runner import LoadTest, LoadTestConfig
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_COLLECTION = os.path.join(ROOT, "postman", "Memory-Business-API.postman_collection.json")
+MIXES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "mixes")
+
+ID_POOL_QUERY = """
+query LoadTestIds($limit: Int!) {
+    clients(limit: $limit) { id }
+    projects(limit: $limit) { id }
+    quotes(limit: $limit) { id }
+}
+"""
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="python -m loadtest", description="Replay weighted GraphQL operation mixes.")
+    parser.add_argument("--base-url", default="http://localhost:8000", help="Target instance")
+    parser.add_argument("--mix", default="read_heavy", help="Mix name in loadtest/mixes or path to a mix JSON file")
+    parser.add_argument("--collection", default=DEFAULT_COLLECTION, help="Postman collection")
+    parser.add_argument("-c", "--concurrency", type=int, default=16, help="Requests in flight")
+    parser.add_argument("-d", "--duration", type=float, default=60.0, help="Measured duration (seconds)")
+    parser.add_argument("--warmup", type=float, default=5.0, help="Unmeasured warmup (seconds)")
+    parser.add_argument("--rate", type=float, help="Target requests/s (open loop); default: closed loop")
+    parser.add_argument("--id-pool-size", type=int, default=500, help="Existing ids fetched per entity")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for operation choice and variables")
+    parser.add_argument("--output", help="Write the report as JSON to this file")
+    return parser.parse_args(argv)
+
+
+def load_mix(name: str) -> Dict:
+    """Mélange : poids par opération (``operations``) et variables remplacées (``variables``)."""
+    path = name if name.endswith(".json") else os.path.join(MIXES_DIR, f"{name}.json")
+    with open(path, encoding="utf-8") as mix_file:
+        return json.load(mix_file)
+
+
+async def fetch_id_pools(base_url: str, limit: int) -> Dict[str, List[str]]:
+    """Identifiants existants par entité (remplacent les identifiants fictifs)."""
+    async with httpx.AsyncClient(base_url=base_url, timeout=30) as client:
+        response = await client.post("/graphql", json={"query": ID_POOL_QUERY, "variables": {"limit": limit}})
+        response.raise_for_status()
+        data = response.json()["data"]
+    return {
+        "client": [row["id"] for row in data["clients"]],
+        "project": [row["id"] for row in data["projects"]],
+        "quote": [row["id"] for row in data["quotes"]],
+    }
+
+
+def format_report(report: List[Dict], config: LoadTestConfig) -> str:
+    mode = f"open loop at {config.rate:g} req/s" if config.rate else "closed loop"
+    lines = [f"{config.duration_seconds:g}s measured, concurrency {config.concurrency}, {mode}", ""]
+    header = f"{'operation':<34} {'requests':>9} {'req/s':>9} {'errors':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}"
+    lines += [header, "-" * len(header)]
+    for row in report:
+        lines.append(
+            f"{row['operation']:<34} {row['requests']:>9} {row['throughput_rps']:>9.1f} {row['error_rate']:>8.2%} "
+            f"{row['p50_ms']:>9.1f} {row['p95_ms']:>9.1f} {row['p99_ms']:>9.1f} {row['max_ms']:>9.1f}"
+        )
+    return "\n".join(lines)
+
+
+async def main(args) -> int:
+    operations = load_operations(args.collection)
+    id_pools = await fetch_id_pools(args.base_url, args.id_pool_size)
+    for entity, pool in id_pools.items():
+        if not pool:
+            print(f"Warning: no existing {entity}; operations on a {entity} id will target a missing one",
+                  file=sys.stderr)
+
+    mix = load_mix(args.mix)
+    config = LoadTestConfig(
+        base_url=args.base_url,
+        mix=mix["operations"],
+        concurrency=args.concurrency,
+        duration_seconds=args.duration,
+        warmup_seconds=args.warmup,
+        rate=args.rate,
+        seed=args.seed,
+    )
+    load_test = LoadTest(config, operations, VariableRenderer(id_pools, random.Random(args.seed), mix.get("variables")))
+    report = await load_test.run()
+
+    print(format_report(report, config))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            json.dump({"config": vars(args), "results": report}, output, indent=2)
+            output.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(parse_args(sys.argv[1:]))))
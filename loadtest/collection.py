@@ -0,0 +1,121 @@
+import json
+import random
+import re
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+# Identifiant fictif des exemples de la collection, remplacé par un identifiant réel
+PLACEHOLDER_ID = "00000000-0000-0000-0000-000000000000"
+_DYNAMIC_VARIABLE = re.compile(r"\{\{\$(\w+)([+-]\d+)?\}\}")
+_ROOT_FIELD = re.compile(r"\{\s*(\w+)")
+ENTITIES = ("quote", "project", "client")
+
+
+@dataclass
+class Operation:
+    """Requête GraphQL de la collection Postman."""
+
+    name: str
+    query: str
+    variables_template: str
+    root_field: str
+
+    def entity(self, key: str) -> Optional[str]:
+        """Entité désignée par une variable d'identifiant (clientId, quoteId, id...)."""
+        for entity in ENTITIES:
+            if key.lower() == f"{entity}id":
+                return entity
+        if key == "id":
+            for entity in ENTITIES:
+                if entity in self.root_field.lower():
+                    return entity
+        return None
+
+
+def load_operations(path: str) -> Dict[str, Operation]:
+    """Requêtes GraphQL de la collection, par nom."""
+    with open(path, encoding="utf-8") as collection_file:
+        collection = json.load(collection_file)
+
+    operations: Dict[str, Operation] = {}
+    pending = list(collection["item"])
+    while pending:
+        item = pending.pop(0)
+        if "item" in item:
+            pending.extend(item["item"])
+            continue
+        body = item["request"].get("body") or {}
+        if body.get("mode") != "graphql":
+            continue
+        query = body["graphql"]["query"]
+        match = _ROOT_FIELD.search(query)
+        operations[item["name"]] = Operation(
+            name=item["name"],
+            query=query,
+            variables_template=body["graphql"].get("variables") or "",
+            root_field=match.group(1) if match else "",
+        )
+    return operations
+
+
+class VariableRenderer:
+    """Instancie les variables d'une opération : variables dynamiques Postman et identifiants réels."""
+
+    def __init__(
+        self,
+        id_pools: Dict[str, List[str]],
+        rng: random.Random,
+        overrides: Optional[Dict[str, Dict[str, Any]]] = None,
+    ):
+        self.id_pools = id_pools
+        self.rng = rng
+        # Variables remplacées par opération (ex. dates d'exemple déjà passées)
+        self.overrides = {name: json.dumps(values) for name, values in (overrides or {}).items()}
+
+    def _dynamic(self, name: str, offset: Optional[str] = None) -> str:
+        if name == "today":
+            # Extension propre au harnais : {{$today}}, {{$today+30}} (jours)
+            return (date.today() + timedelta(days=int(offset or 0))).isoformat()
+        if name == "guid":
+            return str(uuid.UUID(int=self.rng.getrandbits(128), version=4))
+        if name == "randomEmail":
+            return f"load-{uuid.UUID(int=self.rng.getrandbits(128), version=4).hex[:16]}@loadtest.example"
+        if name == "randomInt":
+            return str(self.rng.randint(0, 1000))
+        if name == "timestamp":
+            return str(int(time.time()))
+        if name == "isoTimestamp":
+            return datetime.now(timezone.utc).isoformat()
+        raise ValueError(f"Unsupported Postman dynamic variable: ${name}")
+
+    def _substitute(self, template: str) -> str:
+        return _DYNAMIC_VARIABLE.sub(lambda match: self._dynamic(match.group(1), match.group(2)), template)
+
+    def render(self, operation: Operation) -> Dict[str, Any]:
+        template = self._substitute(operation.variables_template)
+        variables = json.loads(template) if template.strip() else {}
+        if operation.name in self.overrides:
+            variables = _merge(variables, json.loads(self._substitute(self.overrides[operation.name])))
+        return self._replace_ids(operation, variables)
+
+    def _replace_ids(self, operation: Operation, value: Any, key: str = "") -> Any:
+        if isinstance(value, dict):
+            return {name: self._replace_ids(operation, item, name) for name, item in value.items()}
+        if isinstance(value, list):
+            return [self._replace_ids(operation, item, key) for item in value]
+        if value == PLACEHOLDER_ID:
+            entity = operation.entity(key)
+            pool = self.id_pools.get(entity or "")
+            if pool:
+                return self.rng.choice(pool)
+        return value
+
+
+def _merge(base: Any, override: Any) -> Any:
+    """Fusion récursive : les valeurs de ``override`` remplacent celles de ``base``."""
+    if isinstance(base, dict) and isinstance(override, dict):
+        return {**base, **{key: _merge(base.get(key), value) for key, value in override.items()}}
+    return override
@@ -0,0 +1,163 @@
+import asyncio
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import httpx
+
+from loadtest.collection import Operation, VariableRenderer
+
+
+def percentile(ordered: List[float], ratio: float) -> float:
+    """Percentile par rang le plus proche sur une liste triée."""
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, max(int(round(ratio * len(ordered))) - 1, 0))]
+
+
+@dataclass
+class OperationStats:
+    """Latences (secondes) et erreurs d'une opération."""
+
+    name: str
+    latencies: List[float] = field(default_factory=list)
+    http_errors: int = 0
+    graphql_errors: int = 0
+    transport_errors: int = 0
+
+    @property
+    def requests(self) -> int:
+        return len(self.latencies)
+
+    @property
+    def errors(self) -> int:
+        return self.http_errors + self.graphql_errors + self.transport_errors
+
+    def summary(self, elapsed_seconds: float) -> Dict:
+        ordered = sorted(self.latencies)
+        return {
+            "operation": self.name,
+            "requests": self.requests,
+            "throughput_rps": round(self.requests / elapsed_seconds, 2) if elapsed_seconds else 0.0,
+            "error_rate": round(self.errors / self.requests, 4) if self.requests else 0.0,
+            "http_errors": self.http_errors,
+            "graphql_errors": self.graphql_errors,
+            "transport_errors": self.transport_errors,
+            "p50_ms": round(percentile(ordered, 0.50) * 1000, 2),
+            "p95_ms": round(percentile(ordered, 0.95) * 1000, 2),
+            "p99_ms": round(percentile(ordered, 0.99) * 1000, 2),
+            "max_ms": round(ordered[-1] * 1000, 2) if ordered else 0.0,
+        }
+
+
+@dataclass
+class LoadTestConfig:
+    base_url: str
+    mix: Dict[str, float]
+    concurrency: int = 16
+    duration_seconds: float = 60.0
+    warmup_seconds: float = 5.0
+    # Débit cible (requêtes/s) ; None = boucle fermée, chaque worker enchaîne ses requêtes
+    rate: Optional[float] = None
+    timeout_seconds: float = 30.0
+    seed: int = 0
+
+
+class LoadTest:
+    """Rejoue un mélange pondéré d'opérations GraphQL avec ``concurrency`` requêtes en vol."""
+
+    def __init__(self, config: LoadTestConfig, operations: Dict[str, Operation], renderer: VariableRenderer):
+        unknown = set(config.mix) - set(operations)
+        if unknown:
+            raise ValueError(f"Unknown operations in mix: {', '.join(sorted(unknown))}")
+        self.config = config
+        self.operations = [operations[name] for name in config.mix]
+        self.weights = [config.mix[name] for name in config.mix]
+        self.renderer = renderer
+        self.rng = random.Random(config.seed)
+        self.stats: Dict[str, OperationStats] = {name: OperationStats(name) for name in config.mix}
+        self.elapsed_seconds = 0.0
+
+    async def _execute(self, client: httpx.AsyncClient, operation: Operation, record: bool, intended_start: float):
+        payload = {"query": operation.query, "variables": self.renderer.render(operation)}
+        stats = self.stats[operation.name]
+        try:
+            response = await client.post("/graphql", json=payload)
+            failed_http = response.status_code != 200
+            failed_graphql = not failed_http and bool(response.json().get("errors"))
+            failed_transport = False
+        except httpx.HTTPError:
+            failed_http = failed_graphql = False
+            failed_transport = True
+        except ValueError:
+            # Réponse 200 dont le corps n'est pas du JSON (page d'erreur d'un proxy)
+            failed_http = True
+            failed_graphql = failed_transport = False
+
+        if not record:
+            return
+        # En débit imposé, la latence part de l'instant prévu (pas d'omission coordonnée)
+        stats.latencies.append(time.perf_counter() - intended_start)
+        stats.http_errors += failed_http
+        stats.graphql_errors += failed_graphql
+        stats.transport_errors += failed_transport
+
+    def _next_operation(self) -> Operation:
+        return self.rng.choices(self.operations, weights=self.weights)[0]
+
+    async def _closed_loop_worker(self, client: httpx.AsyncClient, measure_from: float, stop_at: float):
+        while (now := time.perf_counter()) < stop_at:
+            await self._execute(client, self._next_operation(), record=now >= measure_from, intended_start=now)
+
+    async def _open_loop(self, client: httpx.AsyncClient, measure_from: float, stop_at: float):
+        queue: asyncio.Queue = asyncio.Queue()
+        interval = 1 / self.config.rate
+
+        async def worker():
+            while True:
+                intended_start = await queue.get()
+                if intended_start is None:
+                    return
+                await self._execute(
+                    client, self._next_operation(), record=intended_start >= measure_from, intended_start=intended_start
+                )
+
+        workers = [asyncio.create_task(worker()) for _ in range(self.config.concurrency)]
+        next_start = time.perf_counter()
+        while next_start < stop_at:
+            await asyncio.sleep(max(next_start - time.perf_counter(), 0))
+            queue.put_nowait(next_start)
+            next_start += interval
+        for _ in workers:
+            queue.put_nowait(None)
+        await asyncio.gather(*workers)
+
+    async def run(self) -> List[Dict]:
+        limits = httpx.Limits(max_connections=self.config.concurrency, max_keepalive_connections=self.config.concurrency)
+        async with httpx.AsyncClient(
+            base_url=self.config.base_url, limits=limits, timeout=self.config.timeout_seconds
+        ) as client:
+            started = time.perf_counter()
+            measure_from = started + self.config.warmup_seconds
+            stop_at = measure_from + self.config.duration_seconds
+
+            if self.config.rate:
+                await self._open_loop(client, measure_from, stop_at)
+            else:
+                await asyncio.gather(
+                    *(self._closed_loop_worker(client, measure_from, stop_at) for _ in range(self.config.concurrency))
+                )
+            self.elapsed_seconds = max(time.perf_counter() - measure_from, 1e-9)
+
+        return self.report()
+
+    def report(self) -> List[Dict]:
+        summaries = [stats.summary(self.elapsed_seconds) for stats in self.stats.values()]
+        total = OperationStats("TOTAL")
+        for stats in self.stats.values():
+            total.latencies.extend(stats.latencies)
+            total.http_errors += stats.http_errors
+            total.graphql_errors += stats.graphql_errors
+            total.transport_errors += stats.transport_errors
+        return summaries + [total.summary(self.elapsed_seconds)]
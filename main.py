@@ -1,19 +1,42 @@
+# Premier import : le chronomètre de démarrage couvre les imports suivants
+from app.core.startup import startup_timer
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from strawberry.fastapi import GraphQLRouter
 from app.core.config import settings
+from app.core.json import AppJSONResponse
+from app.core.instrumentation import instrument_application
+from app.core.profiling import request_profiler
 from app.api.graphql import schema
-from infrastructure.database.session import init_db
+from app.api.persisted_queries import PersistedQueryNotFound, PersistedQueryStore, persisted_query_not_found_handler
+from app.api.response_cache import response_cache
+from app.api.router import AppGraphQLRouter
+from app.middleware.profiling import ProfilingMiddleware
+from app.middleware.response_cache import ResponseCacheMiddleware
+from app.middleware.server_timing import ServerTimingMiddleware
+from interfaces.api.diagnostics import router as diagnostics_router
+from interfaces.api.metrics import router as metrics_router
+from interfaces.api.profiles import router as profiles_router
+from infrastructure.database.schema import prepare_database
+from infrastructure.database.session import dispose_engines, start_pool_maintenance
+from infrastructure.tracing import tracer
+
+# Instrumentation des couches (avant toute requête)
+if settings.METRICS_ENABLED or settings.TRACING_ENABLED:
+    instrument_application()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan events pour initialiser la base de données."""
     # Startup
-    await init_db()
+    with startup_timer.phase("database"):
+        await prepare_database(settings.DB_STARTUP_MODE)
+    start_pool_maintenance()
+    startup_timer.ready()
     yield
     # Shutdown
-    pass
+    await dispose_engines()
+    tracer.shutdown()
 
 
 app = FastAPI(
@@ -21,11 +44,45 @@ app = FastAPI(
     version=settings.VERSION,
     description="FastAPI with DDD Architecture - GraphQL API",
     lifespan=lifespan,
+    default_response_class=AppJSONResponse,
 )
 
 # GraphQL router
-graphql_app = GraphQLRouter(schema)
+persisted_queries = PersistedQueryStore(settings.APQ_CACHE_SIZE) if settings.APQ_ENABLED else None
+graphql_app = AppGraphQLRouter(schema, persisted_queries=persisted_queries)
 app.include_router(graphql_app, prefix="/graphql")
+app.add_exception_handler(PersistedQueryNotFound, persisted_query_not_found_handler)
+
+# Cache des réponses de lecture (ETag / 304)
+if response_cache is not None:
+    app.add_middleware(
+        ResponseCacheMiddleware,
+        cache=response_cache,
+        persisted_queries=persisted_queries,
+        max_batch_operations=settings.GRAPHQL_BATCH_MAX_OPERATIONS,
+    )
+
+# Décomposition des temps de réponse GraphQL (en-tête Server-Timing)
+if settings.SERVER_TIMING_ENABLED:
+    app.add_middleware(ServerTimingMiddleware, path_prefix="/graphql")
+
+# Profilage à la demande (aucun middleware installé si désactivé)
+if request_profiler is not None:
+    app.add_middleware(
+        ProfilingMiddleware,
+        profiler=request_profiler,
+        token=settings.PROFILING_TOKEN,
+        sample_rate=settings.PROFILING_SAMPLE_RATE,
+    )
+    app.include_router(profiles_router)
+
+# Diagnostics (pools de connexions, requêtes SQL, démarrage), protégés par jeton
+if settings.DIAGNOSTICS_ENABLED:
+    app.include_router(diagnostics_router)
+
+# Métriques Prometheus
+if settings.METRICS_ENABLED:
+    app.include_router(metrics_router)
 
 
 @app.get("/")
@@ -40,3 +97,6 @@ async def root():
 @app.get("/health")
 async def health():
     return {"status": "healthy"}
+
+
+startup_timer.record("imports", startup_timer.elapsed_ms())
@@ -0,0 +1,104 @@
+"""Serveur de production : python -m server.
+
+gunicorn supervise ``WEB_WORKERS`` workers uvicorn (un par CPU disponible
+par défaut), avec la boucle uvloop et le parseur HTTP httptools. Avec
+``WEB_PRELOAD``, l'application est importée une seule fois dans le
+processus maître avant le fork : les modules et le schéma GraphQL sont
+partagés en copie sur écriture entre les workers.
+
+Les moteurs SQLAlchemy sont créés à l'import, donc avant le fork : le hook
+``post_fork`` les réinitialise dans chaque worker pour qu'aucune connexion
+(socket) du maître ne soit partagée, et relance le thread d'export des spans.
+
+Les caches (réponses, APQ), les métriques et la diffusion des souscriptions
+restent propres à chaque worker ; seules les versions qui invalident le cache
+des réponses sont partagées (en base). Un abonné ne reçoit que les événements
+des mutations traitées par son worker, et /metrics ne décrit que le worker qui répond.
+
+Mesure du débit (même base, même jeu de données) :
+
+    python -m infrastructure.commands.generate_dataset --seed 1
+    uvicorn main:app --port 8000                     # référence : un worker
+    python -m server                                 # WEB_WORKERS workers
+    python -m loadtest --base-url http://localhost:8000 --mix read_heavy -c 64 -d 120 --output report.json
+
+Budget de connexions : chaque worker a son pool, soit au plus
+``WEB_WORKERS × (DB_POOL_SIZE + DB_MAX_OVERFLOW)`` connexions vers PostgreSQL.
+"""
+import os
+
+from gunicorn.app.base import BaseApplication
+from uvicorn_worker import UvicornWorker
+
+from app.core.config import settings
+
+
+class ProductionUvicornWorker(UvicornWorker):
+    """Worker uvicorn imposant uvloop et httptools (échec explicite s'ils manquent)."""
+
+    CONFIG_KWARGS = {"loop": "uvloop", "http": "httptools", "lifespan": "on"}
+
+
+def available_cpus() -> int:
+    """CPU utilisables par le processus (cpuset du conteneur inclus)."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def worker_count() -> int:
+    return settings.WEB_WORKERS if settings.WEB_WORKERS > 0 else available_cpus()
+
+
+def on_starting(server):
+    connections = server.cfg.workers * (settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW)
+    server.log.info("Starting %d workers (up to %d database connections)", server.cfg.workers, connections)
+
+
+def post_fork(server, worker):
+    """Dans chaque worker : pools de connexions et thread d'export propres au processus."""
+    from app.core.startup import startup_timer
+    from infrastructure.tracing import tracer
+    from infrastructure.database.session import reset_engines_after_fork
+
+    startup_timer.after_fork()
+    reset_engines_after_fork()
+    tracer.after_fork()
+
+
+class ProductionServer(BaseApplication):
+    """Application gunicorn configurée d'après les settings (sans fichier de configuration)."""
+
+    def __init__(self, options: dict):
+        self.options = options
+        super().__init__()
+
+    def load_config(self):
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+
+    def load(self):
+        from main import app
+
+        return app
+
+
+def main():
+    ProductionServer(
+        {
+            "bind": f"{settings.WEB_HOST}:{settings.WEB_PORT}",
+            "workers": worker_count(),
+            "worker_class": ProductionUvicornWorker,
+            "preload_app": settings.WEB_PRELOAD,
+            "on_starting": on_starting,
+            "post_fork": post_fork,
+            "timeout": settings.WEB_TIMEOUT,
+            "graceful_timeout": settings.WEB_GRACEFUL_TIMEOUT,
+            "keepalive": settings.WEB_KEEPALIVE,
+            "accesslog": "-" if settings.WEB_ACCESS_LOG else None,
+        }
+    ).run()
+
+
+if __name__ == "__main__":
+    main()
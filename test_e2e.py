@@ -1,7 +1,23 @@
+import hashlib
+import json
+import os
+from datetime import datetime, timezone
+import re
+import uuid
 import pytest
 import asyncio
 from httpx import AsyncClient, ASGITransport
-from main import app
+
+# Routes de diagnostic activées pour les tests (absentes par défaut), avant l'import de l'application
+os.environ.setdefault("DIAGNOSTICS_ENABLED", "true")
+os.environ.setdefault("DIAGNOSTICS_TOKEN", "test-diagnostics-token")
+DIAGNOSTICS_HEADERS = {"X-Diagnostics-Token": os.environ["DIAGNOSTICS_TOKEN"]}
+
+from main import app  # noqa: E402
+from app.api.graphql import schema  # noqa: E402
+from infrastructure.commands.rebuild_client_quote_summary import rebuild  # noqa: E402
+from infrastructure.events.broadcaster import broadcaster  # noqa: E402
+from infrastructure.events.publisher import project_channel, quote_status_channel  # noqa: E402
 
 
 @pytest.fixture(scope="session")
@@ -163,3 +179,447 @@ async def test_graphql_hello(client):
     data = response.json()
     assert "data" in data
     assert data["data"]["hello"] == "Hello from GraphQL!"
+
+
+@pytest.mark.asyncio
+async def test_pool_diagnostics(client):
+    """Test E2E: métriques du pool de connexions."""
+    response = await client.get("/diagnostics/pool", headers=DIAGNOSTICS_HEADERS)
+    assert response.status_code == 200
+    primary = response.json()["primary"]
+    assert primary["size"] >= 0
+    assert "wait_seconds" in primary
+    assert primary["wait_seconds"]["buckets"]["+Inf"] == primary["wait_seconds"]["count"]
+
+
+@pytest.mark.asyncio
+async def test_query_statistics(client):
+    """Test E2E: agrégats des requêtes SQL, réservés aux détenteurs du jeton."""
+    assert (await client.get("/diagnostics/queries")).status_code == 403
+    assert (await client.delete("/diagnostics/queries", headers={"X-Diagnostics-Token": "wrong"})).status_code == 403
+
+    response = await client.get("/diagnostics/queries", params={"limit": 10}, headers=DIAGNOSTICS_HEADERS)
+    assert response.status_code == 200
+    data = response.json()
+    assert "slow_query_threshold_ms" in data
+    assert len(data["statements"]) <= 10
+
+    reset_response = await client.delete("/diagnostics/queries", headers=DIAGNOSTICS_HEADERS)
+    assert reset_response.status_code == 204
+
+
+@pytest.mark.asyncio
+async def test_startup_diagnostics(client):
+    """Test E2E: durées du démarrage du processus."""
+    response = await client.get("/diagnostics/startup", headers=DIAGNOSTICS_HEADERS)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["imports_ms"] > 0
+    assert "ready_ms" in data
+
+
+@pytest.mark.asyncio
+async def test_prometheus_metrics(client):
+    """Test E2E: export Prometheus des latences par couche."""
+    await client.post("/graphql", json={"query": "query { hello }"})
+
+    response = await client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert 'app_layer_duration_seconds_count{layer="graphql",operation="Query.hello"}' in body
+    assert "db_pool_checked_out" in body
+
+
+@pytest.mark.asyncio
+async def test_graphql_server_timing(client):
+    """Test E2E: en-tête Server-Timing sur les réponses GraphQL."""
+    # Document propre au test : une réponse servie par le cache n'a ni parse ni execute
+    response = await client.post("/graphql", json={"query": "query ServerTiming { hello }"})
+    assert response.status_code == 200
+    server_timing = response.headers["server-timing"]
+    for phase in ("parse", "validate", "execute", "serialize", "db", "total"):
+        assert f"{phase};dur=" in server_timing
+
+
+@pytest.mark.asyncio
+async def test_graphql_persisted_query(client):
+    """Test E2E: requête persistée (APQ) enregistrée puis rejouée par empreinte."""
+    query = "query { hello }"
+    extensions = {"persistedQuery": {"version": 1, "sha256Hash": hashlib.sha256(query.encode()).hexdigest()}}
+
+    miss_response = await client.post("/graphql", json={"extensions": extensions})
+    assert miss_response.status_code == 200
+    assert miss_response.json()["errors"][0]["message"] == "PersistedQueryNotFound"
+
+    register_response = await client.post("/graphql", json={"query": query, "extensions": extensions})
+    assert register_response.json()["data"]["hello"] == "Hello from GraphQL!"
+
+    hit_response = await client.post("/graphql", json={"extensions": extensions})
+    assert hit_response.json()["data"]["hello"] == "Hello from GraphQL!"
+
+    mismatch_response = await client.post("/graphql", json={"query": "query { __typename }", "extensions": extensions})
+    assert mismatch_response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_graphql_query_cost_limit(client):
+    """Test E2E: coût renvoyé dans les extensions, document trop coûteux rejeté avant exécution."""
+    response = await client.post("/graphql", json={"query": "query { clients(limit: 5) { id } }"})
+    assert response.json()["extensions"]["cost"]["requested"] == 10
+
+    response = await client.post(
+        "/graphql",
+        json={"query": "query($limit: Int!) { clients(limit: $limit) { id } }", "variables": {"limit": 1000000}},
+    )
+    data = response.json()
+    assert data["data"] is None
+    assert data["errors"][0]["extensions"]["code"] == "QUERY_TOO_COSTLY"
+
+    # Opérations d'un lot exécutées ensemble : chacune garde son coût et son résultat
+    response = await client.post(
+        "/graphql",
+        json=[
+            {"query": "query { clients(limit: 1000000) { id } }"},
+            {"query": "query { clients(limit: 5) { id } }"},
+        ],
+    )
+    too_costly, allowed = response.json()
+    assert too_costly["errors"][0]["extensions"]["code"] == "QUERY_TOO_COSTLY"
+    assert too_costly["extensions"]["cost"]["requested"] == 2000000
+    assert "errors" not in allowed and allowed["extensions"]["cost"]["requested"] == 10
+
+
+@pytest.mark.asyncio
+async def test_graphql_response_cache_etag(client):
+    """Test E2E: réponse de lecture servie avec un ETag, 304 si inchangée."""
+    query = {"query": "query { hello }"}
+    first_response = await client.post("/graphql", json=query)
+    etag = first_response.headers["etag"]
+
+    cached_response = await client.post("/graphql", json=query, headers={"If-None-Match": etag})
+    assert cached_response.status_code == 304
+    assert cached_response.headers["etag"] == etag
+
+
+@pytest.mark.asyncio
+async def test_graphql_batched_operations(client):
+    """Test E2E: plusieurs opérations dans un seul POST, réponses dans l'ordre."""
+    response = await client.post(
+        "/graphql",
+        json=[
+            {"query": "query First { hello }"},
+            {"query": "query Second { __typename }"},
+        ],
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data[0]["data"]["hello"] == "Hello from GraphQL!"
+    assert data[1]["data"]["__typename"] == "Query"
+
+    # Cache par opération : le lot rejoué est servi depuis le cache ; dans un lot
+    # mixte, seule l'opération absente du cache est exécutée
+    replayed = await client.post(
+        "/graphql",
+        json=[
+            {"query": "query First { hello }"},
+            {"query": "query Second { __typename }"},
+        ],
+    )
+    assert replayed.headers["x-cache"] == "HIT"
+    assert replayed.json() == data
+
+    mixed = await client.post(
+        "/graphql",
+        json=[
+            {"query": "query Second { __typename }"},
+            {"query": "query Third { hello }"},
+        ],
+    )
+    assert mixed.headers["x-cache"] == "MISS"
+    assert mixed.json()[0] == data[1]
+    assert mixed.json()[1]["data"]["hello"] == "Hello from GraphQL!"
+
+    single = await client.post("/graphql", json={"query": "query Third { hello }"})
+    assert single.headers["x-cache"] == "HIT"
+
+
+async def _graphql(client, query, variables=None):
+    response = await client.post("/graphql", json={"query": query, "variables": variables or {}})
+    data = response.json()
+    assert "errors" not in data, data
+    return data["data"]
+
+
+async def _create_client(client, name):
+    created = await _graphql(
+        client,
+        """mutation($input: ClientInput!) { createClient(clientInput: $input) { id } }""",
+        {
+            "input": {
+                "name": name,
+                "contactName": "Sam Doe",
+                "email": f"client-{uuid.uuid4().hex}@example.com",
+                "phone": "+33 1 00 00 00 00",
+                "address": {"street": "1 Rue Test", "city": "Paris", "zipCode": "75001", "country": "France"},
+            }
+        },
+    )
+    return created["createClient"]["id"]
+
+
+async def _create_quote(client, client_id, title, items=None):
+    created = await _graphql(
+        client,
+        """mutation($input: QuoteInput!) {
+            createQuote(quoteInput: $input) { id totalHt totalTtc items { id description quantity } }
+        }""",
+        {
+            "input": {
+                "clientId": client_id,
+                "title": title,
+                "validUntil": "2099-12-31",
+                "items": items or [{"description": "Design", "unitPrice": "100.00", "quantity": "2"}],
+            }
+        },
+    )
+    return created["createQuote"]
+
+
+async def _first_event(subscription_query, variables, channel, trigger):
+    """Souscrit, déclenche la mutation une fois l'abonné enregistré, renvoie le premier événement."""
+    subscription = await schema.subscribe(subscription_query, variable_values=variables)
+    next_result = asyncio.ensure_future(subscription.__anext__())
+    try:
+        for _ in range(100):
+            if broadcaster.subscriber_count(channel):
+                break
+            await asyncio.sleep(0.01)
+        await trigger()
+        result = await asyncio.wait_for(next_result, timeout=5)
+    finally:
+        next_result.cancel()
+        # Attendre la fin de __anext__ annulé : aclose() échoue sur un générateur en cours
+        await asyncio.gather(next_result, return_exceptions=True)
+        await subscription.aclose()
+    assert result.errors is None
+    return result.data
+
+
+@pytest.mark.asyncio
+async def test_graphql_subscriptions_receive_domain_events(client):
+    """Test E2E: changeQuoteStatus et updateProject diffusés aux abonnés après commit."""
+    client_id = await _create_client(client, "Subscription Corp")
+    quote_id = (await _create_quote(client, client_id, "Subscription quote"))["id"]
+
+    data = await _first_event(
+        "subscription($clientId: String!) { quoteStatusChanged(clientId: $clientId) { quoteId status } }",
+        {"clientId": client_id},
+        quote_status_channel(uuid.UUID(client_id)),
+        lambda: _graphql(
+            client,
+            "mutation($id: String!) { changeQuoteStatus(quoteId: $id, newStatus: SENT) { id } }",
+            {"id": quote_id},
+        ),
+    )
+    assert data["quoteStatusChanged"] == {"quoteId": quote_id, "status": "SENT"}
+
+    project = await _graphql(
+        client,
+        """mutation($input: ProjectInput!) { createProject(projectInput: $input) { id } }""",
+        {
+            "input": {
+                "clientId": client_id,
+                "name": "Subscription project",
+                "description": "Project watched by a subscription",
+                "status": "PLANNED",
+                "startDate": "2099-01-01",
+            }
+        },
+    )
+    project_id = project["createProject"]["id"]
+
+    data = await _first_event(
+        "subscription($id: String!) { projectUpdated(id: $id) { projectId name } }",
+        {"id": project_id},
+        project_channel(uuid.UUID(project_id)),
+        lambda: _graphql(
+            client,
+            "mutation($id: String!) { updateProject(id: $id, projectInput: {name: \"Renamed\"}) { id } }",
+            {"id": project_id},
+        ),
+    )
+    assert data["projectUpdated"] == {"projectId": project_id, "name": "Renamed"}
+
+
+def test_fingerprint_collapses_typed_in_lists():
+    """Les listes IN typées (asyncpg) partagent une seule empreinte, quelle que soit leur longueur."""
+    from infrastructure.database.query_log import fingerprint
+
+    two = fingerprint("SELECT id FROM clients WHERE id IN ($1::UUID, $2::UUID)")
+    three = fingerprint("SELECT id FROM clients WHERE id IN ($1::UUID, $2::UUID, $3::UUID)")
+    assert two == three == "SELECT id FROM clients WHERE id IN (...)"
+
+
+@pytest.mark.asyncio
+async def test_graphql_edit_quote_items(client):
+    """Test E2E: ajout, modification et suppression d'items en une mutation, totaux recalculés."""
+    client_id = await _create_client(client, "Edit Items Corp")
+    quote = await _create_quote(
+        client,
+        client_id,
+        "Edited quote",
+        [
+            {"description": "Design", "unitPrice": "100.00", "quantity": "2"},
+            {"description": "Hosting", "unitPrice": "50.00", "quantity": "1"},
+        ],
+    )
+    design, hosting = sorted(quote["items"], key=lambda item: item["description"])
+
+    data = await _graphql(
+        client,
+        """mutation($id: String!, $add: [AddQuoteItemInput!], $update: [UpdateQuoteItemInput!], $remove: [String!]) {
+            editQuoteItems(quoteId: $id, add: $add, update: $update, remove: $remove) {
+                totalHt items { description quantity }
+            }
+        }""",
+        {
+            "id": quote["id"],
+            "add": [{"description": "Support", "unitPrice": "10.00", "quantity": "3"}],
+            "update": [{"id": design["id"], "quantity": "4"}],
+            "remove": [hosting["id"]],
+        },
+    )
+    edited = data["editQuoteItems"]
+    assert sorted(item["description"] for item in edited["items"]) == ["Design", "Support"]
+    assert float(edited["totalHt"]) == 430.0
+
+
+@pytest.mark.asyncio
+async def test_client_quote_summary_projection_and_rebuild(client):
+    """Test E2E: résumé client tenu à jour par les écritures de devis, identique après reconstruction."""
+    client_id = await _create_client(client, "Summary Corp")
+    accepted = await _create_quote(client, client_id, "Accepted quote")
+    pending = await _create_quote(
+        client, client_id, "Pending quote", [{"description": "Audit", "unitPrice": "50.00", "quantity": "1"}]
+    )
+    for status in ("SENT", "ACCEPTED"):
+        changed = await _graphql(
+            client,
+            """mutation($id: String!, $status: QuoteStatusEnum!) {
+                changeQuoteStatus(quoteId: $id, newStatus: $status) { status }
+            }""",
+            {"id": accepted["id"], "status": status},
+        )
+        assert changed["changeQuoteStatus"]["status"] == status
+
+    summary_query = """query($id: String!) {
+        client(id: $id) { quoteSummary { currency quoteCount quotedAmount acceptedAmount pendingAmount } }
+    }"""
+    [summary] = (await _graphql(client, summary_query, {"id": client_id}))["client"]["quoteSummary"]
+    assert summary["quoteCount"] == 2
+    assert float(summary["quotedAmount"]) == float(accepted["totalTtc"]) + float(pending["totalTtc"])
+    assert float(summary["acceptedAmount"]) == float(accepted["totalTtc"])
+    assert float(summary["pendingAmount"]) == float(pending["totalTtc"])
+
+    await rebuild()
+    # Document distinct : pas de réponse servie par le cache
+    rebuilt_query = summary_query.replace("currency quoteCount", "quoteCount currency")
+    [rebuilt] = (await _graphql(client, rebuilt_query, {"id": client_id}))["client"]["quoteSummary"]
+    assert rebuilt == summary
+
+
+def _multipart_payloads(response):
+    """Parties JSON d'une réponse multipart/mixed (boundary "-")."""
+    return [json.loads(part) for part in re.findall(r"\r\n\r\n(.*?)\r\n---", response.text, re.S)]
+
+
+@pytest.mark.asyncio
+async def test_graphql_incremental_delivery(client):
+    """Test E2E: @stream et @defer livrés en multipart/mixed, première partie puis incréments."""
+    client_id = await _create_client(client, "Streaming Corp")
+    quote_ids = {(await _create_quote(client, client_id, f"Streamed quote {index}"))["id"] for index in range(3)}
+
+    response = await client.post(
+        "/graphql",
+        json={
+            "query": """query($clientId: String!) {
+                quotes(filter: {clientId: $clientId}) @stream(initialCount: 1) { id }
+            }""",
+            "variables": {"clientId": client_id},
+        },
+        headers={"Accept": "multipart/mixed"},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("multipart/mixed")
+    initial, *subsequent = _multipart_payloads(response)
+    assert len(initial["data"]["quotes"]) == 1 and initial["hasNext"] is True
+    assert subsequent[-1]["hasNext"] is False
+    streamed = [item["id"] for part in subsequent for increment in part.get("incremental", []) for item in increment["items"]]
+    assert {initial["data"]["quotes"][0]["id"], *streamed} == quote_ids
+
+    response = await client.post(
+        "/graphql",
+        json={"query": "query { __typename ... @defer(label: \"greeting\") { hello } }"},
+        headers={"Accept": "multipart/mixed"},
+    )
+    initial, *subsequent = _multipart_payloads(response)
+    assert initial["data"] == {"__typename": "Query"}
+    [deferred] = [increment for part in subsequent for increment in part.get("incremental", [])]
+    assert deferred["data"] == {"hello": "Hello from GraphQL!"}
+
+
+@pytest.mark.asyncio
+async def test_graphql_quotes_filter_and_sort(client):
+    """Test E2E: filtre et tri typés sur quotes ; filtre invalide sans erreur brute."""
+    client_id = await _create_client(client, "Filter Corp")
+    for title, unit_price in (("Small", "10.00"), ("Large", "300.00"), ("Medium", "100.00")):
+        await _create_quote(client, client_id, title, [{"description": title, "unitPrice": unit_price, "quantity": "1"}])
+
+    query = """query($filter: QuoteFilterInput, $sort: QuoteSortInput) {
+        quotes(filter: $filter, sort: $sort) { title }
+    }"""
+    data = await _graphql(
+        client,
+        query,
+        {
+            "filter": {"clientId": client_id, "status": ["DRAFT"], "minTotalTtc": "50"},
+            "sort": {"field": "TOTAL_TTC", "direction": "ASC"},
+        },
+    )
+    assert [quote["title"] for quote in data["quotes"]] == ["Medium", "Large"]
+
+    data = await _graphql(client, query, {"filter": {"clientId": client_id}, "sort": {"field": "TITLE", "direction": "DESC"}})
+    assert [quote["title"] for quote in data["quotes"]] == ["Small", "Medium", "Large"]
+
+    for invalid_filter in ({"clientId": "nope"}, {"minTotalTtc": "100", "maxTotalTtc": "10"}):
+        data = await _graphql(client, query, {"filter": invalid_filter})
+        assert data["quotes"] == []
+
+
+@pytest.mark.asyncio
+async def test_graphql_quote_stats(client):
+    """Test E2E: statistiques regroupées par statut et par mois (UTC), filtrées par client."""
+    client_id = await _create_client(client, "Stats Corp")
+    sent = await _create_quote(client, client_id, "Sent quote")
+    draft = await _create_quote(client, client_id, "Draft quote")
+    await _graphql(
+        client,
+        "mutation($id: String!) { changeQuoteStatus(quoteId: $id, newStatus: SENT) { id } }",
+        {"id": sent["id"]},
+    )
+
+    data = await _graphql(
+        client,
+        """query($filter: QuoteFilterInput) {
+            quoteStats(groupBy: [STATUS, MONTH], filter: $filter) { status month currency count totalTtc }
+        }""",
+        {"filter": {"clientId": client_id}},
+    )
+    month = datetime.now(timezone.utc).date().replace(day=1).isoformat()
+    stats = {row["status"]: row for row in data["quoteStats"]}
+    assert set(stats) == {"DRAFT", "SENT"}
+    for status, quote in (("DRAFT", draft), ("SENT", sent)):
+        assert stats[status]["month"] == month
+        assert stats[status]["count"] == 1
+        assert float(stats[status]["totalTtc"]) == float(quote["totalTtc"])